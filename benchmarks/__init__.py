@@ -0,0 +1,4 @@
+"""Headless benchmarks for Dictate.
+
+Run from the repository root with ``python -m benchmarks.<name>``.
+"""
@@ -0,0 +1,80 @@
+"""Benchmark: hotkey-to-first-sample latency, input stream opened per recording vs always on.
+
+By default runs against a simulated device that takes ``--open-ms`` to open and
+``--start-ms`` to deliver its first block, roughly what CoreAudio devices cost;
+``--device`` measures the real default microphone instead.
+
+Usage:
+    python -m benchmarks.bench_capture_start --trials 20
+    python -m benchmarks.bench_capture_start --device --preroll-ms 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from dictate.audio.base import AudioSource
+from dictate.audio.recorder import AudioRecorder
+from dictate.audio.simulated import SimulatedSource
+
+
+def _measure(recorder: AudioRecorder, trials: int, gap_seconds: float) -> tuple[np.ndarray, int]:
+    """Start/stop ``trials`` times; returns start latencies and the first recording's pre-roll."""
+    latencies = np.empty(trials)
+    preroll = 0
+    for i in range(trials):
+        time.sleep(gap_seconds)  # time between dictations, while the pre-roll fills
+        recorder.start()
+        if i == 0:
+            preroll = len(recorder.read())
+        while recorder.start_latency is None:
+            time.sleep(0.0005)
+        latencies[i] = recorder.start_latency
+        recorder.stop()
+    return latencies, preroll
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--preroll-ms", type=float, default=500.0)
+    parser.add_argument("--open-ms", type=float, default=100.0, help="simulated device open")
+    parser.add_argument("--start-ms", type=float, default=20.0, help="simulated first block")
+    parser.add_argument("--gap-ms", type=float, default=600.0, help="pause between recordings")
+    parser.add_argument("--device", action="store_true", help="use the real default microphone")
+    args = parser.parse_args()
+
+    if args.device:
+        from dictate.audio.device import SoundDeviceSource
+
+        source: AudioSource = SoundDeviceSource()
+    else:
+        source = SimulatedSource(
+            open_seconds=args.open_ms / 1000, start_seconds=args.start_ms / 1000
+        )
+
+    print(f"{args.trials} recordings @ {args.sample_rate} Hz, {args.preroll_ms:g} ms pre-roll")
+    print(f"{'mode':<10} {'median ms':>10} {'p95 ms':>9} {'max ms':>9} {'pre-roll ms':>12}")
+    for mode, always_on in (("per-start", False), ("always-on", True)):
+        recorder = AudioRecorder(
+            sample_rate=args.sample_rate,
+            source=source,
+            always_on=always_on,
+            preroll_seconds=args.preroll_ms / 1000,
+        )
+        recorder.open()
+        latencies, preroll = _measure(recorder, args.trials, args.gap_ms / 1000)
+        recorder.close()
+        print(
+            f"{mode:<10} {np.median(latencies) * 1e3:>10.2f} "
+            f"{np.percentile(latencies, 95) * 1e3:>9.2f} {latencies.max() * 1e3:>9.2f} "
+            f"{preroll / args.sample_rate * 1e3:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Microbenchmark: transcript cleanup engine vs the chained re.sub implementation it replaced.
+
+Times both on long transcripts like the ones batch jobs produce, checks that their
+outputs are identical, and reports words/second and the speedup. Two corpora are used:
+"dense" is unpunctuated dictation with a filler or conjunction every few words (the
+worst case for the engine, which only does work at those spots), "prose" is punctuated
+Whisper-style output with occasional fillers.
+
+A second table grows the user dictionary with synthetic phrases and compares the
+engine's trie lookup with a single regex alternation of the same phrases.
+
+Usage:
+    python -m benchmarks.bench_cleanup
+    python -m benchmarks.bench_cleanup --words 10000,100000 --repeat 7
+    python -m benchmarks.bench_cleanup --dictionary-sizes 0,100,1000,10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import timeit
+from functools import partial
+
+from benchmarks.fakes import transcript_for
+from dictate.processing.cleanup import DEFAULT_DICTIONARY, CleanupEngine
+from dictate.processing.dictionary import DictionaryEntry
+
+_PROSE = (
+    "So I think we should move the meeting to Thursday, because the team is out on Friday.",
+    "The release can wait a day or two and nobody will notice.",
+    "Um, let me check the numbers again before we send it.",
+    "We shipped the new build last night, but the tests are still flaky.",
+    "Can you send me the report by the end of the week?",
+    "That sounds great!",
+    "I mean, it's basically done already.",
+)
+
+# The pre-engine RegexProcessor, kept verbatim as the baseline
+_FILLER_PATTERN = re.compile(
+    r"\bum\b|\buh\b|\buh huh\b|\bmm\b|\bhmm\b|\bmhm\b|\byou know\b|\bi mean\b|\bkind of\b"
+    r"|\bsort of\b|\bbasically\b|\bliterally\b|\bokay so\b|\byeah\b",
+    re.IGNORECASE,
+)
+_COMMA_BEFORE_CONJ = re.compile(
+    r"(?<=[a-z]{3})(\s+)(but|and|so|yet|or|because|since|although|though|while)\s",
+    re.IGNORECASE,
+)
+
+
+def chained_regex_cleanup(text: str) -> str:
+    if not text or not text.strip():
+        return ""
+    result = _FILLER_PATTERN.sub("", text)
+    result = re.sub(r"\s{2,}", " ", result).strip()
+    result = re.sub(r"(^[,\s]+|[,\s]+$)", "", result)
+    result = re.sub(r"\s*,\s*,\s*", ", ", result)
+    result = re.sub(r"^\s*,\s*", "", result)
+    result = _COMMA_BEFORE_CONJ.sub(r", \2 ", result)
+    result = re.sub(r"\s+,", ",", result)
+    result = re.sub(r",\s*,", ",", result)
+    result = re.sub(
+        r",\s+([A-Z])([a-z]+)(?!\s+[A-Z])",
+        lambda m: ", " + m.group(1).lower() + m.group(2),
+        result,
+    )
+    result = re.sub(r"([.!?])\s+([a-z])", lambda m: m.group(1) + " " + m.group(2).upper(), result)
+    if result:
+        result = result[0].upper() + result[1:]
+    if result and result[-1] not in ".!?":
+        result += "."
+    return result
+
+
+def _prose(words: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    sentences: list[str] = []
+    count = 0
+    while count < words:
+        sentence = rng.choice(_PROSE)
+        sentences.append(sentence)
+        count += len(sentence.split())
+    return " ".join(sentences)
+
+
+def _synthetic_dictionary(size: int, seed: int = 0) -> list[DictionaryEntry]:
+    """Phrases of 1-3 made-up words that share first words, like a team glossary would."""
+    rng = random.Random(seed)
+    stems = [f"term{i}" for i in range(max(1, size // 4))]
+    entries: dict[str, DictionaryEntry] = {}
+    while len(entries) < size:
+        phrase = " ".join(rng.choice(stems) for _ in range(rng.randint(1, 3)))
+        entries.setdefault(phrase, DictionaryEntry(phrase, phrase.upper()))
+    return list(entries.values())
+
+
+def _alternation(entries: list[DictionaryEntry]) -> re.Pattern[str]:
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(e.phrase) for e in entries) + r")\b", re.IGNORECASE
+    )
+
+
+def _best_seconds(fn, text: str, repeat: int) -> float:
+    return min(timeit.repeat(lambda: fn(text), number=1, repeat=repeat))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", default="10000,50000", help="comma-separated transcript sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (best is kept)")
+    parser.add_argument(
+        "--dictionary-sizes",
+        default="0,100,1000,10000",
+        help="comma-separated user dictionary sizes for the scaling table",
+    )
+    args = parser.parse_args(argv)
+
+    engine = CleanupEngine()
+    print(
+        f"{'corpus':<7} {'words':>7} {'re.sub ms':>10} {'engine ms':>10} "
+        f"{'Mwords/s':>9} {'speedup':>8}"
+    )
+    for words in (int(w) for w in args.words.split(",")):
+        # transcript_for produces 2.5 words per second of speech
+        for corpus, text in (("dense", transcript_for(words / 2.5)), ("prose", _prose(words))):
+            if engine.clean(text) != chained_regex_cleanup(text):
+                raise SystemExit(f"Output mismatch on {corpus} corpus of {words} words")
+            baseline = _best_seconds(chained_regex_cleanup, text, args.repeat)
+            compiled = _best_seconds(engine.clean, text, args.repeat)
+            n = len(text.split())
+            print(
+                f"{corpus:<7} {n:>7} {baseline * 1000:>10.2f} {compiled * 1000:>10.2f} "
+                f"{n / compiled / 1e6:>9.2f} {baseline / compiled:>7.1f}x"
+            )
+
+    words = int(args.words.split(",")[0])
+    text = transcript_for(words / 2.5)
+    print(f"\n{'entries':>7} {'alternation ms':>15} {'engine ms':>10}  ({words} dense words)")
+    for size in (int(s) for s in args.dictionary_sizes.split(",")):
+        entries = _synthetic_dictionary(size) + list(DEFAULT_DICTIONARY)
+        pattern = _alternation(entries)
+        engine = CleanupEngine(entries)
+        alternation = _best_seconds(partial(pattern.sub, ""), text, args.repeat)
+        compiled = _best_seconds(engine.clean, text, args.repeat)
+        print(f"{size:>7} {alternation * 1000:>15.2f} {compiled * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
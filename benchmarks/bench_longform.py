@@ -0,0 +1,103 @@
+"""Benchmark: long-form decoding split at pauses across workers vs sequential decoding.
+
+Reports wall time, real-time factor (decode seconds per second of audio; lower is
+better) and speedup over the sequential baseline for each worker count.
+
+The default fake engine sleeps instead of decoding, so it shows the overhead and
+scaling of the chunking and stitching, assuming one free core per worker. Pass a
+real recording with ``--audio`` to time the local Whisper model: the one-worker row
+is then a plain faster-whisper decode of the whole file, and the other rows split it
+at VAD pauses and share one model between ``num_workers`` CTranslate2 workers.
+
+Usage:
+    python -m benchmarks.bench_longform
+    python -m benchmarks.bench_longform --seconds 600 --workers 1,2,4,8 --rtf 0.2
+    python -m benchmarks.bench_longform --audio meeting.wav --model small --workers 1,2,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.fakes import FakeASREngine, synthetic_speech
+from dictate.asr.longform import transcribe_long_form
+
+
+def synthetic_dictation(
+    seconds: float, sample_rate: int = 16000, seed: int = 0
+) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    """Sentences of 3-12 s of synthetic speech separated by pauses, and where each one is."""
+    rng = np.random.default_rng(seed)
+    pieces: list[np.ndarray] = []
+    speech: list[tuple[int, int]] = []
+    total = 0
+    while total < seconds * sample_rate:
+        sentence = synthetic_speech(rng.uniform(3.0, 12.0), sample_rate, seed=len(pieces))
+        pause = np.zeros(int(rng.uniform(0.3, 1.2) * sample_rate), dtype=np.float32)
+        speech.append((total, total + len(sentence)))
+        pieces += [sentence, pause]
+        total += len(sentence) + len(pause)
+    return np.concatenate(pieces), speech
+
+
+def _bench_fake(
+    args: argparse.Namespace, workers: list[int]
+) -> tuple[list[tuple[int, float]], float]:
+    audio, speech = synthetic_dictation(args.seconds)
+    engine = FakeASREngine(rtf=args.rtf)
+    results = []
+    for count in workers:
+        start = time.perf_counter()
+        list(transcribe_long_form(engine._decode, audio, workers=count, speech=speech))
+        results.append((count, time.perf_counter() - start))
+    return results, len(audio) / 16000
+
+
+def _bench_local(
+    args: argparse.Namespace, workers: list[int]
+) -> tuple[list[tuple[int, float]], float]:
+    from faster_whisper import decode_audio
+
+    from dictate.asr.whisper_local import WhisperLocalEngine
+
+    audio = decode_audio(args.audio, sampling_rate=16000)
+    results = []
+    for count in workers:
+        engine = WhisperLocalEngine(
+            model_size=args.model, parallel_workers=count, long_form_seconds=0.001
+        )
+        engine.ensure_loaded()
+        start = time.perf_counter()
+        engine.transcribe(audio)
+        results.append((count, time.perf_counter() - start))
+    return results, len(audio) / 16000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--seconds", type=float, default=300.0, help="Fake recording length")
+    parser.add_argument("--rtf", type=float, default=0.1, help="Fake engine real-time factor")
+    parser.add_argument("--audio", help="Real recording to decode with the local model")
+    parser.add_argument("--model", default="base", help="Whisper model for --audio")
+    args = parser.parse_args()
+
+    workers = sorted({int(w) for w in args.workers.split(",")} | {1})
+    bench = _bench_local if args.audio else _bench_fake
+    results, audio_seconds = bench(args, workers)
+
+    sequential = results[0][1]
+    print(f"{audio_seconds:.0f}s of audio")
+    print(f"{'workers':>8} {'wall s':>8} {'RTF':>7} {'speedup':>8}")
+    for count, elapsed in results:
+        print(
+            f"{count:>8} {elapsed:>8.2f} {elapsed / audio_seconds:>7.3f} "
+            f"{sequential / elapsed:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
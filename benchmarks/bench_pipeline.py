@@ -0,0 +1,190 @@
+"""End-to-end Pipeline benchmark with synthetic audio, no microphone or display needed.
+
+Drives Pipeline through its hotkey toggle with generated clips of several lengths,
+using a fake or real ASR engine, a real or passthrough text processor, and a no-op
+injector. Reports throughput, per-stage latency percentiles and peak memory, and can
+write a JSON report for diffing between releases. Each clip length runs in its own
+process so peak RSS numbers are independent.
+
+Usage:
+    python -m benchmarks.bench_pipeline --lengths 2,10,60 --runs 5
+    python -m benchmarks.bench_pipeline --engine local --model base --json report.json
+    python -m benchmarks.bench_pipeline --streaming --lengths 30
+    python -m benchmarks.bench_pipeline --cleanup-ms-per-word 5 --overlap-cleanup
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import threading
+import time
+
+import dictate
+from benchmarks.fakes import (
+    FakeASREngine,
+    NoopInjector,
+    PassthroughProcessor,
+    SlowProcessor,
+    SyntheticRecorder,
+    synthetic_speech,
+)
+from dictate.pipeline import Pipeline, PipelineState
+
+SCHEMA_VERSION = 1
+SAMPLE_RATE = 16000
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _build_engine(args: argparse.Namespace):
+    if args.engine == "local":
+        from dictate.asr.whisper_local import WhisperLocalEngine
+
+        return WhisperLocalEngine(model_size=args.model, language="en")
+    return FakeASREngine(rtf=args.rtf)
+
+
+def _build_processor(args: argparse.Namespace):
+    if args.processor == "passthrough":
+        processor = PassthroughProcessor()
+    else:
+        from dictate.config import Config
+        from dictate.processing.factory import create_text_processor
+
+        # No cache: every run must do the cleanup work it is timing
+        processor = create_text_processor(Config(text_processor=args.processor, text_cache_size=0))
+    if args.cleanup_ms_per_word:
+        processor = SlowProcessor(processor, args.cleanup_ms_per_word)
+    return processor
+
+
+def _run_case(args: argparse.Namespace, seconds: float, queue: multiprocessing.Queue) -> None:
+    realtime = args.realtime or args.streaming
+    audio = synthetic_speech(seconds, SAMPLE_RATE)
+    recorder = SyntheticRecorder(audio, SAMPLE_RATE, realtime=realtime)
+    engine = _build_engine(args)
+    injector = NoopInjector()
+    idle = threading.Event()
+
+    pipeline = Pipeline(
+        recorder=recorder,
+        asr_engine=engine,
+        text_processor=_build_processor(args),
+        on_state_change=lambda state: idle.set() if state is PipelineState.IDLE else None,
+        streaming_transcription=args.streaming,
+        trim_silence=args.trim,
+        injector=injector,
+        overlap_cleanup=args.overlap_cleanup,
+    )
+
+    def dictate_once() -> float:
+        idle.clear()
+        pipeline.toggle()  # start
+        if realtime:
+            time.sleep(seconds)
+        start = time.perf_counter()
+        pipeline.toggle()  # stop
+        idle.wait()
+        return time.perf_counter() - start
+
+    engine.ensure_loaded()
+    baseline_rss = _peak_rss_mb()
+    dictate_once()  # warm-up, not counted
+    pipeline.reset_latency_stats()
+
+    processing = [dictate_once() for _ in range(args.runs)]
+    busy = sum(processing)
+
+    queue.put({
+        "audio_seconds": seconds,
+        "runs": args.runs,
+        "throughput_utterances_per_s": args.runs / busy if busy else None,
+        "throughput_audio_x_realtime": seconds * args.runs / busy if busy else None,
+        "stages_ms": {
+            stage: {
+                "count": s.count,
+                "p50": s.p50 * 1000,
+                "p95": s.p95 * 1000,
+                "p99": s.p99 * 1000,
+            }
+            for stage, s in pipeline.latency_stats().items()
+        },
+        "injected": len(injector.texts) - 1,
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    })
+
+
+def _print_table(report: dict) -> None:
+    for case in report["cases"]:
+        stages = case["stages_ms"]
+        print(
+            f"\n{case['audio_seconds']:g}s audio × {case['runs']} runs — "
+            f"{case['throughput_utterances_per_s']:.2f} utt/s, "
+            f"{case['throughput_audio_x_realtime']:.1f}× realtime, "
+            f"peak RSS {case['peak_rss_mb']:.0f} MB"
+        )
+        print(f"  {'stage':<12} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for stage, s in stages.items():
+            print(f"  {stage:<12} {s['p50']:>9.1f} {s['p95']:>9.1f} {s['p99']:>9.1f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", default="2,10,60", help="comma-separated clip lengths (s)")
+    parser.add_argument("--runs", type=int, default=5, help="measured dictations per length")
+    parser.add_argument("--engine", choices=("fake", "local"), default="fake")
+    parser.add_argument("--model", default="base", help="Whisper model for --engine local")
+    parser.add_argument("--rtf", type=float, default=0.1, help="fake engine decode s per audio s")
+    parser.add_argument("--processor", choices=("regex", "ollama", "passthrough"), default="regex")
+    parser.add_argument(
+        "--cleanup-ms-per-word", type=float, default=0.0, help="extra cleanup latency (LLM-like)"
+    )
+    parser.add_argument(
+        "--overlap-cleanup", action="store_true", help="clean up sentences while decoding"
+    )
+    parser.add_argument("--streaming", action="store_true", help="streaming transcription")
+    parser.add_argument("--realtime", action="store_true", help="record in real time")
+    parser.add_argument("--no-trim", dest="trim", action="store_false", help="skip silence trim")
+    parser.add_argument("--json", metavar="PATH", help="write a machine-readable report")
+    args = parser.parse_args(argv)
+
+    ctx = multiprocessing.get_context("spawn")
+    cases = []
+    for seconds in (float(x) for x in args.lengths.split(",")):
+        queue: multiprocessing.Queue = ctx.Queue()
+        proc = ctx.Process(target=_run_case, args=(args, seconds, queue))
+        proc.start()
+        cases.append(queue.get())
+        proc.join()
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "dictate_version": dictate.__version__,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "settings": vars(args),
+        "cases": cases,
+    }
+    _print_table(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
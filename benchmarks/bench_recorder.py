@@ -0,0 +1,109 @@
+"""Benchmark: AudioRecorder capture storage, list-of-copies vs preallocated AudioBuffer.
+
+Simulates the PortAudio callback for a long dictation without an audio device and
+reports per-callback time and the peak RSS of each strategy. The worst callback is
+what matters for dropouts: it is compared with one block's real-time budget, and the
+run fails if the buffer ever goes over it. Each strategy runs in
+its own process so the peak RSS numbers do not contaminate each other.
+
+Usage:
+    python -m benchmarks.bench_recorder --minutes 10 --blocksize 512
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+
+import numpy as np
+
+from dictate.audio.buffer import AudioBuffer
+
+
+def _rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run(
+    strategy: str, minutes: float, sample_rate: int, blocksize: int, queue: multiprocessing.Queue
+) -> None:
+    n_callbacks = int(minutes * 60 * sample_rate / blocksize)
+    # PortAudio hands the callback the same (frames, channels) buffer each time
+    indata = np.random.default_rng(0).uniform(-1, 1, (blocksize, 1)).astype(np.float32)
+    timings = np.empty(n_callbacks, dtype=np.float64)
+    baseline_rss = _rss_mb()
+
+    if strategy == "list":
+        chunks: list[np.ndarray] = []
+        for i in range(n_callbacks):
+            t0 = time.perf_counter()
+            chunks.append(indata.copy())
+            timings[i] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        audio = np.concatenate(chunks).flatten()
+        stop_seconds = time.perf_counter() - t0
+    else:
+        buffer = AudioBuffer(block_frames=sample_rate * 30)
+        for i in range(n_callbacks):
+            t0 = time.perf_counter()
+            buffer.append(indata)
+            timings[i] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        audio = buffer.view()
+        stop_seconds = time.perf_counter() - t0
+
+    assert audio.shape == (n_callbacks * blocksize,)
+    queue.put({
+        "strategy": strategy,
+        "callbacks": n_callbacks,
+        "callback_mean_us": float(timings.mean() * 1e6),
+        "callback_p99_us": float(np.percentile(timings, 99) * 1e6),
+        "callback_max_us": float(timings.max() * 1e6),
+        "stop_ms": stop_seconds * 1e3,
+        "peak_rss_delta_mb": _rss_mb() - baseline_rss,
+        "audio_mb": audio.nbytes / (1024 * 1024),
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10.0, help="simulated recording length")
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--blocksize", type=int, default=512, help="frames per callback")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for strategy in ("list", "buffer"):
+        queue: multiprocessing.Queue = ctx.Queue()
+        proc = ctx.Process(
+            target=_run, args=(strategy, args.minutes, args.sample_rate, args.blocksize, queue)
+        )
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+
+    print(f"{args.minutes:g} min @ {args.sample_rate} Hz, {args.blocksize} frames/callback")
+    print(
+        f"{'strategy':<8} {'mean µs':>9} {'p99 µs':>9} {'max µs':>9} "
+        f"{'stop ms':>9} {'peak RSS MB':>12}"
+    )
+    budget_us = args.blocksize / args.sample_rate * 1e6
+    for r in results:
+        print(
+            f"{r['strategy']:<8} {r['callback_mean_us']:>9.2f} {r['callback_p99_us']:>9.2f} "
+            f"{r['callback_max_us']:>9.1f} {r['stop_ms']:>9.2f} {r['peak_rss_delta_mb']:>12.1f}"
+        )
+    print(f"callback budget: {budget_us:.0f} µs")
+    if results[-1]["callback_max_us"] > budget_us:
+        sys.exit("AudioBuffer.append went over the callback budget")
+
+
+if __name__ == "__main__":
+    main()
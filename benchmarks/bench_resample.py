@@ -0,0 +1,101 @@
+"""Benchmark: converting native-rate device audio to 16 kHz mono, ours vs scipy.signal.
+
+For each device rate, converts a minute of ``--channels``-channel noise three ways and
+reports the cost per minute of audio:
+
+- ``scipy``: downmix, then ``scipy.signal.resample_poly`` on the whole recording at stop
+- ``whole``: the same with ``Resampler`` (process + flush in one call)
+- ``stream``: ``Resampler`` fed one callback block at a time, as the recorder does,
+  with the per-callback time against the block's real-time budget
+
+and the largest difference from scipy's output.
+
+Usage:
+    python -m benchmarks.bench_resample --rates 44100,48000,96000 --blocksize 512
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from functools import partial
+from math import gcd
+
+import numpy as np
+from scipy.signal import resample_poly
+
+from dictate.audio.resample import Resampler, downmix
+
+
+def _best_of(repeats: int, fn) -> tuple[float, np.ndarray]:
+    """Fastest of ``repeats`` runs of ``fn()`` in seconds, and its result."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def _scipy(audio: np.ndarray, up: int, down: int) -> np.ndarray:
+    return resample_poly(downmix(audio), up, down).astype(np.float32)
+
+
+def _whole(audio: np.ndarray, rate: int, out_rate: int) -> np.ndarray:
+    resampler = Resampler(rate, out_rate)
+    return np.concatenate((resampler.process(audio), resampler.flush()))
+
+
+def _stream(
+    audio: np.ndarray, rate: int, out_rate: int, blocksize: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Feed ``audio`` block by block; returns the output and each callback's seconds."""
+    resampler = Resampler(rate, out_rate)
+    n_blocks = len(audio) // blocksize
+    timings = np.empty(n_blocks)
+    parts = []
+    for i in range(n_blocks):
+        t0 = time.perf_counter()
+        parts.append(resampler.process(audio[i * blocksize:(i + 1) * blocksize]))
+        timings[i] = time.perf_counter() - t0
+    parts.append(resampler.process(audio[n_blocks * blocksize:]))
+    parts.append(resampler.flush())
+    return np.concatenate(parts), timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rates", default="44100,48000,96000", help="device sample rates")
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--sample-rate", type=int, default=16000, help="target rate")
+    parser.add_argument("--blocksize", type=int, default=512, help="frames per callback")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"1 min of {args.channels}-channel audio -> {args.sample_rate} Hz mono, ms per minute")
+    print(
+        f"{'rate':>7} {'scipy':>8} {'whole':>8} {'stream':>8} "
+        f"{'cb mean µs':>11} {'cb max µs':>10} {'budget µs':>10} {'max diff':>9}"
+    )
+    for rate in (int(r) for r in args.rates.split(",")):
+        rng = np.random.default_rng(0)
+        audio = rng.uniform(-0.5, 0.5, (rate * 60, args.channels)).astype(np.float32)
+        divisor = gcd(rate, args.sample_rate)
+        up, down = args.sample_rate // divisor, rate // divisor
+
+        scipy_s, expected = _best_of(args.repeats, partial(_scipy, audio, up, down))
+        whole_s, ours = _best_of(args.repeats, partial(_whole, audio, rate, args.sample_rate))
+        stream_s, (streamed, timings) = _best_of(
+            args.repeats, partial(_stream, audio, rate, args.sample_rate, args.blocksize)
+        )
+        assert len(ours) == len(streamed) == len(expected)
+        diff = max(np.abs(ours - expected).max(), np.abs(streamed - expected).max())
+        print(
+            f"{rate:>7} {scipy_s * 1e3:>8.1f} {whole_s * 1e3:>8.1f} {stream_s * 1e3:>8.1f} "
+            f"{timings.mean() * 1e6:>11.1f} {timings.max() * 1e6:>10.1f} "
+            f"{args.blocksize / rate * 1e6:>10.0f} {diff:>9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Stand-ins for the hardware-facing components so Pipeline runs without a microphone or display."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterator
+
+import numpy as np
+
+from dictate.asr.base import ModelState, ModelStatus
+from dictate.asr.streaming import WindowedTranscriptionStream
+
+# Dictation-like text with fillers, so the text processor has real work to do
+_WORDS = [
+    "um", "so", "I", "was", "thinking", "that", "we", "should", "uh", "move", "the", "meeting",
+    "to", "thursday", "you", "know", "because", "the", "team", "is", "basically", "out", "on",
+    "friday", "and", "I", "mean", "the", "release", "can", "wait", "a", "day", "or", "two",
+]
+
+# Roughly conversational speaking rate
+_WORDS_PER_SECOND = 2.5
+
+# Whisper emits a segment per sentence or so
+_SEGMENT_SECONDS = 5.0
+
+
+def synthetic_speech(seconds: float, sample_rate: int = 16000, seed: int = 0) -> np.ndarray:
+    """Speech-like test signal: noise bursts shaped like syllables, with silent head and tail.
+
+    Not intelligible, but it has the energy envelope that silence trimming and VAD react
+    to, which is what matters for timing the pipeline.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(seconds * sample_rate)
+    t = np.arange(n) / sample_rate
+    # ~4 Hz syllable rate, with 0.3 s of silence at either end
+    envelope = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) ** 2
+    pad = min(n // 4, int(0.3 * sample_rate))
+    envelope[:pad] = 0
+    envelope[n - pad:] = 0
+    return (0.3 * envelope * rng.standard_normal(n)).astype(np.float32)
+
+
+def transcript_for(seconds: float) -> str:
+    """Filler-laden transcript with as many words as ``seconds`` of speech would have."""
+    count = max(1, int(seconds * _WORDS_PER_SECOND))
+    return " ".join(_WORDS[i % len(_WORDS)] for i in range(count))
+
+
+class SyntheticRecorder:
+    """Drop-in for AudioRecorder that "records" a fixed clip.
+
+    With ``realtime=True``, ``read()`` only returns the samples a real microphone
+    would have delivered by now, so streaming transcription behaves as it does live.
+    """
+
+    def __init__(self, audio: np.ndarray, sample_rate: int = 16000, realtime: bool = False) -> None:
+        self.sample_rate = sample_rate
+        self._audio = audio
+        self._realtime = realtime
+        self._started: float | None = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self._started is not None
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+
+    def stop(self) -> np.ndarray:
+        self._started = None
+        return self._audio
+
+    def read(self, start: int = 0) -> np.ndarray:
+        end = len(self._audio)
+        if self._realtime and self._started is not None:
+            end = min(end, int((time.perf_counter() - self._started) * self.sample_rate))
+        return self._audio[start:end]
+
+
+class FakeASREngine:
+    """ASREngine that sleeps ``rtf`` seconds per second of audio and returns canned text.
+
+    Like faster-whisper, it decodes in segments of about five seconds, each one a
+    sentence, and transcribe_segments() yields each as soon as its sleep is over.
+    """
+
+    def __init__(self, rtf: float = 0.1, load_seconds: float = 0.0) -> None:
+        self._rtf = rtf
+        self._load_seconds = load_seconds
+        self._loaded = threading.Event()
+        self._status = ModelStatus()
+
+    @property
+    def status(self) -> ModelStatus:
+        return self._status
+
+    def preload(self) -> None:
+        threading.Thread(target=self.ensure_loaded, daemon=True).start()
+
+    def ensure_loaded(self) -> None:
+        if not self._loaded.is_set():
+            time.sleep(self._load_seconds)
+            self._status = ModelStatus(state=ModelState.READY, load_seconds=self._load_seconds)
+            self._loaded.set()
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
+        return self._decode(audio, sample_rate)
+
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000) -> Iterator[str]:
+        self.ensure_loaded()
+        remaining = len(audio) / sample_rate
+        while remaining > 0:
+            seconds = min(_SEGMENT_SECONDS, remaining)
+            remaining -= seconds
+            time.sleep(seconds * self._rtf)
+            yield transcript_for(seconds) + "."
+
+    def start_stream(self, sample_rate: int = 16000) -> WindowedTranscriptionStream:
+        return WindowedTranscriptionStream(self._decode, sample_rate=sample_rate)
+
+    def _decode(self, audio: np.ndarray, sample_rate: int = 16000, prompt: str = "") -> str:
+        return " ".join(self.transcribe_segments(audio, sample_rate))
+
+
+class PassthroughProcessor:
+    """TextProcessor that returns its input, to time the pipeline without cleanup."""
+
+    def process(self, text: str) -> str:
+        return text
+
+
+class SlowProcessor:
+    """Wraps a TextProcessor and adds ``ms_per_word`` of latency, like an LLM would."""
+
+    def __init__(self, processor, ms_per_word: float) -> None:
+        self._processor = processor
+        self._ms_per_word = ms_per_word
+
+    def process(self, text: str) -> str:
+        time.sleep(len(text.split()) * self._ms_per_word / 1000)
+        return self._processor.process(text)
+
+
+class NoopInjector:
+    """Injector that records pasted text instead of touching the clipboard or keyboard."""
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    def __call__(self, text: str) -> None:
+        self.texts.append(text)
@@ -2,11 +2,247 @@
 
 from __future__ import annotations
 
+import argparse
 import logging
 import sys
+from pathlib import Path
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dictate",
+        description="Local voice-to-text dictation. Run without arguments for the menu bar app.",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    transcribe = commands.add_parser(
+        "transcribe", help="Transcribe a folder of WAV/FLAC recordings offline"
+    )
+    transcribe.add_argument("directory", type=Path, help="Folder to search recursively for audio")
+    transcribe.add_argument(
+        "-o", "--output", type=Path,
+        help="JSONL file, or folder for --format text (default: DIR/transcripts.jsonl, or DIR)",
+    )
+    transcribe.add_argument("--format", choices=("jsonl", "text"), default="jsonl")
+    transcribe.add_argument(
+        "--workers", type=int,
+        help="Worker processes, each loading its own model "
+        "(default: cores / cpu-threads; 0 = in this process)",
+    )
+    transcribe.add_argument(
+        "--cpu-threads", type=int,
+        help="CTranslate2 threads per worker (default: WHISPER_CPU_THREADS, or 2 if automatic)",
+    )
+    transcribe.add_argument(
+        "--model",
+        choices=("tiny", "base", "small", "medium", "large-v3"),
+        help="Whisper model size (default: WHISPER_MODEL)",
+    )
+    transcribe.add_argument("--language", help="Language code (default: WHISPER_LANGUAGE)")
+    transcribe.add_argument(
+        "--no-resume", action="store_true", help="Transcribe files that already have output"
+    )
+    transcribe.add_argument(
+        "--no-cleanup", action="store_true", help="Skip filler removal and formatting"
+    )
+
+    tune = commands.add_parser(
+        "tune", help="Benchmark decode settings on a recording and save the fastest accurate one"
+    )
+    tune.add_argument("clip", type=Path, help="WAV/FLAC recording of typical dictation")
+    tune.add_argument(
+        "--reference",
+        help="Correct transcript of the clip (default: output of the most precise settings)",
+    )
+    tune.add_argument(
+        "--compute-types",
+        help="Comma-separated CTranslate2 compute types (default: int8,int8_float32,int16,float32)",
+    )
+    tune.add_argument(
+        "--cpu-threads", help="Comma-separated thread counts (default: powers of two up to cores)"
+    )
+    tune.add_argument("--beam-sizes", help="Comma-separated beam sizes (default: 1,3,5)")
+    tune.add_argument("--repeat", type=int, default=3, help="Timed decodes per setting")
+    tune.add_argument(
+        "--max-wer", type=float, default=0.05,
+        help="Quality floor: highest word error rate accepted (default: 0.05)",
+    )
+    tune.add_argument("--model", choices=("tiny", "base", "small", "medium", "large-v3"))
+    tune.add_argument("--env", type=Path, default=Path(".env"), help="File to update")
+    tune.add_argument(
+        "--dry-run", action="store_true", help="Report the best settings without writing them"
+    )
+    return parser
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def _run_tune(args: argparse.Namespace, logger: logging.Logger) -> None:
+    from dictate.asr.whisper_local import WhisperLocalEngine
+    from dictate.config import load_config
+    from dictate.tune import (
+        DEFAULT_BEAM_SIZES,
+        DEFAULT_COMPUTE_TYPES,
+        DecodeSettings,
+        candidate_settings,
+        default_thread_counts,
+        load_clip,
+        pick_best,
+        supported_compute_types,
+        tune,
+        write_settings,
+    )
+
+    try:
+        config = load_config(args.env if args.env.exists() else None)
+    except ValueError as e:
+        logger.error("Configuration error: %s", e)
+        sys.exit(1)
+    if not args.clip.is_file():
+        logger.error("No such file: %s", args.clip)
+        sys.exit(1)
+
+    supported = supported_compute_types(config.whisper_device)
+    if args.compute_types:
+        compute_types = [c.strip() for c in args.compute_types.split(",") if c.strip()]
+        unsupported = sorted(set(compute_types) - supported)
+        if unsupported:
+            logger.error("Not supported on %s: %s", config.whisper_device, ", ".join(unsupported))
+            sys.exit(1)
+    else:
+        compute_types = [c for c in DEFAULT_COMPUTE_TYPES if c in supported]
+    try:
+        threads = _int_list(args.cpu_threads) if args.cpu_threads else default_thread_counts()
+        beams = _int_list(args.beam_sizes) if args.beam_sizes else list(DEFAULT_BEAM_SIZES)
+    except ValueError as e:
+        logger.error("Invalid list: %s", e)
+        sys.exit(1)
+    if args.repeat < 1 or min(threads, default=0) < 1 or min(beams, default=0) < 1:
+        logger.error("--repeat, --cpu-threads and --beam-sizes must be at least 1")
+        sys.exit(1)
+
+    model = args.model or config.whisper_model
+
+    def engine_factory(settings: DecodeSettings) -> WhisperLocalEngine:
+        return WhisperLocalEngine(
+            model_size=model,
+            language=config.whisper_language,
+            device=config.whisper_device,
+            compute_type=settings.compute_type,
+            cpu_threads=settings.cpu_threads,
+            beam_size=settings.beam_size,
+        )
+
+    audio = load_clip(args.clip, config.sample_rate)
+    candidates = candidate_settings(compute_types, threads, beams)
+    logger.info(
+        "Tuning %d setting(s) on %.1fs of audio, model=%s",
+        len(candidates), len(audio) / config.sample_rate, model,
+    )
+    results = tune(
+        audio, engine_factory, candidates, args.reference, config.sample_rate, args.repeat
+    )
+
+    print(f"{'compute type':<14} {'threads':>7} {'beam':>4} {'latency s':>9} {'WER':>6}")
+    for r in sorted(results, key=lambda r: r.latency_seconds):
+        s = r.settings
+        print(
+            f"{s.compute_type:<14} {s.cpu_threads:>7} {s.beam_size:>4} "
+            f"{r.latency_seconds:>9.3f} {r.wer:>6.1%}"
+        )
+
+    best = pick_best(results, args.max_wer)
+    if best is None:
+        logger.error("No setting reached a WER of %.1f%% or better", 100 * args.max_wer)
+        sys.exit(1)
+    print(f"Fastest within {args.max_wer:.1%} WER: {best.settings}")
+    if args.dry_run:
+        return
+    write_settings(args.env, best.settings, config.whisper_device)
+    print(f"Saved to {args.env}")
+
+
+def _run_transcribe(args: argparse.Namespace, logger: logging.Logger) -> None:
+    from dictate.batch import (
+        FileResult,
+        JsonlWriter,
+        ResultWriter,
+        TextWriter,
+        default_workers,
+        find_audio_files,
+        local_engine_factory,
+        transcribe_directory,
+    )
+    from dictate.config import load_config
+
+    if not args.directory.is_dir():
+        logger.error("Not a directory: %s", args.directory)
+        sys.exit(1)
+    if args.cpu_threads is not None and args.cpu_threads < 1:
+        logger.error("--cpu-threads must be at least 1")
+        sys.exit(1)
+
+    try:
+        config = load_config()
+    except ValueError as e:
+        logger.error("Configuration error: %s", e)
+        sys.exit(1)
+
+    # Batch workers run side by side, so "automatic" (0) means a few threads each, not all
+    cpu_threads = args.cpu_threads or config.whisper_cpu_threads or 2
+    directory = args.directory
+    writer: ResultWriter
+    if args.format == "jsonl":
+        writer = JsonlWriter(args.output or directory / "transcripts.jsonl")
+    else:
+        sources = [p.relative_to(directory).as_posix() for p in find_audio_files(directory)]
+        writer = TextWriter(args.output or directory, sources)
+
+    workers = default_workers(cpu_threads) if args.workers is None else args.workers
+    model = args.model or config.whisper_model
+    logger.info(
+        "Transcribing %s with %d worker(s) x %d thread(s), model=%s",
+        directory, workers, cpu_threads, model,
+    )
+
+    def report(result: FileResult) -> None:
+        if result.error:
+            logger.warning("%s: %s", result.path, result.error)
+        else:
+            logger.info(
+                "%s: %.1fs audio in %.2fs", result.path, result.audio_seconds, result.decode_seconds
+            )
+
+    try:
+        stats = transcribe_directory(
+            directory,
+            writer,
+            local_engine_factory(
+                model,
+                args.language or config.whisper_language,
+                cpu_threads,
+                device=config.whisper_device,
+                compute_type=config.whisper_compute_type,
+                beam_size=config.whisper_beam_size,
+            ),
+            workers=workers,
+            cleanup=not args.no_cleanup,
+            dictionary_path=config.dictionary_path,
+            resume=not args.no_resume,
+            sample_rate=config.sample_rate,
+            on_result=report,
+        )
+    except RuntimeError as e:
+        logger.error("%s", e)
+        sys.exit(1)
+    print(stats.summary())
+    if stats.failed:
+        sys.exit(1)
+
+
+def main(argv: list[str] | None = None) -> None:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -14,6 +250,14 @@ def main() -> None:
     )
     logger = logging.getLogger(__name__)
 
+    args = _build_parser().parse_args(argv)
+    if args.command == "transcribe":
+        _run_transcribe(args, logger)
+        return
+    if args.command == "tune":
+        _run_tune(args, logger)
+        return
+
     # Check platform
     if sys.platform != "darwin":
         logger.error("Dictate only runs on macOS.")
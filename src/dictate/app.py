@@ -7,11 +7,15 @@ import os
 
 import rumps
 
+from dictate.asr.base import ModelState, ModelStatus
 from dictate.asr.factory import create_asr_engine
 from dictate.audio.recorder import AudioRecorder
 from dictate.config import Config
 from dictate.hotkey.factory import create_hotkey_listener
+from dictate.memory import format_bytes
+from dictate.metrics import StageStats
 from dictate.pipeline import Pipeline, PipelineState
+from dictate.processing.cache import CachedProcessor, CacheStats
 from dictate.processing.factory import create_text_processor
 
 logger = logging.getLogger(__name__)
@@ -30,6 +34,50 @@ _STATUS_TEXT = {
     PipelineState.PROCESSING: "Processing...",
 }
 
+_MODEL_STATE_TEXT = {
+    ModelState.UNLOADED: "Not loaded",
+    ModelState.LOADING: "Loading...",
+    ModelState.WARMING_UP: "Warming up...",
+    ModelState.READY: "Ready",
+    ModelState.FAILED: "Load failed",
+}
+
+# How often the engine status and latency menu items are refreshed (seconds)
+_STATUS_REFRESH_INTERVAL = 1
+
+
+def _format_model_status(status: ModelStatus) -> str:
+    """Menu text for the engine load state, e.g. 'Engine: Ready (load 2.1s, warm-up 0.4s)'."""
+    text = "Engine: " + _MODEL_STATE_TEXT.get(status.state, status.state.name.capitalize())
+    details = []
+    if status.load_seconds is not None:
+        details.append(f"load {status.load_seconds:.1f}s")
+    if status.warmup_seconds is not None:
+        details.append(f"warm-up {status.warmup_seconds:.1f}s")
+    if status.freed_bytes is not None:
+        details.append(f"freed {format_bytes(status.freed_bytes)}")
+    if details:
+        text += f" ({', '.join(details)})"
+    return text
+
+
+def _format_latency(stats: dict[str, StageStats]) -> str:
+    """Menu text for hotkey-to-paste latency, e.g. 'Latency: 0.9s p50 · 1.8s p95 (12)'."""
+    total = stats.get("total")
+    if total is None:
+        return "Latency: no dictations yet"
+    return (
+        f"Latency: {total.p50:.1f}s p50 · {total.p95:.1f}s p95 · "
+        f"{total.p99:.1f}s p99 ({total.count})"
+    )
+
+
+def _format_cache(stats: CacheStats) -> str:
+    """Menu text for the cleanup cache, e.g. 'Cleanup cache: 40% hits (12 entries)'."""
+    if not stats.hits + stats.misses:
+        return "Cleanup cache: empty"
+    return f"Cleanup cache: {stats.hit_rate:.0%} hits ({stats.entries} entries)"
+
 
 class DictateApp(rumps.App):
     """Menu bar application for Dictate."""
@@ -44,9 +92,19 @@ class DictateApp(rumps.App):
         self._config = config
 
         # Build components
-        recorder = AudioRecorder(sample_rate=config.sample_rate)
+        recorder = AudioRecorder(
+            sample_rate=config.sample_rate,
+            capture_backend=config.capture_backend,
+            disk_spill_seconds=config.disk_spill_seconds,
+            always_on=config.capture_always_on,
+            preroll_seconds=config.preroll_ms / 1000,
+            native_rate=config.capture_native_rate,
+        )
+        self._recorder = recorder
         asr_engine = create_asr_engine(config)
+        self._asr = asr_engine
         text_processor = create_text_processor(config)
+        self._text_cache = text_processor if isinstance(text_processor, CachedProcessor) else None
 
         self._pipeline = Pipeline(
             recorder=recorder,
@@ -55,18 +113,37 @@ class DictateApp(rumps.App):
             on_state_change=self._on_state_change,
             enable_sound_feedback=config.enable_sound_feedback,
             show_preview_notification=config.show_preview_notification,
+            streaming_transcription=config.streaming_transcription,
+            trim_silence=config.trim_silence,
+            silence_threshold_db=config.silence_threshold_db,
+            silence_padding_ms=config.silence_padding_ms,
+            queue_size=config.queue_size,
+            queue_full_policy=config.queue_full_policy,
+            overlap_cleanup=config.overlap_cleanup,
+            cleanup_timeout_seconds=(
+                config.ollama_timeout_seconds if config.text_processor == "ollama" else None
+            ),
+            # Engines that adapt to end-to-end latency (model routing) learn from each dictation
+            on_metrics=getattr(asr_engine, "observe", None),
         )
 
         self._hotkey = create_hotkey_listener(config)
 
         # Keep a direct reference to the status menu item so we can always update it
         self._status_item = rumps.MenuItem("Status: Idle", callback=None)
+        self._engine_item = rumps.MenuItem(_format_model_status(asr_engine.status), callback=None)
+        self._latency_item = rumps.MenuItem(_format_latency({}), callback=None)
+        self._cache_item = rumps.MenuItem("Cleanup cache: empty", callback=None)
+        self._status_timer = rumps.Timer(self._refresh_status_items, _STATUS_REFRESH_INTERVAL)
 
         mode_label = "Hold-to-talk" if config.hotkey_mode == "hold" else "Toggle"
 
         # Menu items
         self.menu = [
             self._status_item,
+            self._engine_item,
+            self._latency_item,
+            *([self._cache_item] if self._text_cache is not None else []),
             None,  # separator
             rumps.MenuItem("ASR: " + config.asr_engine),
             rumps.MenuItem("Model: " + config.whisper_model),
@@ -84,8 +161,23 @@ class DictateApp(rumps.App):
         # Update status menu item via direct reference (not by title lookup)
         self._status_item.title = f"Status: {state.name.capitalize()}"
 
+    def _refresh_status_items(self, _timer: rumps.Timer) -> None:
+        self._engine_item.title = _format_model_status(self._asr.status)
+        self._latency_item.title = _format_latency(self._pipeline.latency_stats())
+        if self._text_cache is not None:
+            self._cache_item.title = _format_cache(self._text_cache.stats())
+
     def run(self, **kwargs: object) -> None:
         """Start the hotkey listener and run the app."""
+        if self._config.model_preload:
+            # Loads on a background thread, so the menu bar icon still appears immediately
+            self._asr.preload()
+        # Opens the always-on input stream now rather than on the first hotkey press
+        self._recorder.open()
+        self._status_timer.start()
+        if self._text_cache is not None:
+            # Cleanups cached since the last background save would otherwise be lost
+            rumps.events.before_quit.register(self._text_cache.flush)
         self._hotkey.start(self._pipeline.toggle)
         logger.info("Dictate is running. Press Option+Space to toggle recording.")
         super().run(**kwargs)
@@ -2,14 +2,100 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Iterator, Protocol
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass(frozen=True)
+class PartialTranscript:
+    """Incremental transcription result.
+
+    Attributes:
+        stable: Text decoded from committed audio windows. It will not change.
+        provisional: Best guess for the uncommitted tail. It may still change.
+    """
+
+    stable: str = ""
+    provisional: str = ""
+
+    @property
+    def text(self) -> str:
+        return " ".join(part for part in (self.stable, self.provisional) if part)
+
+
+class ModelState(Enum):
+    UNLOADED = auto()
+    LOADING = auto()
+    WARMING_UP = auto()
+    READY = auto()
+    FAILED = auto()
+
+
+@dataclass(frozen=True)
+class ModelStatus:
+    """Load state of an engine's model and how long getting there took.
+
+    Attributes:
+        state: Current load state.
+        load_seconds: Time spent in the last model load, if any.
+        warmup_seconds: Time spent in the last warm-up decode, if any.
+        error: Message from the last failed load, if any.
+        freed_bytes: Resident memory released by the last unload, if measured.
+    """
+
+    state: ModelState = ModelState.UNLOADED
+    load_seconds: float | None = None
+    warmup_seconds: float | None = None
+    error: str = ""
+    freed_bytes: int | None = None
+
+
+class TranscriptionStream(Protocol):
+    """Interface for an in-progress incremental transcription."""
+
+    def feed(self, audio: np.ndarray, decode_tail: bool = False) -> PartialTranscript:
+        """Append newly recorded audio and decode any completed windows.
+
+        Args:
+            audio: 1-D float32 numpy array of audio recorded since the last call.
+            decode_tail: Also decode the uncommitted tail as provisional text.
+
+        Returns:
+            The stable and provisional text so far.
+        """
+        ...
+
+    def finish(self) -> str:
+        """Decode the remaining tail and return the full transcription."""
+        ...
 
 
 class ASREngine(Protocol):
     """Interface that all ASR engines must implement."""
 
+    @property
+    def status(self) -> ModelStatus:
+        """Load state of the engine's model and its load/warm-up timings."""
+        ...
+
+    def preload(self) -> None:
+        """Load the model and warm it up on a background thread, returning immediately.
+
+        Engines with nothing to load treat this as a no-op.
+        """
+        ...
+
+    def ensure_loaded(self) -> None:
+        """Block until the model is loaded, loading it now if needed.
+
+        Lets callers time the model load wait separately from the decode.
+        """
+        ...
+
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         """Transcribe audio data to text.
 
@@ -21,3 +107,26 @@ class ASREngine(Protocol):
             Transcribed text string.
         """
         ...
+
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000) -> Iterator[str]:
+        """Transcribe audio, yielding each segment's text as soon as it is decoded.
+
+        Lets callers start on early segments while later ones are still decoding.
+        Joining the segments with spaces gives the same text as transcribe().
+
+        Args:
+            audio: 1-D float32 numpy array of audio samples.
+            sample_rate: Sample rate of the audio data.
+        """
+        ...
+
+    def start_stream(self, sample_rate: int = 16000) -> TranscriptionStream:
+        """Begin an incremental transcription fed while recording is in progress.
+
+        Args:
+            sample_rate: Sample rate of the audio that will be fed.
+
+        Returns:
+            A stream that accepts audio blocks and returns partial transcripts.
+        """
+        ...
@@ -9,10 +9,56 @@ from dictate.config import Config
 def create_asr_engine(config: Config) -> ASREngine:
     """Create and return the appropriate ASR engine."""
     if config.asr_engine == "openai_api":
-        from dictate.asr.whisper_api import WhisperAPIEngine
+        return _create_api_engine(config)
 
-        return WhisperAPIEngine(api_key=config.openai_api_key)
+    if config.whisper_models:
+        from dictate.asr.router import RoutingEngine
 
+        local: ASREngine = RoutingEngine(
+            [(model, _create_local_engine(config, model)) for model in config.whisper_models],
+            latency_target_seconds=config.latency_target_seconds,
+            memory_budget_mb=config.model_memory_budget_mb,
+        )
+    else:
+        local = _create_local_engine(config, config.whisper_model)
+
+    if config.asr_engine == "hybrid":
+        from dictate.asr.hybrid import HybridEngine
+
+        return HybridEngine(
+            local,
+            _create_api_engine(config),
+            budget_seconds=config.hybrid_budget_seconds,
+            deadline_seconds=config.hybrid_deadline_seconds,
+        )
+
+    return local
+
+
+def _create_api_engine(config: Config) -> ASREngine:
+    from dictate.asr.whisper_api import WhisperAPIEngine
+
+    return WhisperAPIEngine(
+        api_key=config.openai_api_key,
+        base_url=config.openai_base_url,
+        stream_window_seconds=config.stream_window_seconds,
+        upload_workers=config.api_upload_workers,
+        long_form_seconds=config.long_form_seconds,
+    )
+
+
+def _create_local_engine(config: Config, model_size: str) -> ASREngine:
     from dictate.asr.whisper_local import WhisperLocalEngine
 
-    return WhisperLocalEngine(model_size=config.whisper_model, language=config.whisper_language)
+    return WhisperLocalEngine(
+        model_size=model_size,
+        language=config.whisper_language,
+        device=config.whisper_device,
+        compute_type=config.whisper_compute_type,
+        beam_size=config.whisper_beam_size,
+        cpu_threads=config.whisper_cpu_threads,
+        stream_window_seconds=config.stream_window_seconds,
+        idle_unload_seconds=config.model_idle_unload_seconds,
+        parallel_workers=config.parallel_decode_workers,
+        long_form_seconds=config.long_form_seconds,
+    )
@@ -0,0 +1,53 @@
+"""Streaming FLAC encoding of float32 audio, for compact lossless uploads."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+
+
+class _Sink:
+    """Write-only, non-seekable file object that collects the muxer's output."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def seekable(self) -> bool:
+        return False
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self.chunks = self.chunks, []
+        return iter(chunks)
+
+
+def encode_flac(
+    audio: np.ndarray, sample_rate: int = 16000, block_frames: int = 16000
+) -> Iterator[bytes]:
+    """Encode mono float32 ``audio`` as 16-bit FLAC, yielding bytes as they are produced.
+
+    Only one block is converted to int16 at a time, so the first bytes are ready to
+    send long before the whole recording is encoded: WhisperAPIEngine uploads them
+    while the rest is still being encoded. The stream is written without
+    seeking, so its header leaves the total sample count unset, which decoders accept.
+    """
+    import av
+
+    sink = _Sink()
+    with av.open(sink, mode="w", format="flac") as container:
+        stream = container.add_stream("flac", rate=sample_rate, layout="mono")
+        for start in range(0, len(audio), block_frames):
+            block = np.clip(audio[start:start + block_frames], -1.0, 1.0)
+            pcm = (block * 32767).astype(np.int16).reshape(1, -1)
+            frame = av.AudioFrame.from_ndarray(pcm, format="s16", layout="mono")
+            frame.sample_rate = sample_rate
+            for packet in stream.encode(frame):
+                container.mux(packet)
+            yield from sink.drain()
+        for packet in stream.encode(None):
+            container.mux(packet)
+    yield from sink.drain()
@@ -0,0 +1,220 @@
+"""ASR engine that races local decoding against the Whisper API under a deadline."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import numpy as np
+
+from dictate.asr.base import ASREngine, ModelState, ModelStatus, TranscriptionStream
+
+if TYPE_CHECKING:
+    from dictate.metrics import UtteranceMetrics
+
+    # (racer name, its segments or the exception it raised)
+    _Outcome = tuple[str, list[str] | BaseException]
+
+logger = logging.getLogger(__name__)
+
+
+class HybridEngine:
+    """Decodes locally and brings in the API when the local decode looks too slow.
+
+    Every utterance starts decoding locally at once. The API is raced against it right
+    away if the local decode is predicted to take longer than ``budget_seconds``, or
+    otherwise as soon as the local decode has run for ``deadline_seconds``. The
+    prediction is the p95 real-time factor of the last ``window`` local decodes times
+    the audio length, plus the model load time if the local model isn't resident.
+
+    Each racer runs on a thread of its own, so losers still winding down (at most to
+    their next segment boundary, or to the end of an upload already in flight) never
+    delay the next utterance's local decode. The first result wins and the other
+    racer is cancelled; an upload in flight finishes in the background and is ignored.
+    If the API fails, the local result is used however long it takes. A local decode
+    cancelled early still records its elapsed real-time factor as a lower bound, so
+    the local engine gets another chance once the API has been winning for a while.
+    """
+
+    def __init__(
+        self,
+        local: ASREngine,
+        remote: ASREngine,
+        budget_seconds: float = 1.0,
+        deadline_seconds: float = 2.0,
+        window: int = 50,
+    ) -> None:
+        self._local = local
+        self._remote = remote
+        self._budget_seconds = budget_seconds
+        self._deadline_seconds = deadline_seconds
+        self._rtf: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._last_winner: str | None = None
+
+    @property
+    def status(self) -> ModelStatus:
+        return self._local.status
+
+    @property
+    def last_winner(self) -> str | None:
+        """Which engine produced the last transcript: "local" or "remote"."""
+        return self._last_winner
+
+    def preload(self) -> None:
+        self._local.preload()
+        self._remote.preload()
+
+    def ensure_loaded(self) -> None:
+        # Don't wait for the local model here: the API can answer while it loads
+        self._local.preload()
+
+    def predict_local_seconds(self, audio_seconds: float) -> float | None:
+        """p95 estimate of the local decode time, or None before anything is known."""
+        with self._lock:
+            rtf = float(np.percentile(self._rtf, 95)) if self._rtf else None
+        status = self._local.status
+        load = None
+        if status.state not in (ModelState.READY, ModelState.WARMING_UP):
+            load = status.load_seconds
+        if rtf is None and load is None:
+            return None
+        return (rtf or 0.0) * audio_seconds + (load or 0.0)
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
+        return " ".join(self.transcribe_segments(audio, sample_rate))
+
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000) -> Iterator[str]:
+        if audio.size == 0:
+            return
+        # Segments can't be yielded before the race is decided: the loser's are discarded
+        yield from self._race(audio, sample_rate)
+
+    def start_stream(self, sample_rate: int = 16000) -> TranscriptionStream:
+        # Windows are decoded while recording, so there is no end-of-utterance wait to race
+        return self._local.start_stream(sample_rate)
+
+    def observe(self, metrics: UtteranceMetrics) -> None:
+        """Pass pipeline timings on to the local engine if it learns from them."""
+        observe = getattr(self._local, "observe", None)
+        if observe is not None:
+            observe(metrics)
+
+    def _race(self, audio: np.ndarray, sample_rate: int) -> list[str]:
+        audio_seconds = len(audio) / sample_rate
+        results: queue.Queue[_Outcome] = queue.Queue()
+        cancel = threading.Event()
+        start = time.monotonic()
+        _spawn("hybrid-local", self._run_local, audio, sample_rate, cancel, results)
+        pending = 1
+
+        remote_started = False
+        predicted = self.predict_local_seconds(audio_seconds)
+        if predicted is not None and predicted > self._budget_seconds:
+            logger.info(
+                "Local decode of %.1fs predicted to take %.2fs (budget %.2fs); racing the API",
+                audio_seconds,
+                predicted,
+                self._budget_seconds,
+            )
+            self._start_remote(audio, sample_rate, cancel, results)
+            remote_started, pending = True, 2
+
+        errors: dict[str, BaseException] = {}
+        while pending:
+            timeout = None
+            if not remote_started:
+                timeout = max(0.0, start + self._deadline_seconds - time.monotonic())
+            try:
+                name, outcome = results.get(timeout=timeout)
+            except queue.Empty:
+                logger.info(
+                    "Local decode passed the %.2fs deadline; racing the API",
+                    self._deadline_seconds,
+                )
+                self._start_remote(audio, sample_rate, cancel, results)
+                remote_started, pending = True, pending + 1
+                continue
+            pending -= 1
+            if not isinstance(outcome, BaseException):
+                cancel.set()
+                self._last_winner = name
+                logger.info("%s decode won in %.2fs", name.capitalize(), time.monotonic() - start)
+                return outcome
+            errors[name] = outcome
+            if name == "local":
+                logger.warning("Local decode failed (%s); waiting for the API", outcome)
+                if not remote_started:
+                    self._start_remote(audio, sample_rate, cancel, results)
+                    remote_started, pending = True, pending + 1
+            else:
+                logger.warning("API decode failed (%s); waiting for the local result", outcome)
+        # Both failed; the local error is the one worth reporting
+        error = errors.get("local") or errors.get("remote")
+        if error is None:
+            raise RuntimeError("Hybrid decode ended without a transcript or an error")
+        raise error
+
+    def _start_remote(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        cancel: threading.Event,
+        results: queue.Queue[_Outcome],
+    ) -> None:
+        _spawn(
+            "hybrid-remote", self._run, "remote", self._remote, audio, sample_rate, cancel, results
+        )
+
+    def _run_local(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        cancel: threading.Event,
+        results: queue.Queue[_Outcome],
+    ) -> None:
+        try:
+            # Time the decode alone; the prediction adds the load time separately
+            self._local.ensure_loaded()
+        except Exception as e:
+            results.put(("local", e))
+            return
+        start = time.monotonic()
+        if not self._run("local", self._local, audio, sample_rate, cancel, results):
+            return
+        with self._lock:
+            self._rtf.append((time.monotonic() - start) / (len(audio) / sample_rate))
+
+    @staticmethod
+    def _run(
+        name: str,
+        engine: ASREngine,
+        audio: np.ndarray,
+        sample_rate: int,
+        cancel: threading.Event,
+        results: queue.Queue[_Outcome],
+    ) -> bool:
+        """Decode with ``engine`` and post the outcome.
+
+        Returns:
+            False if the engine failed; True if it finished or was cancelled.
+        """
+        segments: list[str] = []
+        try:
+            for segment in engine.transcribe_segments(audio, sample_rate):
+                if cancel.is_set():
+                    return True
+                segments.append(segment)
+        except Exception as e:
+            results.put((name, e))
+            return False
+        results.put((name, segments))
+        return True
+
+
+def _spawn(name: str, target: Callable[..., object], *args: object) -> None:
+    threading.Thread(target=target, args=args, name=name, daemon=True).start()
@@ -0,0 +1,184 @@
+"""Long-form decoding: split a recording at silences and decode the pieces in parallel."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import string
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Callable, Iterator, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (audio, sample_rate) -> text
+ChunkDecodeFn = Callable[[np.ndarray, int], str]
+
+# Whisper attends over 30 s windows, so longer chunks gain nothing
+DEFAULT_CHUNK_SECONDS = 30.0
+DEFAULT_OVERLAP_SECONDS = 1.0
+
+# Words compared when looking for text repeated across a chunk boundary
+_MAX_OVERLAP_WORDS = 12
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A slice of the recording, in samples.
+
+    Attributes:
+        overlap: Samples shared with the previous chunk. Non-zero only where a long
+            stretch of speech had no silence to cut at.
+    """
+
+    start: int
+    end: int
+    overlap: int = 0
+
+
+def find_speech(
+    audio: np.ndarray, sample_rate: int = 16000, min_silence_ms: int = 500
+) -> list[tuple[int, int]]:
+    """Speech regions as (start, end) samples, from faster-whisper's Silero VAD."""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    options = VadOptions(min_silence_duration_ms=min_silence_ms)
+    return [
+        (ts["start"], ts["end"])
+        for ts in get_speech_timestamps(audio, options, sampling_rate=sample_rate)
+    ]
+
+
+def plan_chunks(
+    speech: Sequence[tuple[int, int]],
+    sample_rate: int = 16000,
+    max_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+) -> list[Chunk]:
+    """Group speech regions into chunks of at most ``max_seconds``.
+
+    Chunks are cut in the middle of the silence between two regions, as late as the
+    length limit allows, so no word straddles a boundary. Speech that runs longer
+    than ``max_seconds`` without a pause is cut anyway, with ``overlap_seconds`` of
+    audio shared between the two chunks for stitch() to deduplicate.
+    """
+    if not speech:
+        return []
+    max_len = int(max_seconds * sample_rate)
+    overlap = int(overlap_seconds * sample_rate)
+    if overlap >= max_len:
+        raise ValueError("overlap_seconds must be shorter than max_seconds")
+
+    cuts = [(end + next_start) // 2 for (_, end), (next_start, _) in pairwise(speech)]
+    start, end = speech[0][0], speech[-1][1]
+    shared = 0
+    chunks: list[Chunk] = []
+    while end - start > max_len:
+        limit = start + max_len
+        i = bisect.bisect_right(cuts, limit) - 1
+        if i >= 0 and cuts[i] > start:
+            chunks.append(Chunk(start, cuts[i], shared))
+            start, shared = cuts[i], 0
+        else:
+            chunks.append(Chunk(start, limit, shared))
+            start, shared = limit - overlap, overlap
+    chunks.append(Chunk(start, end, shared))
+    return chunks
+
+
+def _normalize(word: str) -> str:
+    return word.strip(string.punctuation).lower()
+
+
+class Stitcher:
+    """Joins chunk transcripts in order, dropping words repeated across a boundary.
+
+    Only an overlapping cut can repeat words: there, the words both chunks heard are
+    dropped from the second, up to as many as the shared audio can hold at the chunk's
+    speaking rate. A cut in silence splits no word, so a repeat across it ("no. No, I
+    said") is real speech and is kept.
+    """
+
+    def __init__(self) -> None:
+        self._tail: list[str] = []
+
+    def add(self, text: str, chunk: Chunk) -> str:
+        """Return the part of ``text`` not already covered by earlier chunks."""
+        words = text.split()
+        if self._tail and words and chunk.overlap:
+            # A word may straddle either edge of the shared audio, hence the extra one
+            rate = len(words) / max(1, chunk.end - chunk.start)
+            words = words[self._repeated(words, math.ceil(rate * chunk.overlap) + 1):]
+        if words:
+            self._tail = (self._tail + words)[-_MAX_OVERLAP_WORDS:]
+        return " ".join(words)
+
+    def _repeated(self, words: list[str], max_words: int) -> int:
+        tail = [_normalize(w) for w in self._tail]
+        head = [_normalize(w) for w in words[:_MAX_OVERLAP_WORDS]]
+        for k in range(min(len(tail), len(head), max_words), 0, -1):
+            if tail[-k:] == head[:k]:
+                return k
+        return 0
+
+
+def stitch(texts: Sequence[str], chunks: Sequence[Chunk]) -> str:
+    stitcher = Stitcher()
+    return " ".join(piece for piece in map(stitcher.add, texts, chunks) if piece)
+
+
+def decode_chunks(
+    decode: ChunkDecodeFn,
+    audio: np.ndarray,
+    chunks: Sequence[Chunk],
+    sample_rate: int = 16000,
+    workers: int = 1,
+) -> Iterator[str]:
+    """Decode ``chunks`` on ``workers`` threads, yielding their texts in chunk order.
+
+    The decoder must release the GIL (CTranslate2 does) for the threads to run in
+    parallel.
+    """
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper-chunk") as pool:
+        futures = [
+            pool.submit(decode, audio[chunk.start:chunk.end], sample_rate) for chunk in chunks
+        ]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def transcribe_long_form(
+    decode: ChunkDecodeFn,
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    workers: int = 1,
+    speech: Sequence[tuple[int, int]] | None = None,
+    max_chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+) -> Iterator[str]:
+    """Split ``audio`` at silences, decode the chunks in parallel and yield stitched text.
+
+    Args:
+        speech: Speech regions in samples; found with VAD if not given.
+    """
+    if speech is None:
+        speech = find_speech(audio, sample_rate)
+    chunks = plan_chunks(speech, sample_rate, max_seconds=max_chunk_seconds)
+    logger.info(
+        "Long-form decode: %.1fs of audio in %d chunk(s) on %d worker(s)",
+        len(audio) / sample_rate,
+        len(chunks),
+        workers,
+    )
+    stitcher = Stitcher()
+    for chunk, text in zip(chunks, decode_chunks(decode, audio, chunks, sample_rate, workers)):
+        piece = stitcher.add(text, chunk)
+        if piece:
+            yield piece
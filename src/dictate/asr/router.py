@@ -0,0 +1,216 @@
+"""ASR engine that routes each utterance to one of several Whisper model sizes."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from dictate.asr.base import ASREngine, ModelState, ModelStatus, TranscriptionStream
+from dictate.metrics import UtteranceMetrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    """Rough cost of a Whisper model size before any decode has been observed.
+
+    Decode time is modelled as ``fixed_seconds + per_audio_second * audio_seconds``:
+    Whisper pads every clip to a 30 s window, so short clips all cost about the same.
+
+    Attributes:
+        load_seconds: Time to load the model from the local cache.
+        fixed_seconds: Decode time of a near-empty clip.
+        per_audio_second: Extra decode time per second of audio.
+        memory_mb: Resident memory while loaded.
+    """
+
+    load_seconds: float
+    fixed_seconds: float
+    per_audio_second: float
+    memory_mb: float
+
+    def decode_seconds(self, audio_seconds: float) -> float:
+        return self.fixed_seconds + self.per_audio_second * audio_seconds
+
+
+# int8 on a recent laptop CPU with beam size 3, memory as in the README's model guide.
+# Observed decodes correct the timings quickly.
+DEFAULT_PROFILES = {
+    "tiny": ModelProfile(0.5, 0.15, 0.015, 150),
+    "base": ModelProfile(1.0, 0.3, 0.03, 300),
+    "small": ModelProfile(2.5, 0.8, 0.08, 1000),
+    "medium": ModelProfile(6.0, 2.0, 0.2, 3000),
+    "large-v3": ModelProfile(12.0, 4.0, 0.4, 6000),
+}
+
+
+class _Route:
+    def __init__(self, name: str, engine: ASREngine, profile: ModelProfile, window: int) -> None:
+        self.name = name
+        self.engine = engine
+        self.profile = profile
+        # Observed decode time divided by the profile's prediction
+        self.ratios: deque[float] = deque(maxlen=window)
+
+    @property
+    def loaded(self) -> bool:
+        return self.engine.status.state in (ModelState.READY, ModelState.WARMING_UP)
+
+    def predict(self, audio_seconds: float) -> float:
+        """p95 estimate of the decode time, including a load if the model is not resident."""
+        scale = float(np.percentile(self.ratios, 95)) if self.ratios else 1.0
+        seconds = scale * self.profile.decode_seconds(audio_seconds)
+        if not self.loaded:
+            seconds += self.engine.status.load_seconds or self.profile.load_seconds
+        return seconds
+
+    def observe(self, audio_seconds: float, decode_seconds: float) -> None:
+        self.ratios.append(decode_seconds / self.profile.decode_seconds(audio_seconds))
+
+
+class RoutingEngine:
+    """Picks the largest model predicted to keep hotkey-to-paste under a latency target.
+
+    Each utterance's decode budget is ``latency_target_seconds`` minus the p95 of the
+    time the rest of the pipeline took around recent decodes (fed in through
+    observe()). Every model's decode time is predicted from its ``ModelProfile``,
+    scaled by the p95 ratio of observed to predicted time over its last ``window``
+    decodes, so routing adapts to the machine. A model that is not loaded also pays
+    its load time. If no model fits the budget, the fastest one is used.
+
+    Models load on first use; preload() warms the one an utterance as long as the
+    last would be routed to. Loading one that would push the total past
+    ``memory_budget_mb`` first unloads the least recently used models.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[tuple[str, ASREngine]],
+        latency_target_seconds: float = 1.5,
+        memory_budget_mb: float = 1500.0,
+        profiles: dict[str, ModelProfile] | None = None,
+        window: int = 50,
+    ) -> None:
+        profiles = {**DEFAULT_PROFILES, **(profiles or {})}
+        self._routes = []
+        for name, engine in engines:
+            if profiles[name].memory_mb > memory_budget_mb:
+                logger.warning(
+                    "Not routing to '%s': it needs about %.0f MB, over the %.0f MB memory budget",
+                    name,
+                    profiles[name].memory_mb,
+                    memory_budget_mb,
+                )
+                continue
+            self._routes.append(_Route(name, engine, profiles[name], window))
+        if not self._routes:
+            raise ValueError(f"No model fits in a {memory_budget_mb:.0f} MB memory budget")
+        self._latency_target = latency_target_seconds
+        self._memory_budget_mb = memory_budget_mb
+        self._overhead: deque[float] = deque(maxlen=window)
+        self._recent: OrderedDict[str, _Route] = OrderedDict()  # least recently used first
+        self._current = self._routes[0]
+        self._last_audio_seconds = 0.0
+        self._lock = threading.Lock()
+        logger.info(
+            "Routing between %s with a %.2fs latency target",
+            ", ".join(route.name for route in self._routes),
+            latency_target_seconds,
+        )
+
+    @property
+    def status(self) -> ModelStatus:
+        return self._current.engine.status
+
+    @property
+    def current_model(self) -> str:
+        """The model that decoded the last utterance."""
+        return self._current.name
+
+    def preload(self) -> None:
+        # The next utterance's length isn't known yet; guess it matches the last one
+        route = self._choose(self._last_audio_seconds)
+        self._make_room(route)
+        route.engine.preload()
+
+    def ensure_loaded(self) -> None:
+        # Which model to wait for depends on the audio, so transcribe_segments() loads it
+        pass
+
+    def decode_budget(self) -> float:
+        """Seconds left for decoding once the rest of the pipeline's p95 time is taken out."""
+        with self._lock:
+            overhead = float(np.percentile(self._overhead, 95)) if self._overhead else 0.0
+        return self._latency_target - overhead
+
+    def choose(self, audio_seconds: float) -> str:
+        """Name of the model the next ``audio_seconds`` long utterance would be sent to."""
+        return self._choose(audio_seconds).name
+
+    def _choose(self, audio_seconds: float) -> _Route:
+        budget = self.decode_budget()
+        with self._lock:
+            predictions = [(route.predict(audio_seconds), route) for route in self._routes]
+        fitting = [route for seconds, route in predictions if seconds <= budget]
+        if fitting:
+            return fitting[-1]
+        return min(predictions, key=lambda p: p[0])[1]
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
+        return " ".join(self.transcribe_segments(audio, sample_rate))
+
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000) -> Iterator[str]:
+        if audio.size == 0:
+            return
+        audio_seconds = len(audio) / sample_rate
+        self._last_audio_seconds = audio_seconds
+        route = self._choose(audio_seconds)
+        logger.info(
+            "Routing %.1fs of audio to '%s' (budget %.2fs, predicted %.2fs)",
+            audio_seconds,
+            route.name,
+            self.decode_budget(),
+            route.predict(audio_seconds),
+        )
+        self._make_room(route)
+        self._current = route
+        # Load outside the timed span so observed ratios reflect decoding alone
+        route.engine.ensure_loaded()
+        start = time.perf_counter()
+        yield from route.engine.transcribe_segments(audio, sample_rate)
+        with self._lock:
+            route.observe(audio_seconds, time.perf_counter() - start)
+
+    def start_stream(self, sample_rate: int = 16000) -> TranscriptionStream:
+        # The length is unknown while recording, so keep the model that is already loaded
+        return self._current.engine.start_stream(sample_rate)
+
+    def observe(self, metrics: UtteranceMetrics) -> None:
+        """Learn how much of the hotkey-to-paste time the stages around the decode take."""
+        if "total" not in metrics.stages:
+            return
+        decode = metrics.stages.get("decode", 0.0) + metrics.stages.get("model_wait", 0.0)
+        with self._lock:
+            self._overhead.append(max(0.0, metrics.stages["total"] - decode))
+
+    def _make_room(self, route: _Route) -> None:
+        """Unload least recently used models until ``route`` fits in the memory budget."""
+        with self._lock:
+            self._recent.pop(route.name, None)
+            self._recent[route.name] = route
+            resident = [r for r in self._recent.values() if r is not route and r.loaded]
+            used = sum(r.profile.memory_mb for r in resident)
+            for other in resident:
+                if used + route.profile.memory_mb <= self._memory_budget_mb:
+                    break
+                unload = getattr(other.engine, "unload", None)
+                if unload is not None and unload():
+                    logger.info("Unloaded '%s' to make room for '%s'", other.name, route.name)
+                    used -= other.profile.memory_mb
@@ -0,0 +1,132 @@
+"""Windowed incremental transcription shared by all ASR engines."""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Iterator
+
+import numpy as np
+
+from dictate.asr.base import PartialTranscript, TranscriptionStream
+
+logger = logging.getLogger(__name__)
+
+# (audio, sample_rate, prompt) -> text
+DecodeFn = Callable[[np.ndarray, int, str], str]
+
+_CUT_FRAME_SECONDS = 0.02
+_MIN_TAIL_SECONDS = 1.0
+
+
+class WindowedTranscriptionStream:
+    """Commits audio in fixed-length windows and decodes each one as soon as it fills.
+
+    Windows are cut at the quietest 20 ms frame near their end so words are not
+    split across a boundary. The tail of the stable text is passed to the decoder
+    as a prompt to keep context from one window to the next.
+
+    Not thread-safe: feed() and finish() must be called from one thread at a time.
+    """
+
+    def __init__(
+        self,
+        decode: DecodeFn,
+        sample_rate: int = 16000,
+        window_seconds: float = 10.0,
+        cut_search_seconds: float = 1.0,
+        prompt_chars: int = 200,
+    ) -> None:
+        self._decode = decode
+        self._sample_rate = sample_rate
+        self._window = max(1, int(window_seconds * sample_rate))
+        # Never search more than a quarter of the window so windows stay close to full length
+        self._cut_search = min(self._window // 4, int(cut_search_seconds * sample_rate))
+        self._prompt_chars = prompt_chars
+        self._pending = np.empty(0, dtype=np.float32)
+        self._stable: list[str] = []
+        self._windows_committed = 0
+
+    @property
+    def stable_text(self) -> str:
+        return " ".join(self._stable)
+
+    @property
+    def windows_committed(self) -> int:
+        return self._windows_committed
+
+    @property
+    def pending_samples(self) -> int:
+        return len(self._pending)
+
+    def feed(self, audio: np.ndarray, decode_tail: bool = False) -> PartialTranscript:
+        if audio.size:
+            audio = np.asarray(audio, dtype=np.float32).ravel()
+            self._pending = np.concatenate((self._pending, audio))
+
+        while len(self._pending) >= self._window:
+            cut = self._cut_point()
+            self._commit(self._pending[:cut])
+            self._pending = self._pending[cut:]
+
+        provisional = ""
+        if decode_tail and len(self._pending) >= _MIN_TAIL_SECONDS * self._sample_rate:
+            provisional = self._decode(self._pending, self._sample_rate, self._prompt())
+        return PartialTranscript(stable=self.stable_text, provisional=provisional)
+
+    def finish(self) -> str:
+        if self._pending.size:
+            self._commit(self._pending)
+            self._pending = np.empty(0, dtype=np.float32)
+        return self.stable_text
+
+    def _commit(self, window: np.ndarray) -> None:
+        text = self._decode(window, self._sample_rate, self._prompt()).strip()
+        self._windows_committed += 1
+        logger.debug(
+            "Committed window %d (%.1fs): %s",
+            self._windows_committed,
+            len(window) / self._sample_rate,
+            text,
+        )
+        if text:
+            self._stable.append(text)
+
+    def _prompt(self) -> str:
+        return self.stable_text[-self._prompt_chars:]
+
+    def _cut_point(self) -> int:
+        """Return a cut index in the middle of the quietest frame near the end of the window."""
+        frame = max(1, int(_CUT_FRAME_SECONDS * self._sample_rate))
+        n_frames = self._cut_search // frame
+        if n_frames == 0:
+            return self._window
+        search_start = self._window - n_frames * frame
+        frames = self._pending[search_start:self._window].reshape(n_frames, frame)
+        energy = np.einsum("ij,ij->i", frames, frames)
+        # Prefer the latest of equally quiet frames to keep windows long
+        quietest = n_frames - 1 - int(np.argmin(energy[::-1]))
+        return search_start + quietest * frame + frame // 2
+
+
+def transcribe_in_blocks(stream: TranscriptionStream, audio: np.ndarray, block_frames: int) -> str:
+    """Feed ``audio`` to ``stream`` one block at a time and return the full text.
+
+    Only the current block and the stream's pending window are ever copied into RAM,
+    so a disk-backed (``np.memmap``) recording is decoded without materializing it.
+    """
+    for start in range(0, len(audio), block_frames):
+        stream.feed(audio[start:start + block_frames])
+    return stream.finish()
+
+
+def iter_blocks(stream: TranscriptionStream, audio: np.ndarray, block_frames: int) -> Iterator[str]:
+    """Like transcribe_in_blocks(), but yield the text of each window as it is committed."""
+    stable = ""
+    for start in range(0, len(audio), block_frames):
+        partial = stream.feed(audio[start:start + block_frames])
+        if len(partial.stable) > len(stable):
+            yield partial.stable[len(stable):].strip()
+            stable = partial.stable
+    final = stream.finish()
+    if len(final) > len(stable):
+        yield final[len(stable):].strip()
@@ -4,33 +4,201 @@ from __future__ import annotations
 
 import io
 import logging
+import time
+from typing import Any, Iterator
+from urllib.parse import urlsplit
 
 import numpy as np
-from scipy.io import wavfile
+
+from dictate.asr.base import ModelState, ModelStatus
+from dictate.asr.flac import encode_flac
+from dictate.asr.longform import transcribe_long_form
+from dictate.asr.streaming import (
+    WindowedTranscriptionStream,
+    iter_blocks,
+    transcribe_in_blocks,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
 
 class WhisperAPIEngine:
-    """Transcribes audio via the OpenAI Whisper API."""
+    """Transcribes audio via the OpenAI Whisper API.
+
+    Audio is uploaded as 16-bit FLAC, about half the size of the equivalent WAV, and
+    sent as it is encoded. One
+    SDK client is shared by every request, so its connection pool keeps connections
+    alive across requests, and it retries rate limits and server errors with backoff
+    and honors the usual proxy environment variables. Recordings at least
+    ``long_form_seconds`` long are split at silences and their chunks uploaded
+    ``upload_workers`` at a time, then stitched back together in order.
+
+    Args:
+        api_key: OpenAI API key.
+        base_url: API root; any server with a compatible ``/audio/transcriptions``.
+        model: Transcription model name.
+        stream_window_seconds: Window length for streaming and disk-backed audio.
+        upload_workers: Concurrent chunk uploads for long recordings.
+        long_form_seconds: Recording length at which chunked uploads kick in.
+        timeout_seconds: Timeout per request attempt.
+        max_retries: Retries of connection errors, 429s and 5xx responses.
+    """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        model: str = "whisper-1",
+        stream_window_seconds: float = 10.0,
+        upload_workers: int = 4,
+        long_form_seconds: float = 60.0,
+        timeout_seconds: float = 30.0,
+        max_retries: int = 2,
+    ) -> None:
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"Invalid OpenAI base URL: {base_url!r}")
         from openai import OpenAI
 
-        self._client = OpenAI(api_key=api_key)
+        self._client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout_seconds,
+            max_retries=max_retries,
+        )
+        self._model = model
+        self._stream_window_seconds = stream_window_seconds
+        self._upload_workers = max(1, upload_workers)
+        self._long_form_seconds = long_form_seconds
+
+    @property
+    def status(self) -> ModelStatus:
+        # Nothing to load locally; the remote model is always ready
+        return ModelStatus(state=ModelState.READY)
+
+    def preload(self) -> None:
+        pass
+
+    def ensure_loaded(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Close the client's kept-alive connections."""
+        self._client.close()
 
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         if audio.size == 0:
             return ""
-        # Convert float32 [-1, 1] to int16 WAV in memory
-        audio_int16 = (audio * 32767).astype(np.int16)
-        buf = io.BytesIO()
-        wavfile.write(buf, sample_rate, audio_int16)
-        buf.seek(0)
-        buf.name = "audio.wav"
+        if isinstance(audio, np.memmap):
+            # Disk-backed capture: decode window by window instead of loading it all
+            block_frames = int(self._stream_window_seconds * sample_rate)
+            return transcribe_in_blocks(self.start_stream(sample_rate), audio, block_frames)
+        if self._is_long_form(audio, sample_rate):
+            return " ".join(self._decode_long_form(audio, sample_rate))
+        return self._decode(audio, sample_rate)
+
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000) -> Iterator[str]:
+        if audio.size == 0:
+            return
+        if isinstance(audio, np.memmap):
+            block_frames = int(self._stream_window_seconds * sample_rate)
+            yield from iter_blocks(self.start_stream(sample_rate), audio, block_frames)
+            return
+        if self._is_long_form(audio, sample_rate):
+            yield from self._decode_long_form(audio, sample_rate)
+            return
+        # The API returns the whole transcript at once
+        yield self._decode(audio, sample_rate)
+
+    def start_stream(self, sample_rate: int = 16000) -> WindowedTranscriptionStream:
+        return WindowedTranscriptionStream(
+            self._decode,
+            sample_rate=sample_rate,
+            window_seconds=self._stream_window_seconds,
+        )
+
+    def _is_long_form(self, audio: np.ndarray, sample_rate: int) -> bool:
+        return self._upload_workers > 1 and len(audio) >= self._long_form_seconds * sample_rate
 
+    def _decode_long_form(self, audio: np.ndarray, sample_rate: int) -> Iterator[str]:
+        """Upload a long recording as silence-bounded chunks, several at a time."""
+        start = time.perf_counter()
+        yield from transcribe_long_form(
+            self._decode, audio, sample_rate, workers=self._upload_workers
+        )
+        logger.info(
+            "Transcribed %.1fs of audio in %.2fs over %d upload(s) at a time",
+            len(audio) / sample_rate,
+            time.perf_counter() - start,
+            self._upload_workers,
+        )
+
+    def _decode(self, audio: np.ndarray, sample_rate: int = 16000, prompt: str = "") -> str:
+        start = time.perf_counter()
+        upload = _StreamingUpload(encode_flac(audio, sample_rate))
+        options: dict[str, Any] = {"prompt": prompt} if prompt else {}
         transcript = self._client.audio.transcriptions.create(
-            model="whisper-1",
-            file=buf,
+            model=self._model,
+            file=("audio.flac", io.BufferedReader(upload), "audio/flac"),
+            **options,
+        )
+        logger.debug(
+            "Uploaded %.1fs of audio as %d bytes in %.2fs",
+            len(audio) / sample_rate,
+            upload.size,
+            time.perf_counter() - start,
         )
         return transcript.text.strip()
+
+
+class _StreamingUpload(io.RawIOBase):
+    """Readable file over a stream of bytes, produced as the HTTP client reads it.
+
+    The SDK sends a file of unknown length chunked, so FLAC encoding overlaps the
+    upload. Bytes already produced are kept, which lets the client seek back to the
+    start and replay them when it retries a request.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._produced = bytearray()
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes produced so far; the whole upload once it has been sent."""
+        return len(self._produced)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            # The length is unknown until the last chunk has been produced
+            raise io.UnsupportedOperation("can only seek within bytes already read")
+        if not 0 <= offset <= len(self._produced):
+            raise io.UnsupportedOperation("can only seek within bytes already read")
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer: Any) -> int:
+        while self._position == len(self._produced):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._produced += chunk
+        n = min(len(buffer), len(self._produced) - self._position)
+        buffer[:n] = self._produced[self._position:self._position + n]
+        self._position += n
+        return n
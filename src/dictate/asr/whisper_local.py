@@ -2,25 +2,104 @@
 
 from __future__ import annotations
 
+import gc
 import logging
+import os
 import threading
+import time
+from dataclasses import replace
+from typing import Iterator
 
 import numpy as np
 from faster_whisper import WhisperModel
 
+from dictate.asr.base import ModelState, ModelStatus
+from dictate.asr.longform import transcribe_long_form
+from dictate.asr.streaming import (
+    WindowedTranscriptionStream,
+    iter_blocks,
+    transcribe_in_blocks,
+)
+from dictate.memory import current_rss_bytes, format_bytes
+
 logger = logging.getLogger(__name__)
 
+_DEFAULT_PROMPT = (
+    "Hello, welcome. I'd like to discuss the following topics, and please use proper punctuation."
+)
+
+# Length of the synthetic silence decoded to warm up CTranslate2 after loading
+_WARMUP_SECONDS = 1.0
+
 
 class WhisperLocalEngine:
     """Transcribes audio locally using faster-whisper (CTranslate2)."""
 
-    def __init__(self, model_size: str = "base", language: str = "en") -> None:
+    def __init__(
+        self,
+        model_size: str = "base",
+        language: str = "en",
+        stream_window_seconds: float = 10.0,
+        idle_unload_seconds: float = 0.0,
+        cpu_threads: int = 0,
+        parallel_workers: int = 1,
+        long_form_seconds: float = 60.0,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        beam_size: int = 3,
+    ) -> None:
         self._model_size = model_size
         self._language = language
+        self._stream_window_seconds = stream_window_seconds
+        self._idle_unload_seconds = idle_unload_seconds
+        self._cpu_threads = cpu_threads  # 0 lets CTranslate2 pick
+        self._device = device
+        self._compute_type = compute_type
+        self._beam_size = beam_size
+        # Recordings at least long_form_seconds long are split at silences and their
+        # chunks decoded concurrently by parallel_workers CTranslate2 workers
+        self._parallel_workers = max(1, parallel_workers)
+        self._long_form_seconds = long_form_seconds
         self._model: WhisperModel | None = None
         self._load_lock = threading.Lock()
+        self._active = 0  # decodes currently using the model; guarded by _load_lock
+        self._idle_timer: threading.Timer | None = None
+        self._timer_lock = threading.Lock()
+        self._status = ModelStatus()
         logger.info("WhisperLocalEngine initialized (model will load on first use)")
 
+    @property
+    def status(self) -> ModelStatus:
+        return self._status
+
+    def preload(self, warm_up: bool = True) -> None:
+        """Load the model and run a warm-up decode on a background thread.
+
+        Also restarts the idle-unload countdown, so calling this when a recording
+        starts both keeps a loaded model resident and reloads an unloaded one while
+        the user is still talking.
+        """
+        self._touch()
+        if self._model is not None or self._status.state is ModelState.LOADING:
+            return
+        threading.Thread(
+            target=self._preload, args=(warm_up,), name="whisper-preload", daemon=True
+        ).start()
+
+    def _preload(self, warm_up: bool) -> None:
+        try:
+            self._ensure_model_loaded()
+            if warm_up:
+                self._warm_up()
+        except Exception:
+            logger.exception("Background preload of Whisper model '%s' failed", self._model_size)
+        finally:
+            self._touch()
+
+    def ensure_loaded(self) -> None:
+        self._touch()
+        self._ensure_model_loaded()
+
     def _ensure_model_loaded(self) -> None:
         """Lazy-load the Whisper model on first transcription (thread-safe)."""
         if self._model is not None:
@@ -29,21 +108,174 @@ class WhisperLocalEngine:
             # Double-check after acquiring lock
             if self._model is None:
                 logger.info("Loading Whisper model '%s' (this may take a few seconds)...", self._model_size)
-                self._model = WhisperModel(self._model_size, device="cpu", compute_type="int8")
-                logger.info("Whisper model loaded successfully.")
+                self._status = ModelStatus(state=ModelState.LOADING)
+                start = time.perf_counter()
+                try:
+                    self._model = WhisperModel(
+                        self._model_size,
+                        device=self._device,
+                        compute_type=self._compute_type,
+                        cpu_threads=self._threads_per_worker(),
+                        num_workers=self._parallel_workers,
+                    )
+                except Exception as e:
+                    self._status = ModelStatus(state=ModelState.FAILED, error=str(e))
+                    raise
+                elapsed = time.perf_counter() - start
+                self._status = ModelStatus(state=ModelState.READY, load_seconds=elapsed)
+                logger.info("Whisper model loaded successfully in %.2fs.", elapsed)
+
+    def _threads_per_worker(self) -> int:
+        """Split the cores between parallel workers unless cpu_threads was set explicitly."""
+        if self._cpu_threads or self._parallel_workers == 1:
+            return self._cpu_threads
+        return max(1, (os.cpu_count() or 1) // self._parallel_workers)
+
+    def _acquire_model(self) -> WhisperModel:
+        """Load the model if needed and pin it so an idle unload cannot release it mid-decode."""
+        while True:
+            self._ensure_model_loaded()
+            with self._load_lock:
+                if self._model is not None:
+                    self._active += 1
+                    return self._model
+
+    def _release_model(self) -> None:
+        with self._load_lock:
+            self._active -= 1
+        self._touch()
+
+    def _warm_up(self) -> None:
+        """Decode synthetic silence so the first dictation skips CTranslate2's first-call cost."""
+        model = self._acquire_model()
+        self._status = replace(self._status, state=ModelState.WARMING_UP)
+        start = time.perf_counter()
+        try:
+            segments, _info = model.transcribe(
+                np.zeros(int(_WARMUP_SECONDS * 16000), dtype=np.float32),
+                language=self._language,
+                beam_size=self._beam_size,
+                vad_filter=False,  # VAD would drop the silence and skip the decoder entirely
+            )
+            list(segments)  # segments is lazy; consume it to actually run the decoder
+        finally:
+            elapsed = time.perf_counter() - start
+            self._status = replace(self._status, state=ModelState.READY, warmup_seconds=elapsed)
+            self._release_model()
+        logger.info("Whisper model warmed up in %.2fs.", elapsed)
+
+    def unload(self) -> bool:
+        """Release the Whisper model and free its memory. It reloads transparently on next use.
+
+        Returns:
+            False if there was no model to unload or a decode is still using it.
+        """
+        with self._load_lock:
+            if self._model is None or self._active:
+                return False
+            model, self._model = self._model, None
+
+        rss_before = current_rss_bytes()
+        try:
+            # Free the CTranslate2 weights now, even if a stray reference keeps the wrapper alive
+            model.model.unload_model()
+        except Exception:
+            logger.debug("CTranslate2 unload_model() failed", exc_info=True)
+        del model
+        gc.collect()
+        rss_after = current_rss_bytes()
+
+        freed = rss_before - rss_after if rss_before is not None and rss_after is not None else None
+        self._status = ModelStatus(state=ModelState.UNLOADED, freed_bytes=freed)
+        logger.info(
+            "Unloaded Whisper model '%s': RSS %s -> %s (freed %s)",
+            self._model_size,
+            format_bytes(rss_before),
+            format_bytes(rss_after),
+            format_bytes(freed),
+        )
+        return True
+
+    def _touch(self) -> None:
+        """Restart the idle-unload countdown."""
+        if self._idle_unload_seconds <= 0:
+            return
+        with self._timer_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            self._idle_timer = threading.Timer(self._idle_unload_seconds, self._on_idle)
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+
+    def _on_idle(self) -> None:
+        if self._model is not None:
+            logger.info("Whisper model idle for %.0fs, unloading", self._idle_unload_seconds)
+            self.unload()
 
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         if audio.size == 0:
             return ""
+        if isinstance(audio, np.memmap):
+            # Disk-backed capture: decode window by window instead of loading it all
+            block_frames = int(self._stream_window_seconds * sample_rate)
+            return transcribe_in_blocks(self.start_stream(sample_rate), audio, block_frames)
+        if self._is_long_form(audio, sample_rate):
+            return " ".join(self._decode_long_form(audio, sample_rate))
+        return self._decode(audio, sample_rate)
 
-        self._ensure_model_loaded()
-        assert self._model is not None  # for type checker
-
-        segments, _info = self._model.transcribe(
-            audio,
-            language=self._language,
-            beam_size=3,
-            vad_filter=True,
-            initial_prompt="Hello, welcome. I'd like to discuss the following topics, and please use proper punctuation.",
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000) -> Iterator[str]:
+        if audio.size == 0:
+            return
+        if isinstance(audio, np.memmap):
+            block_frames = int(self._stream_window_seconds * sample_rate)
+            yield from iter_blocks(self.start_stream(sample_rate), audio, block_frames)
+            return
+        if self._is_long_form(audio, sample_rate):
+            yield from self._decode_long_form(audio, sample_rate)
+            return
+        yield from self._decode_segments(audio, sample_rate)
+
+    def start_stream(self, sample_rate: int = 16000) -> WindowedTranscriptionStream:
+        return WindowedTranscriptionStream(
+            self._decode,
+            sample_rate=sample_rate,
+            window_seconds=self._stream_window_seconds,
         )
-        return " ".join(seg.text.strip() for seg in segments).strip()
+
+    def _is_long_form(self, audio: np.ndarray, sample_rate: int) -> bool:
+        return self._parallel_workers > 1 and len(audio) >= self._long_form_seconds * sample_rate
+
+    def _decode_long_form(self, audio: np.ndarray, sample_rate: int) -> Iterator[str]:
+        """Decode a long recording as silence-bounded chunks spread over the workers."""
+        start = time.perf_counter()
+        yield from transcribe_long_form(
+            self._decode, audio, sample_rate, workers=self._parallel_workers
+        )
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "Long-form decode took %.2fs (RTF %.3f)",
+            elapsed,
+            elapsed / (len(audio) / sample_rate),
+        )
+
+    def _decode(self, audio: np.ndarray, sample_rate: int = 16000, prompt: str = "") -> str:
+        """Decode one block of audio, optionally conditioned on preceding text."""
+        return " ".join(self._decode_segments(audio, sample_rate, prompt)).strip()
+
+    def _decode_segments(
+        self, audio: np.ndarray, sample_rate: int = 16000, prompt: str = ""
+    ) -> Iterator[str]:
+        """Yield segment texts as faster-whisper decodes them; the model stays pinned until done."""
+        model = self._acquire_model()
+        try:
+            segments, _info = model.transcribe(
+                audio,
+                language=self._language,
+                beam_size=self._beam_size,
+                vad_filter=True,
+                initial_prompt=prompt or _DEFAULT_PROMPT,
+            )
+            for seg in segments:
+                yield seg.text.strip()
+        finally:
+            self._release_model()
@@ -0,0 +1,45 @@
+"""Protocol interfaces for the audio input behind the recorder."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Protocol
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# PortAudio's callback signature: (indata of shape (frames, channels), frames, time_info, status)
+AudioCallback = Callable[["np.ndarray", int, object, object], None]
+
+
+class InputStream(Protocol):
+    """An open input stream that calls back with blocks of audio while started."""
+
+    def start(self) -> None:
+        """Begin delivering audio to the callback."""
+        ...
+
+    def stop(self) -> None:
+        """Stop delivering audio, after the callback in progress (if any) returns."""
+        ...
+
+    def close(self) -> None:
+        """Release the device."""
+        ...
+
+
+class AudioSource(Protocol):
+    """Somewhere float32 audio can be captured from."""
+
+    def native_format(self) -> tuple[int, int]:
+        """The device's own sample rate and channel count, which capture at no conversion."""
+        ...
+
+    def open_stream(
+        self, sample_rate: int, callback: AudioCallback, channels: int = 1
+    ) -> InputStream:
+        """Open the device for capture at ``sample_rate``, without starting it.
+
+        Opening can take a noticeable time (tens to hundreds of milliseconds for a
+        real device), which is what an always-open stream avoids paying per recording.
+        """
+        ...
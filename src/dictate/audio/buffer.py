@@ -0,0 +1,215 @@
+"""Growable preallocated sample buffer for real-time audio capture."""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import threading
+from typing import IO
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioBuffer:
+    """1-D float32 buffer made of fixed-size blocks that are never moved.
+
+    Capacity is always a multiple of ``block_frames``. Appending copies the
+    incoming samples into the free space of the last block; when it is full a
+    new block is added, so the real-time audio callback never copies samples
+    it already stored, however long the recording gets.
+
+    ``view()`` returns a zero-copy view when the samples lie in one block and
+    joins the blocks into a new array otherwise. Samples that have been written
+    are never modified, so views stay valid while appending continues.
+
+    A single writer thread may append while other threads call ``view()``.
+    """
+
+    def __init__(self, block_frames: int = 16000 * 30, initial_blocks: int = 1) -> None:
+        if block_frames <= 0:
+            raise ValueError(f"block_frames must be positive, got {block_frames}")
+        self._block_frames = block_frames
+        self._blocks = [self._new_block(i) for i in range(max(1, initial_blocks))]
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        return len(self._blocks) * self._block_frames
+
+    def append(self, samples: np.ndarray) -> None:
+        """Copy ``samples`` (any shape, flattened) onto the end of the buffer."""
+        flat = samples.reshape(-1)
+        size = self._block_frames
+        blocks = self._blocks
+        length = self._length
+        end = length + len(flat)
+        while len(blocks) * size < end:
+            blocks.append(self._new_block(len(blocks)))
+        index, offset = divmod(length, size)
+        if offset + len(flat) <= size:
+            blocks[index][offset:offset + len(flat)] = flat
+        else:
+            # Split across block boundaries
+            written = 0
+            while written < len(flat):
+                n = min(size - offset, len(flat) - written)
+                blocks[index][offset:offset + n] = flat[written:written + n]
+                written += n
+                index, offset = index + 1, 0
+        # Publish the new length only after the samples are in place
+        self._length = end
+
+    def view(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Return the written samples in ``[start, stop)``, zero-copy within one block."""
+        length = self._length
+        stop = length if stop is None else min(stop, length)
+        start = min(start, stop)
+        size = self._block_frames
+        first = start // size
+        if stop - start <= size - start % size:
+            block = self._blocks[first] if start < self.capacity else self._blocks[-1][:0]
+            return block[start - first * size:stop - first * size]
+        return self._join(start, stop)
+
+    def close(self) -> None:
+        """Release resources beyond the samples themselves; views taken earlier stay valid."""
+
+    def _join(self, start: int, stop: int) -> np.ndarray:
+        size = self._block_frames
+        last = (stop - 1) // size
+        blocks = self._blocks[start // size:last + 1]
+        joined = np.concatenate(blocks[:-1] + [blocks[-1][:stop - last * size]])
+        return joined[start % size:]
+
+    def _new_block(self, index: int) -> np.ndarray:
+        return np.empty(self._block_frames, dtype=np.float32)
+
+
+class SpillingAudioBuffer(AudioBuffer):
+    """AudioBuffer that keeps new blocks in a memory-mapped temp file past a size threshold.
+
+    The first ``spill_frames`` (rounded down to whole blocks) stay in RAM, as in AudioBuffer.
+    Every later block is a memory map of its own region of an anonymous temp file,
+    so resident memory stays flat for very long recordings: written pages are
+    flushed by the OS and can be evicted at any time. Adding a block extends the
+    file and maps the new region, without copying.
+
+    Once spilled, views spanning several blocks are ``np.memmap`` slices of the
+    whole file, so the RAM blocks are written to it the first time one is taken
+    (on the reading thread, never the audio callback). The temp file is unlinked
+    on creation; close() (or garbage collection) closes it, and the disk space is
+    freed once the maps held by views are gone too.
+    """
+
+    def __init__(
+        self,
+        block_frames: int = 16000 * 30,
+        spill_frames: int = 16000 * 300,
+        directory: str | None = None,
+    ) -> None:
+        self._file: IO[bytes] | None = None
+        self._flush_lock = threading.Lock()
+        # A block never holds more than the threshold, so spilling starts on time
+        block_frames = min(block_frames, max(1, spill_frames))
+        self._ram_blocks = max(1, spill_frames // max(1, block_frames))
+        self._directory = directory
+        self._ram_flushed = False
+        super().__init__(block_frames)
+
+    @property
+    def spilled(self) -> bool:
+        return len(self._blocks) > self._ram_blocks
+
+    def close(self) -> None:
+        """Close the temp file. Views stay valid; later multi-block views are copies."""
+        with self._flush_lock:
+            file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def _new_block(self, index: int) -> np.ndarray:
+        if index < self._ram_blocks:
+            return super()._new_block(index)
+        block_bytes = self._block_frames * np.dtype(np.float32).itemsize
+        if self._file is None:
+            # Outlives this call: close() and __del__ close it
+            self._file = tempfile.TemporaryFile(  # noqa: SIM115
+                prefix="dictate-", suffix=".f32", dir=self._directory
+            )
+            logger.info(
+                "Recording passed %d samples, spilling capture to disk",
+                self._ram_blocks * self._block_frames,
+            )
+        self._file.truncate((index + 1) * block_bytes)
+        return np.memmap(
+            self._file, dtype=np.float32, mode="r+", offset=index * block_bytes,
+            shape=(self._block_frames,),
+        )
+
+    def _join(self, start: int, stop: int) -> np.ndarray:
+        with self._flush_lock:
+            file = self._file
+            if file is None:
+                return super()._join(start, stop)
+            if not self._ram_flushed:
+                # Spilling only starts once the RAM blocks are full, so they never change
+                mapped = np.memmap(
+                    file, dtype=np.float32, mode="r+",
+                    shape=(self._ram_blocks * self._block_frames,),
+                )
+                mapped[:] = np.concatenate(self._blocks[:self._ram_blocks])
+                mapped.flush()
+                self._ram_flushed = True
+            return np.memmap(file, dtype=np.float32, mode="r", shape=(stop,))[start:]
+
+
+class RingBuffer:
+    """Fixed-size circular float32 buffer that keeps only the most recent samples.
+
+    The storage is allocated once, so writing from the real-time audio callback never
+    allocates: each write is at most two slice assignments.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 0:
+            raise ValueError(f"capacity must not be negative, got {capacity}")
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self._end = 0  # index one past the newest sample
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def write(self, samples: np.ndarray) -> None:
+        """Add ``samples`` (any shape, flattened), dropping the oldest beyond capacity."""
+        capacity = len(self._data)
+        flat = samples.reshape(-1)[-capacity:] if capacity else samples.reshape(-1)[:0]
+        n = len(flat)
+        first = min(n, capacity - self._end)
+        self._data[self._end:self._end + first] = flat[:first]
+        self._data[:n - first] = flat[first:]
+        self._end = (self._end + n) % capacity if capacity else 0
+        self._length = min(capacity, self._length + n)
+
+    def read(self) -> np.ndarray:
+        """Return a copy of the buffered samples, oldest first."""
+        start = self._end - self._length
+        if start >= 0:
+            return self._data[start:self._end].copy()
+        return np.concatenate((self._data[start:], self._data[:self._end]))
+
+    def clear(self) -> None:
+        self._end = 0
+        self._length = 0
@@ -0,0 +1,31 @@
+"""The default microphone, through PortAudio (sounddevice)."""
+
+from __future__ import annotations
+
+from dictate.audio.base import AudioCallback, InputStream
+
+# Inputs past the first two on an audio interface are separate sources, not one mic
+_MAX_CHANNELS = 2
+
+
+class SoundDeviceSource:
+    """Captures from the system's default input device."""
+
+    def native_format(self) -> tuple[int, int]:
+        import sounddevice as sd
+
+        info = sd.query_devices(kind="input")
+        channels = min(max(1, int(info["max_input_channels"])), _MAX_CHANNELS)
+        return int(info["default_samplerate"]), channels
+
+    def open_stream(
+        self, sample_rate: int, callback: AudioCallback, channels: int = 1
+    ) -> InputStream:
+        import sounddevice as sd
+
+        return sd.InputStream(
+            samplerate=sample_rate,
+            channels=channels,
+            dtype="float32",
+            callback=callback,
+        )
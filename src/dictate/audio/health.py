@@ -0,0 +1,122 @@
+"""Capture-health accounting for the real-time audio callback."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CaptureHealth:
+    """How cleanly one recording was captured.
+
+    Attributes:
+        callbacks: Audio callbacks received.
+        overflows: Callbacks PortAudio flagged with an input overflow (samples dropped
+            because the callback wasn't serviced in time).
+        gaps: Discontinuities in the device's capture timestamps.
+        lost_seconds: Audio missing across those gaps.
+        block_seconds: Audio per callback, i.e. the time budget of each callback.
+        mean_callback_seconds: Average time spent inside the callback.
+        max_callback_seconds: Longest time spent inside the callback.
+        max_interval_seconds: Longest wait between two callbacks; much more than
+            ``block_seconds`` means the audio thread was starved.
+    """
+
+    callbacks: int = 0
+    overflows: int = 0
+    gaps: int = 0
+    lost_seconds: float = 0.0
+    block_seconds: float = 0.0
+    mean_callback_seconds: float = 0.0
+    max_callback_seconds: float = 0.0
+    max_interval_seconds: float = 0.0
+
+    @property
+    def degraded(self) -> bool:
+        """Whether audio was lost or the callback couldn't keep up with the device."""
+        return bool(
+            self.overflows
+            or self.gaps
+            or (self.block_seconds and self.max_callback_seconds > self.block_seconds)
+        )
+
+    def summary(self) -> str:
+        """One-line log form."""
+        return (
+            f"{self.callbacks} callbacks, {self.overflows} overflow(s), {self.gaps} gap(s) "
+            f"({self.lost_seconds * 1000:.0f}ms lost), "
+            f"callback mean {self.mean_callback_seconds * 1e6:.0f}us "
+            f"max {self.max_callback_seconds * 1e6:.0f}us, "
+            f"max interval {self.max_interval_seconds * 1000:.1f}ms "
+            f"(block {self.block_seconds * 1000:.1f}ms)"
+        )
+
+
+class CaptureMonitor:
+    """Counts overflows and timestamp gaps and times the callback, a few operations per call.
+
+    Written only from the audio thread; snapshot() is read after the stream has
+    stopped delivering to the recording, so no locking is needed.
+    """
+
+    # Timestamp jitter tolerated before a discontinuity counts as a gap, in blocks
+    _GAP_TOLERANCE_BLOCKS = 0.5
+
+    def __init__(self, sample_rate: int) -> None:
+        self._sample_rate = sample_rate
+        self.reset()
+
+    def reset(self) -> None:
+        self._callbacks = 0
+        self._overflows = 0
+        self._gaps = 0
+        self._lost_seconds = 0.0
+        self._frames = 0
+        self._busy_seconds = 0.0
+        self._max_callback_seconds = 0.0
+        self._max_interval_seconds = 0.0
+        self._last_entry: float | None = None
+        self._next_adc_time: float | None = None
+
+    def enter(self, frames: int, time_info: object, status: object) -> float:
+        """Account for a callback's arguments; returns the entry time to pass to leave()."""
+        now = time.perf_counter()
+        if self._last_entry is not None:
+            self._max_interval_seconds = max(self._max_interval_seconds, now - self._last_entry)
+        self._last_entry = now
+        self._callbacks += 1
+        self._frames += frames
+        if status and getattr(status, "input_overflow", False):
+            self._overflows += 1
+
+        # Some host APIs report 0 for the capture time; only trust increasing stamps
+        adc_time = getattr(time_info, "inputBufferAdcTime", 0.0) or 0.0
+        if adc_time > 0:
+            block = frames / self._sample_rate
+            if self._next_adc_time is not None:
+                late = adc_time - self._next_adc_time
+                if late > self._GAP_TOLERANCE_BLOCKS * block:
+                    self._gaps += 1
+                    self._lost_seconds += late
+            self._next_adc_time = adc_time + block
+        return now
+
+    def leave(self, entered: float) -> None:
+        elapsed = time.perf_counter() - entered
+        self._busy_seconds += elapsed
+        if elapsed > self._max_callback_seconds:
+            self._max_callback_seconds = elapsed
+
+    def snapshot(self) -> CaptureHealth:
+        callbacks = self._callbacks
+        return CaptureHealth(
+            callbacks=callbacks,
+            overflows=self._overflows,
+            gaps=self._gaps,
+            lost_seconds=self._lost_seconds,
+            block_seconds=self._frames / callbacks / self._sample_rate if callbacks else 0.0,
+            mean_callback_seconds=self._busy_seconds / callbacks if callbacks else 0.0,
+            max_callback_seconds=self._max_callback_seconds,
+            max_interval_seconds=self._max_interval_seconds,
+        )
@@ -2,59 +2,271 @@
 
 from __future__ import annotations
 
+import logging
 import threading
+import time
+from typing import TYPE_CHECKING
 
-import numpy as np
-import sounddevice as sd
+from dictate.audio.health import CaptureHealth, CaptureMonitor
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from dictate.audio.base import AudioSource, InputStream
+    from dictate.audio.buffer import AudioBuffer, RingBuffer
+    from dictate.audio.resample import Resampler
+
+logger = logging.getLogger(__name__)
+
+# Capture buffers are preallocated and grown in blocks of this many seconds
+_BLOCK_SECONDS = 30
 
 
 class AudioRecorder:
-    """Records audio from the default microphone into a numpy array."""
+    """Records audio from the default microphone into a numpy array.
+
+    By default the input stream is opened on every start() and closed on stop(), so
+    the device's open time delays the first sample and can clip the first syllable.
+    With ``always_on`` the stream stays open between recordings and the last
+    ``preroll_seconds`` of audio are kept in a preallocated ring buffer; start() then
+    only prepends that pre-roll and switches the callback to recording.
 
-    def __init__(self, sample_rate: int = 16000) -> None:
+    Every callback is checked for input overflows and gaps in the device's capture
+    timestamps, and timed; ``last_capture`` holds the totals for the recording that
+    stop() last returned.
+
+    With ``native_rate`` the stream is opened at the device's own sample rate and
+    channel count instead of asking PortAudio to convert, and each block is downmixed
+    and resampled to ``sample_rate`` in the callback, so read() and stop() still
+    return mono audio at ``sample_rate``.
+
+    Args:
+        source: Where audio comes from (default: the microphone, via sounddevice).
+        always_on: Keep the input stream open between recordings.
+        preroll_seconds: Audio from before start() to include, with ``always_on``.
+        native_rate: Capture in the device's native format and convert in-process.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        capture_backend: str = "memory",
+        disk_spill_seconds: float = 300.0,
+        source: AudioSource | None = None,
+        always_on: bool = False,
+        preroll_seconds: float = 0.5,
+        native_rate: bool = False,
+    ) -> None:
         self.sample_rate = sample_rate
-        self._chunks: list[np.ndarray] = []
-        self._stream: sd.InputStream | None = None
+        self._capture_backend = capture_backend
+        self._disk_spill_seconds = disk_spill_seconds
+        self._source = source
+        self._always_on = always_on
+        self._preroll_seconds = preroll_seconds
+        self._native_rate = native_rate
+        # Set when the open stream's format differs from ``sample_rate`` mono
+        self._resampler: Resampler | None = None
+        # Created on first start(), so numpy and PortAudio load when recording begins
+        self._buffer: AudioBuffer | None = None
+        self._preroll: RingBuffer | None = None
+        self._stream: InputStream | None = None
         self._lock = threading.Lock()
+        # Taken by the audio callback too, so keep what runs under it short
+        self._capture_lock = threading.Lock()
         self._recording = False
+        self._start_time = 0.0
+        self._start_latency: float | None = None
+        self._monitor = CaptureMonitor(sample_rate)
+        self._last_capture: CaptureHealth | None = None
 
     @property
     def is_recording(self) -> bool:
         return self._recording
 
+    @property
+    def start_latency(self) -> float | None:
+        """Seconds from the last start() until it had a first sample, None while waiting.
+
+        With a pre-roll, the samples are already there when start() returns.
+        """
+        return self._start_latency
+
+    @property
+    def last_capture(self) -> CaptureHealth | None:
+        """Capture health of the recording stop() last returned."""
+        return self._last_capture
+
+    def open(self) -> None:
+        """Open and start the always-on input stream now, e.g. at app launch.
+
+        Otherwise the first start() opens it. Does nothing without ``always_on``.
+        """
+        if not self._always_on:
+            return
+        with self._lock:
+            self._open_warm_stream()
+
+    def close(self) -> None:
+        """Stop any recording and release the input device."""
+        self.stop()
+        with self._lock:
+            if self._stream is not None:
+                self._stream.stop()
+                self._stream.close()
+                self._stream = None
+
     def start(self) -> None:
         """Start recording audio."""
         with self._lock:
             if self._recording:
                 return
-            self._chunks = []
-            self._stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype="float32",
-                callback=self._audio_callback,
-            )
-            self._stream.start()
-            self._recording = True
+            self._start_time = time.perf_counter()
+            self._start_latency = None
+            # A fresh buffer per recording: the previous one may still be in use
+            # by a transcription holding the view returned from stop(), which
+            # stays valid after close().
+            previous = self._buffer
+            buffer = self._new_buffer()
+            if self._always_on:
+                self._open_warm_stream()
+                preroll = self._preroll
+                assert preroll is not None
+                with self._capture_lock:
+                    self._monitor.reset()
+                    if len(preroll):
+                        buffer.append(preroll.read())
+                        preroll.clear()
+                        self._start_latency = time.perf_counter() - self._start_time
+                    self._buffer = buffer
+                    self._recording = True
+            else:
+                self._buffer = buffer
+                self._stream = stream = self._open_stream()
+                stream.start()
+                self._recording = True
+            if previous is not None:
+                previous.close()
 
     def stop(self) -> np.ndarray:
-        """Stop recording and return the captured audio as a 1-D float32 array."""
+        """Stop recording and return the captured audio as a 1-D float32 array.
+
+        Recordings that fit in one capture block come back as a zero-copy view;
+        longer ones are joined here, off the audio callback. With the ``disk``
+        capture backend, recordings longer than ``disk_spill_seconds`` come back
+        as an ``np.memmap`` backed by a temp file.
+        """
         with self._lock:
             if not self._recording or self._stream is None:
-                return np.array([], dtype=np.float32)
+                return _empty()
+            buffer = self._buffer
+            assert buffer is not None
+            if self._always_on:
+                with self._capture_lock:
+                    self._recording = False
+                    self._last_capture = self._monitor.snapshot()
+                return buffer.view()
             self._stream.stop()
             self._stream.close()
             self._stream = None
+            if self._resampler is not None:
+                # The filter's last few milliseconds of output wait on input that won't come
+                buffer.append(self._resampler.flush())
             self._recording = False
-            if not self._chunks:
-                return np.array([], dtype=np.float32)
-            return np.concatenate(self._chunks).flatten()
+            self._last_capture = self._monitor.snapshot()
+            return buffer.view()
+
+    def _open_warm_stream(self) -> None:
+        """Open the always-on stream if it isn't already; the caller holds ``_lock``."""
+        if self._stream is not None:
+            return
+        from dictate.audio.buffer import RingBuffer
+
+        self._preroll = RingBuffer(int(self._preroll_seconds * self.sample_rate))
+        start = time.perf_counter()
+        self._stream = stream = self._open_stream()
+        stream.start()
+        logger.info(
+            "Opened always-on input stream in %.0f ms (%.0f ms pre-roll)",
+            (time.perf_counter() - start) * 1000,
+            self._preroll_seconds * 1000,
+        )
+
+    def _open_stream(self) -> InputStream:
+        """Open (not start) a stream, in the device's native format with ``native_rate``."""
+        source = self._get_source()
+        sample_rate, channels = self.sample_rate, 1
+        if self._native_rate:
+            sample_rate, channels = source.native_format()
+        self._resampler = None
+        if (sample_rate, channels) != (self.sample_rate, 1):
+            from dictate.audio.resample import Resampler
+
+            self._resampler = Resampler(sample_rate, self.sample_rate)
+            logger.info(
+                "Capturing %d channel(s) at %d Hz, converting to mono %d Hz",
+                channels,
+                sample_rate,
+                self.sample_rate,
+            )
+        # Block timing is in device frames
+        self._monitor = CaptureMonitor(sample_rate)
+        return source.open_stream(sample_rate, self._audio_callback, channels)
+
+    def _get_source(self) -> AudioSource:
+        if self._source is None:
+            from dictate.audio.device import SoundDeviceSource
+
+            self._source = SoundDeviceSource()
+        return self._source
+
+    def _new_buffer(self) -> AudioBuffer:
+        from dictate.audio.buffer import AudioBuffer, SpillingAudioBuffer
+
+        block_frames = self.sample_rate * _BLOCK_SECONDS
+        if self._capture_backend == "disk":
+            return SpillingAudioBuffer(
+                block_frames=block_frames,
+                spill_frames=int(self._disk_spill_seconds * self.sample_rate),
+            )
+        return AudioBuffer(block_frames=block_frames)
+
+    def read(self, start: int = 0) -> np.ndarray:
+        """Return the samples captured so far, from sample index ``start`` onward.
+
+        The result is a zero-copy view unless it spans capture blocks. Safe to call
+        from another thread while recording is in progress.
+        """
+        buffer = self._buffer
+        return _empty() if buffer is None else buffer.view(start)
 
     def _audio_callback(
         self,
         indata: np.ndarray,
         frames: int,
         time_info: object,
-        status: sd.CallbackFlags,
+        status: object,
     ) -> None:
-        self._chunks.append(indata.copy())
+        entered = self._monitor.enter(frames, time_info, status)
+        if self._resampler is not None:
+            indata = self._resampler.process(indata)
+        if self._always_on:
+            with self._capture_lock:
+                if not self._recording:
+                    assert self._preroll is not None
+                    self._preroll.write(indata)
+                    self._monitor.leave(entered)
+                    return
+                assert self._buffer is not None
+                self._buffer.append(indata)
+        else:
+            assert self._buffer is not None
+            self._buffer.append(indata)
+        if self._start_latency is None:
+            self._start_latency = entered - self._start_time
+        self._monitor.leave(entered)
+
+
+def _empty() -> np.ndarray:
+    import numpy as np
+
+    return np.array([], dtype=np.float32)
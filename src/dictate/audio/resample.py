@@ -0,0 +1,137 @@
+"""Streaming polyphase resampling and downmixing for device-native capture."""
+
+from __future__ import annotations
+
+from math import ceil, gcd
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# Outputs computed per gather in the general path, bounding its scratch memory
+_GATHER_BLOCK = 8192
+
+
+def downmix(block: np.ndarray) -> np.ndarray:
+    """Average a ``(frames, channels)`` block to mono; 1-D and one-channel input pass through."""
+    if block.ndim == 1:
+        return block
+    if block.shape[1] == 1:
+        return block[:, 0]
+    return block.mean(axis=1, dtype=np.float32)
+
+
+def resample(samples: np.ndarray, in_rate: int, out_rate: int) -> np.ndarray:
+    """Resample a whole signal; the result has ``ceil(len * out_rate / in_rate)`` samples."""
+    resampler = Resampler(in_rate, out_rate)
+    return np.concatenate((resampler.process(samples), resampler.flush()))
+
+
+class Resampler:
+    """Rational-ratio polyphase resampler that can be fed a block at a time.
+
+    Uses the same Kaiser-windowed sinc filter as ``scipy.signal.resample_poly``
+    (``zero_crossings`` on each side of the peak, at the lower of the two Nyquist
+    frequencies) and compensates its delay the same way, so feeding a signal through
+    process() in blocks of any size, then flush(), gives what resample_poly returns
+    for the whole signal, without scipy on the capture path.
+
+    Each output is one dot product of a filter phase with the input window under it.
+    When a block yields many outputs per phase, each phase's outputs are one
+    matrix-vector product over a strided view of the input (no copies); small blocks
+    gather windows and phases and reduce them in a single einsum.
+    """
+
+    def __init__(
+        self, in_rate: int, out_rate: int, zero_crossings: int = 10, beta: float = 5.0
+    ) -> None:
+        if in_rate <= 0 or out_rate <= 0:
+            raise ValueError(f"Sample rates must be positive, got {in_rate} -> {out_rate}")
+        divisor = gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self._up = up = out_rate // divisor
+        self._down = down = in_rate // divisor
+        half_length = zero_crossings * max(up, down)
+        length = 2 * half_length + 1
+        self._taps = taps = ceil(length / up)
+
+        offsets = np.arange(length) - half_length
+        prototype = np.sinc(offsets / max(up, down)) * np.kaiser(length, beta)
+        prototype *= up / prototype.sum()
+        padded = np.zeros(up * taps)
+        padded[:length] = prototype
+        # Row p holds taps p, p + up, p + 2*up, ... reversed, to dot with input windows
+        self._phases = np.ascontiguousarray(padded.reshape(taps, up).T[:, ::-1], dtype=np.float32)
+        self._delay = half_length
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all input, as if newly created."""
+        self._history = np.zeros(self._taps - 1, dtype=np.float32)
+        # Index of the first history sample in the input; negative while it is padding
+        self._history_start = 1 - self._taps
+        self._frames_in = 0
+        self._frames_out = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Feed samples, 1-D or ``(frames, channels)`` to downmix first.
+
+        Returns every output that no longer depends on later input.
+        """
+        samples = downmix(samples)
+        self._frames_in += len(samples)
+        if self._up == self._down:
+            self._frames_out += len(samples)
+            return np.array(samples, dtype=np.float32)
+
+        up, down, taps = self._up, self._down, self._taps
+        data = np.concatenate((self._history, samples.astype(np.float32, copy=False)))
+        available = self._history_start + len(data)
+        first = self._frames_out
+        last = max(first, (available * up - 1 - self._delay) // down + 1)
+        out = np.empty(last - first, dtype=np.float32)
+        if len(out):
+            windows = as_strided(
+                data, (len(data) - taps + 1, taps), (data.strides[0], data.strides[0])
+            )
+            if len(out) >= 8 * up:
+                self._by_phase(windows, first, out)
+            else:
+                self._gathered(windows, first, out)
+
+        self._frames_out = last
+        self._history = data[len(data) - (taps - 1):].copy()
+        self._history_start = available - (taps - 1)
+        return out
+
+    def flush(self) -> np.ndarray:
+        """Return the outputs still waiting on input past the end, then reset()."""
+        if self._up == self._down:
+            self.reset()
+            return np.empty(0, dtype=np.float32)
+        total = -(-self._frames_in * self._up // self._down)
+        needed = ((total - 1) * self._down + self._delay) // self._up + 1 - self._frames_in
+        out = self.process(np.zeros(max(0, needed), dtype=np.float32))
+        out = out[:max(0, len(out) - (self._frames_out - total))]
+        self.reset()
+        return out
+
+    def _by_phase(self, windows: np.ndarray, first: int, out: np.ndarray) -> None:
+        # Outputs n and n + up use the same phase, with windows ``down`` samples apart
+        up, down = self._up, self._down
+        for residue in range(up):
+            count = (len(out) - residue + up - 1) // up
+            position = (first + residue) * down + self._delay
+            start = position // up - (self._taps - 1) - self._history_start
+            rows = windows[start:start + (count - 1) * down + 1:down]
+            out[residue::up] = rows @ self._phases[position % up]
+
+    def _gathered(self, windows: np.ndarray, first: int, out: np.ndarray) -> None:
+        for block in range(0, len(out), _GATHER_BLOCK):
+            positions = np.arange(
+                first + block, first + min(len(out), block + _GATHER_BLOCK)
+            ) * self._down + self._delay
+            starts = positions // self._up - (self._taps - 1) - self._history_start
+            out[block:block + len(positions)] = np.einsum(
+                "nk,nk->n", windows[starts], self._phases[positions % self._up]
+            )
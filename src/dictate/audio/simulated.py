@@ -0,0 +1,175 @@
+"""Simulated audio input that behaves like a PortAudio stream, for tests and benchmarks."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from dictate.audio.base import AudioCallback
+
+
+@dataclass(frozen=True)
+class SimulatedTimeInfo:
+    """The fields of PortAudio's time_info the recorder reads."""
+
+    inputBufferAdcTime: float  # PortAudio's field name
+
+
+@dataclass(frozen=True)
+class SimulatedStatus:
+    """The fields of PortAudio's callback status flags the recorder reads."""
+
+    input_overflow: bool = False
+
+    def __bool__(self) -> bool:
+        return self.input_overflow
+
+
+class SimulatedSource:
+    """Plays ``signal`` (looped, silence by default) into the callback in real time.
+
+    ``signal`` is 1-D, or ``(frames, channels)`` for a multi-channel device, and is
+    delivered as-is at whatever rate the stream is opened with; ``native_rate`` and
+    ``channels`` are only what native_format() reports.
+
+    Like a real device, opening a stream takes ``open_seconds`` and the first block
+    arrives ``start_seconds`` after start(), on a separate thread, with later blocks
+    paced at one every ``blocksize / sample_rate`` seconds and stamped with their
+    capture time. If the callback falls more than ``buffer_blocks`` blocks behind, the
+    backlog is dropped and the next block is flagged as an input overflow, as PortAudio
+    does when its buffer fills. ``drop_blocks`` loses the blocks at those indices
+    (counted from each stream's start) the same way, to inject dropouts on demand.
+
+    Attributes:
+        streams_opened: How many streams have been opened, i.e. device open costs paid.
+    """
+
+    def __init__(
+        self,
+        signal: np.ndarray | None = None,
+        blocksize: int = 160,
+        open_seconds: float = 0.0,
+        start_seconds: float = 0.0,
+        buffer_blocks: int = 8,
+        native_rate: int = 16000,
+        channels: int = 1,
+        drop_blocks: Iterable[int] = (),
+    ) -> None:
+        self._signal = signal
+        self._blocksize = blocksize
+        self._open_seconds = open_seconds
+        self._start_seconds = start_seconds
+        self._buffer_blocks = buffer_blocks
+        self._native_rate = native_rate
+        self._channels = channels
+        self._drop_blocks = frozenset(drop_blocks)
+        self.streams_opened = 0
+
+    def native_format(self) -> tuple[int, int]:
+        return self._native_rate, self._channels
+
+    def open_stream(
+        self, sample_rate: int, callback: AudioCallback, channels: int = 1
+    ) -> _SimulatedStream:
+        time.sleep(self._open_seconds)
+        self.streams_opened += 1
+        signal = self._signal
+        if signal is None or signal.size == 0:
+            signal = np.zeros(self._blocksize, dtype=np.float32)
+        signal = signal.astype(np.float32).reshape(len(signal), -1)
+        if signal.shape[1] != channels:
+            signal = np.repeat(signal[:, :1], channels, axis=1)
+        return _SimulatedStream(
+            signal,
+            sample_rate,
+            self._blocksize,
+            self._start_seconds,
+            self._buffer_blocks,
+            self._drop_blocks,
+            callback,
+        )
+
+
+class _SimulatedStream:
+    def __init__(
+        self,
+        signal: np.ndarray,
+        sample_rate: int,
+        blocksize: int,
+        start_seconds: float,
+        buffer_blocks: int,
+        drop_blocks: frozenset[int],
+        callback: AudioCallback,
+    ) -> None:
+        self._signal = signal
+        self._period = blocksize / sample_rate
+        self._blocksize = blocksize
+        self._start_seconds = start_seconds
+        self._buffer_blocks = buffer_blocks
+        self._drop_blocks = drop_blocks
+        self._callback = callback
+        self._position = 0
+        self._running = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="simulated-audio", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        # Reused for every block, like the buffer PortAudio hands its callbacks
+        indata = np.empty((self._blocksize, self._signal.shape[1]), dtype=np.float32)
+        first_block = time.monotonic() + self._start_seconds
+        block = 0
+        dropped = False
+        while True:
+            due = first_block + block * self._period
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            if not self._running.is_set():
+                return
+            if block in self._drop_blocks:
+                block += 1
+                self._skip(self._blocksize)
+                dropped = True
+                continue
+            behind = int((time.monotonic() - due) / self._period)
+            overflow = dropped or behind > self._buffer_blocks
+            dropped = False
+            if behind > self._buffer_blocks:
+                # The device kept capturing into a full buffer: those blocks are gone
+                block += behind
+                self._skip(behind * self._blocksize)
+            indata[:] = self._next_samples()
+            self._callback(
+                indata,
+                self._blocksize,
+                SimulatedTimeInfo(inputBufferAdcTime=first_block + block * self._period),
+                SimulatedStatus(input_overflow=overflow),
+            )
+            block += 1
+
+    def _next_samples(self) -> np.ndarray:
+        indices = (self._position + np.arange(self._blocksize)) % len(self._signal)
+        self._skip(self._blocksize)
+        return self._signal[indices]
+
+    def _skip(self, frames: int) -> None:
+        self._position = (self._position + frames) % len(self._signal)
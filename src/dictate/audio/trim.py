@@ -0,0 +1,76 @@
+"""Energy-based trimming of leading and trailing silence before ASR."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class TrimResult:
+    """Voiced region of a recording.
+
+    Attributes:
+        audio: Zero-copy view of ``original[start:end]``, or the original array
+            itself when nothing was trimmed.
+        start: First kept sample.
+        end: One past the last kept sample. Equal to ``start`` if the clip is silent.
+        original_samples: Length of the untrimmed recording.
+    """
+
+    audio: np.ndarray
+    start: int
+    end: int
+    original_samples: int
+
+    @property
+    def is_silent(self) -> bool:
+        return self.end <= self.start
+
+    @property
+    def trimmed_samples(self) -> int:
+        return self.original_samples - (self.end - self.start)
+
+
+def trim_silence(
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    threshold_db: float = -50.0,
+    frame_ms: float = 20.0,
+    padding_ms: float = 200.0,
+) -> TrimResult:
+    """Drop silent frames from the head and tail of ``audio``.
+
+    Frame energy is computed in one vectorized pass over a reshaped view, so no
+    copy of the recording is made (a disk-backed recording is only paged through).
+    A frame is voiced when its RMS level exceeds ``threshold_db`` dBFS. ``padding_ms``
+    of audio is kept on each side of the voiced region so word onsets and decays
+    are not clipped.
+    """
+    total = len(audio)
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = total // frame
+    # Compare mean-square energy against the threshold instead of taking sqrt/log per frame
+    threshold = 10.0 ** (threshold_db / 10.0)
+
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    voiced = np.flatnonzero(np.einsum("ij,ij->i", frames, frames) > threshold * frame)
+
+    remainder = audio[n_frames * frame:]
+    tail_voiced = (
+        remainder.size > 0 and float(np.dot(remainder, remainder)) > threshold * remainder.size
+    )
+
+    if voiced.size == 0 and not tail_voiced:
+        return TrimResult(audio=audio[:0], start=0, end=0, original_samples=total)
+
+    padding = int(sample_rate * padding_ms / 1000)
+    first = voiced[0] * frame if voiced.size else n_frames * frame
+    last = total if tail_voiced else (voiced[-1] + 1) * frame
+    start = max(0, int(first) - padding)
+    end = min(total, int(last) + padding)
+
+    if start == 0 and end == total:
+        return TrimResult(audio=audio, start=0, end=total, original_samples=total)
+    return TrimResult(audio=audio[start:end], start=start, end=end, original_samples=total)
@@ -0,0 +1,343 @@
+"""Offline transcription of folders of recordings on a process pool."""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Protocol
+
+from dictate.asr.base import ASREngine
+from dictate.processing.base import TextProcessor
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = (".wav", ".flac")
+
+EngineFactory = Callable[[], ASREngine]
+
+
+@dataclass(frozen=True)
+class FileResult:
+    """Outcome of transcribing one file.
+
+    Attributes:
+        path: Path of the audio file relative to the input directory.
+        text: Cleaned transcript; empty when ``error`` is set.
+        audio_seconds: Length of the recording.
+        decode_seconds: Time spent decoding and cleaning up, excluding file loading.
+        error: Failure message, or empty on success.
+    """
+
+    path: str
+    text: str
+    audio_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    error: str = ""
+
+
+@dataclass
+class BatchStats:
+    """Throughput of a batch run."""
+
+    files: int = 0
+    failed: int = 0
+    skipped: int = 0
+    audio_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    def add(self, result: FileResult) -> None:
+        if result.error:
+            self.failed += 1
+            return
+        self.files += 1
+        self.audio_seconds += result.audio_seconds
+        self.decode_seconds += result.decode_seconds
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def rtf(self) -> float:
+        """Wall-clock real-time factor of the whole run (lower is faster)."""
+        return self.wall_seconds / self.audio_seconds if self.audio_seconds > 0 else 0.0
+
+    @property
+    def decode_rtf(self) -> float:
+        """Per-worker real-time factor: decode time per second of audio."""
+        return self.decode_seconds / self.audio_seconds if self.audio_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.files} files ({self.failed} failed, {self.skipped} skipped) in "
+            f"{self.wall_seconds:.1f}s | {self.files_per_second:.2f} files/s | "
+            f"audio {self.audio_seconds:.1f}s | "
+            f"RTF {self.rtf:.3f} (per worker {self.decode_rtf:.3f})"
+        )
+
+
+class ResultWriter(Protocol):
+    """Destination for batch results, written as each file finishes."""
+
+    def completed(self) -> set[str]:
+        """Relative paths that already have a transcript, for resuming a run."""
+        ...
+
+    def write(self, result: FileResult) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonlWriter:
+    """Appends one JSON object per file to a single ``.jsonl`` file.
+
+    The file is opened for each result rather than held open, so every line is on disk
+    once write() returns; decoding a file takes far longer than reopening it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._started = False
+
+    def completed(self) -> set[str]:
+        if not self._path.exists():
+            return set()
+        done: set[str] = set()
+        with open(self._path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # partial last line from an interrupted run
+                if not record.get("error"):
+                    done.add(record["path"])
+        return done
+
+    def write(self, result: FileResult) -> None:
+        line = json.dumps(asdict(result), ensure_ascii=False) + "\n"
+        if not self._started:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            if self._path.exists() and not _ends_with_newline(self._path):
+                line = "\n" + line  # finish the partial line an interrupted run left behind
+            self._started = True
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def close(self) -> None:
+        pass
+
+
+class TextWriter:
+    """Writes each transcript to ``<relative path>.txt`` under an output directory.
+
+    Sources that would share a transcript (``a.wav`` and ``a.flac``) keep their audio
+    extension instead (``a.wav.txt``, ``a.flac.txt``).
+    """
+
+    def __init__(self, directory: Path, sources: Iterable[str] = ()) -> None:
+        self._directory = directory
+        self._sources = list(sources)
+        stems = Counter(Path(rel).with_suffix("").as_posix() for rel in self._sources)
+        self._shared = {stem for stem, count in stems.items() if count > 1}
+
+    def _target(self, relative: str) -> Path:
+        if Path(relative).with_suffix("").as_posix() in self._shared:
+            return self._directory / f"{relative}.txt"
+        return (self._directory / relative).with_suffix(".txt")
+
+    def completed(self) -> set[str]:
+        return {rel for rel in self._sources if self._target(rel).exists()}
+
+    def write(self, result: FileResult) -> None:
+        if result.error:
+            return
+        target = self._target(result.path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so an interrupted run never leaves a truncated transcript behind
+        partial_path = target.with_name(target.name + ".part")
+        partial_path.write_text(result.text + "\n", encoding="utf-8")
+        os.replace(partial_path, target)
+
+    def close(self) -> None:
+        pass
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def find_audio_files(directory: Path) -> list[Path]:
+    """All WAV/FLAC files under ``directory``, recursively, in a stable order."""
+    return sorted(
+        path for path in directory.rglob("*")
+        if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS
+    )
+
+
+def local_engine_factory(
+    model_size: str = "base",
+    language: str = "en",
+    cpu_threads: int = 0,
+    device: str = "cpu",
+    compute_type: str = "int8",
+    beam_size: int = 3,
+) -> EngineFactory:
+    """Picklable factory for a ``WhisperLocalEngine``, so each worker builds its own."""
+    return partial(
+        _create_local_engine, model_size, language, cpu_threads, device, compute_type, beam_size
+    )
+
+
+def _create_local_engine(
+    model_size: str,
+    language: str,
+    cpu_threads: int,
+    device: str = "cpu",
+    compute_type: str = "int8",
+    beam_size: int = 3,
+) -> ASREngine:
+    from dictate.asr.whisper_local import WhisperLocalEngine
+
+    return WhisperLocalEngine(
+        model_size=model_size,
+        language=language,
+        cpu_threads=cpu_threads,
+        device=device,
+        compute_type=compute_type,
+        beam_size=beam_size,
+    )
+
+
+def _load_audio(path: Path, sample_rate: int) -> np.ndarray:
+    # PyAV ships with faster-whisper and decodes WAV and FLAC, resampling to mono
+    from faster_whisper.audio import decode_audio
+
+    return decode_audio(str(path), sampling_rate=sample_rate)
+
+
+# Per-process state: each pool worker loads its own model once, in the initializer
+_worker_engine: ASREngine | None = None
+_worker_processor: TextProcessor | None = None
+
+
+def _init_worker(engine_factory: EngineFactory, cleanup: bool, dictionary_path: str = "") -> None:
+    global _worker_engine, _worker_processor
+    _worker_engine = engine_factory()
+    _worker_engine.ensure_loaded()
+    if cleanup:
+        from dictate.processing.regex_processor import RegexProcessor
+
+        _worker_processor = RegexProcessor(dictionary_path=dictionary_path or None)
+    else:
+        _worker_processor = None
+
+
+def _transcribe_file(path: Path, root: Path, sample_rate: int) -> FileResult:
+    assert _worker_engine is not None, "_init_worker runs first"
+    relative = path.relative_to(root).as_posix()
+    try:
+        audio = _load_audio(path, sample_rate)
+        start = time.perf_counter()
+        text = _worker_engine.transcribe(audio, sample_rate)
+        if _worker_processor is not None:
+            text = _worker_processor.process(text)
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        logger.exception("Failed to transcribe %s", relative)
+        return FileResult(path=relative, text="", error=str(e) or type(e).__name__)
+    return FileResult(
+        path=relative,
+        text=text,
+        audio_seconds=len(audio) / sample_rate,
+        decode_seconds=elapsed,
+    )
+
+
+def default_workers(cpu_threads: int) -> int:
+    """Enough workers to use every core when each gets ``cpu_threads`` threads."""
+    cores = os.cpu_count() or 1
+    return max(1, cores // max(1, cpu_threads))
+
+
+def transcribe_directory(
+    directory: Path,
+    writer: ResultWriter,
+    engine_factory: EngineFactory,
+    workers: int = 1,
+    cleanup: bool = True,
+    dictionary_path: str = "",
+    resume: bool = True,
+    sample_rate: int = 16000,
+    on_result: Callable[[FileResult], None] | None = None,
+) -> BatchStats:
+    """Transcribe every audio file under ``directory``, streaming results to ``writer``.
+
+    Each of ``workers`` processes loads one model and takes files as it frees up, so
+    results arrive in completion order rather than path order. With ``workers=0`` the
+    files are transcribed in this process, which is handy for debugging.
+
+    Args:
+        dictionary_path: User dictionary applied during cleanup (see DICTIONARY_PATH).
+        resume: Skip files the writer already has a transcript for.
+        on_result: Called in this process after each result is written.
+    """
+    files = find_audio_files(directory)
+    stats = BatchStats()
+    if resume:
+        done = writer.completed()
+        pending = [p for p in files if p.relative_to(directory).as_posix() not in done]
+        stats.skipped = len(files) - len(pending)
+        files = pending
+    if stats.skipped:
+        logger.info("Resuming: skipping %d already transcribed files", stats.skipped)
+
+    def handle(result: FileResult) -> None:
+        writer.write(result)
+        stats.add(result)
+        if on_result is not None:
+            on_result(result)
+
+    start = time.perf_counter()
+    try:
+        if workers <= 0:
+            _init_worker(engine_factory, cleanup, dictionary_path)
+            for path in files:
+                handle(_transcribe_file(path, directory, sample_rate))
+        elif files:
+            # spawn: forking a process that already holds CTranslate2 threads is unsafe
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(files)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(engine_factory, cleanup, dictionary_path),
+            ) as pool:
+                futures = [
+                    pool.submit(_transcribe_file, path, directory, sample_rate) for path in files
+                ]
+                for future in as_completed(futures):
+                    handle(future.result())
+    except BrokenProcessPool as e:
+        # Usually the model failed to load in the worker initializer; its traceback is logged
+        raise RuntimeError("A transcription worker exited unexpectedly") from e
+    finally:
+        stats.wall_seconds = time.perf_counter() - start
+        writer.close()
+    return stats
@@ -8,22 +8,62 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+# CTranslate2 compute types; which ones are fast depends on the device
+COMPUTE_TYPES = (
+    "default", "auto", "int8", "int8_float32", "int8_float16", "int8_bfloat16",
+    "int16", "float16", "bfloat16", "float32",
+)
+
 
 @dataclass(frozen=True)
 class Config:
     asr_engine: str = "local"
     whisper_model: str = "base"
+    whisper_models: tuple[str, ...] = ()
+    latency_target_seconds: float = 1.5
+    model_memory_budget_mb: float = 1500.0
     whisper_language: str = "en"
+    whisper_device: str = "cpu"
+    whisper_compute_type: str = "int8"
+    whisper_beam_size: int = 3
+    whisper_cpu_threads: int = 0
     openai_api_key: str = ""
+    openai_base_url: str = "https://api.openai.com/v1"
+    api_upload_workers: int = 4
+    hybrid_budget_seconds: float = 1.0
+    hybrid_deadline_seconds: float = 2.0
     text_processor: str = "regex"
+    dictionary_path: str = ""
+    ollama_host: str = "http://localhost:11434"
+    ollama_model: str = "llama3.2"
+    ollama_timeout_seconds: float = 2.0
+    text_cache_size: int = 256
+    text_cache_path: str = ""
     hotkey_backend: str = "pynput"
     hotkey_mode: str = "toggle"
     sample_rate: int = 16000
     enable_sound_feedback: bool = False
     show_preview_notification: bool = False
+    streaming_transcription: bool = False
+    stream_window_seconds: float = 10.0
+    capture_backend: str = "memory"
+    disk_spill_seconds: float = 300.0
+    capture_always_on: bool = False
+    preroll_ms: float = 500.0
+    capture_native_rate: bool = False
+    model_preload: bool = False
+    model_idle_unload_seconds: float = 0.0
+    parallel_decode_workers: int = 1
+    long_form_seconds: float = 60.0
+    trim_silence: bool = True
+    silence_threshold_db: float = -50.0
+    silence_padding_ms: float = 200.0
+    queue_size: int = 3
+    queue_full_policy: str = "block"
+    overlap_cleanup: bool = True
 
     def __post_init__(self) -> None:
-        valid_asr = ("local", "openai_api")
+        valid_asr = ("local", "openai_api", "hybrid")
         if self.asr_engine not in valid_asr:
             raise ValueError(f"ASR_ENGINE must be one of {valid_asr}, got '{self.asr_engine}'")
 
@@ -31,13 +71,73 @@ class Config:
         if self.whisper_model not in valid_models:
             raise ValueError(f"WHISPER_MODEL must be one of {valid_models}, got '{self.whisper_model}'")
 
-        if self.asr_engine == "openai_api" and not self.openai_api_key:
-            raise ValueError("OPENAI_API_KEY is required when ASR_ENGINE=openai_api")
+        valid_devices = ("cpu", "cuda", "auto")
+        if self.whisper_device not in valid_devices:
+            raise ValueError(
+                f"WHISPER_DEVICE must be one of {valid_devices}, got '{self.whisper_device}'"
+            )
+
+        if self.whisper_compute_type not in COMPUTE_TYPES:
+            raise ValueError(
+                f"WHISPER_COMPUTE_TYPE must be one of {COMPUTE_TYPES}, "
+                f"got '{self.whisper_compute_type}'"
+            )
+
+        if self.whisper_beam_size < 1:
+            raise ValueError(f"WHISPER_BEAM_SIZE must be at least 1, got {self.whisper_beam_size}")
+
+        if self.whisper_cpu_threads < 0:
+            raise ValueError(
+                "WHISPER_CPU_THREADS must be zero (automatic) or positive, "
+                f"got {self.whisper_cpu_threads}"
+            )
+
+        for model in self.whisper_models:
+            if model not in valid_models:
+                raise ValueError(f"WHISPER_MODELS entries must be in {valid_models}, got '{model}'")
+
+        if self.latency_target_seconds <= 0:
+            raise ValueError(
+                f"LATENCY_TARGET_SECONDS must be positive, got {self.latency_target_seconds}"
+            )
+
+        if self.model_memory_budget_mb <= 0:
+            raise ValueError(
+                f"MODEL_MEMORY_BUDGET_MB must be positive, got {self.model_memory_budget_mb}"
+            )
+
+        if self.asr_engine in ("openai_api", "hybrid") and not self.openai_api_key:
+            raise ValueError(f"OPENAI_API_KEY is required when ASR_ENGINE={self.asr_engine}")
+
+        if self.api_upload_workers < 1:
+            raise ValueError(
+                f"API_UPLOAD_WORKERS must be at least 1, got {self.api_upload_workers}"
+            )
+
+        if self.hybrid_budget_seconds <= 0:
+            raise ValueError(
+                f"HYBRID_BUDGET_SECONDS must be positive, got {self.hybrid_budget_seconds}"
+            )
+
+        if self.hybrid_deadline_seconds <= 0:
+            raise ValueError(
+                f"HYBRID_DEADLINE_SECONDS must be positive, got {self.hybrid_deadline_seconds}"
+            )
 
         valid_processors = ("regex", "ollama")
         if self.text_processor not in valid_processors:
             raise ValueError(f"TEXT_PROCESSOR must be one of {valid_processors}, got '{self.text_processor}'")
 
+        if self.ollama_timeout_seconds <= 0:
+            raise ValueError(
+                f"OLLAMA_TIMEOUT_SECONDS must be positive, got {self.ollama_timeout_seconds}"
+            )
+
+        if self.text_cache_size < 0:
+            raise ValueError(
+                f"TEXT_CACHE_SIZE must be zero (disabled) or positive, got {self.text_cache_size}"
+            )
+
         valid_hotkey = ("pynput", "pyobjc_fn")
         if self.hotkey_backend not in valid_hotkey:
             raise ValueError(f"HOTKEY_BACKEND must be one of {valid_hotkey}, got '{self.hotkey_backend}'")
@@ -46,6 +146,56 @@ class Config:
         if self.hotkey_mode not in valid_modes:
             raise ValueError(f"HOTKEY_MODE must be one of {valid_modes}, got '{self.hotkey_mode}'")
 
+        valid_backends = ("memory", "disk")
+        if self.capture_backend not in valid_backends:
+            raise ValueError(
+                f"CAPTURE_BACKEND must be one of {valid_backends}, got '{self.capture_backend}'"
+            )
+
+        if self.disk_spill_seconds <= 0:
+            raise ValueError(f"DISK_SPILL_SECONDS must be positive, got {self.disk_spill_seconds}")
+
+        if self.preroll_ms < 0:
+            raise ValueError(f"PREROLL_MS must not be negative, got {self.preroll_ms}")
+
+        if self.model_idle_unload_seconds < 0:
+            raise ValueError(
+                "MODEL_IDLE_UNLOAD_SECONDS must be zero (disabled) or positive, "
+                f"got {self.model_idle_unload_seconds}"
+            )
+
+        if self.parallel_decode_workers < 1:
+            raise ValueError(
+                f"PARALLEL_DECODE_WORKERS must be at least 1, got {self.parallel_decode_workers}"
+            )
+
+        if self.long_form_seconds <= 0:
+            raise ValueError(f"LONG_FORM_SECONDS must be positive, got {self.long_form_seconds}")
+
+        if self.silence_threshold_db >= 0:
+            raise ValueError(
+                f"SILENCE_THRESHOLD_DB must be negative (dBFS), got {self.silence_threshold_db}"
+            )
+
+        if self.silence_padding_ms < 0:
+            raise ValueError(
+                f"SILENCE_PADDING_MS must not be negative, got {self.silence_padding_ms}"
+            )
+
+        if self.queue_size < 1:
+            raise ValueError(f"TRANSCRIPTION_QUEUE_SIZE must be at least 1, got {self.queue_size}")
+
+        valid_policies = ("block", "drop_oldest", "drop_newest")
+        if self.queue_full_policy not in valid_policies:
+            raise ValueError(
+                f"QUEUE_FULL_POLICY must be one of {valid_policies}, got '{self.queue_full_policy}'"
+            )
+
+        if self.stream_window_seconds <= 0:
+            raise ValueError(
+                f"STREAM_WINDOW_SECONDS must be positive, got {self.stream_window_seconds}"
+            )
+
 
 def load_config(env_path: Path | None = None) -> Config:
     """Load configuration from .env file and environment variables."""
@@ -57,12 +207,48 @@ def load_config(env_path: Path | None = None) -> Config:
     return Config(
         asr_engine=os.getenv("ASR_ENGINE", "local").lower(),
         whisper_model=os.getenv("WHISPER_MODEL", "base").lower(),
+        whisper_models=tuple(
+            m.strip() for m in os.getenv("WHISPER_MODELS", "").lower().split(",") if m.strip()
+        ),
+        latency_target_seconds=float(os.getenv("LATENCY_TARGET_SECONDS", "1.5")),
+        model_memory_budget_mb=float(os.getenv("MODEL_MEMORY_BUDGET_MB", "1500")),
         whisper_language=os.getenv("WHISPER_LANGUAGE", "en").lower(),
+        whisper_device=os.getenv("WHISPER_DEVICE", "cpu").lower(),
+        whisper_compute_type=os.getenv("WHISPER_COMPUTE_TYPE", "int8").lower(),
+        whisper_beam_size=int(os.getenv("WHISPER_BEAM_SIZE", "3")),
+        whisper_cpu_threads=int(os.getenv("WHISPER_CPU_THREADS", "0")),
         openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+        openai_base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+        api_upload_workers=int(os.getenv("API_UPLOAD_WORKERS", "4")),
+        hybrid_budget_seconds=float(os.getenv("HYBRID_BUDGET_SECONDS", "1")),
+        hybrid_deadline_seconds=float(os.getenv("HYBRID_DEADLINE_SECONDS", "2")),
         text_processor=os.getenv("TEXT_PROCESSOR", "regex").lower(),
+        dictionary_path=os.getenv("DICTIONARY_PATH", ""),
+        ollama_host=os.getenv("OLLAMA_HOST", "http://localhost:11434"),
+        ollama_model=os.getenv("OLLAMA_MODEL", "llama3.2"),
+        ollama_timeout_seconds=float(os.getenv("OLLAMA_TIMEOUT_SECONDS", "2")),
+        text_cache_size=int(os.getenv("TEXT_CACHE_SIZE", "256")),
+        text_cache_path=os.getenv("TEXT_CACHE_PATH", ""),
         hotkey_backend=os.getenv("HOTKEY_BACKEND", "pynput").lower(),
         hotkey_mode=os.getenv("HOTKEY_MODE", "toggle").lower(),
         sample_rate=int(os.getenv("SAMPLE_RATE", "16000")),
         enable_sound_feedback=os.getenv("ENABLE_SOUND_FEEDBACK", "false").lower() == "true",
         show_preview_notification=os.getenv("SHOW_PREVIEW_NOTIFICATION", "false").lower() == "true",
+        streaming_transcription=os.getenv("STREAMING_TRANSCRIPTION", "false").lower() == "true",
+        stream_window_seconds=float(os.getenv("STREAM_WINDOW_SECONDS", "10")),
+        capture_backend=os.getenv("CAPTURE_BACKEND", "memory").lower(),
+        disk_spill_seconds=float(os.getenv("DISK_SPILL_SECONDS", "300")),
+        capture_always_on=os.getenv("CAPTURE_ALWAYS_ON", "false").lower() == "true",
+        preroll_ms=float(os.getenv("PREROLL_MS", "500")),
+        capture_native_rate=os.getenv("CAPTURE_NATIVE_RATE", "false").lower() == "true",
+        model_preload=os.getenv("MODEL_PRELOAD", "false").lower() == "true",
+        model_idle_unload_seconds=float(os.getenv("MODEL_IDLE_UNLOAD_SECONDS", "0")),
+        parallel_decode_workers=int(os.getenv("PARALLEL_DECODE_WORKERS", "1")),
+        long_form_seconds=float(os.getenv("LONG_FORM_SECONDS", "60")),
+        trim_silence=os.getenv("TRIM_SILENCE", "true").lower() == "true",
+        silence_threshold_db=float(os.getenv("SILENCE_THRESHOLD_DB", "-50")),
+        silence_padding_ms=float(os.getenv("SILENCE_PADDING_MS", "200")),
+        queue_size=int(os.getenv("TRANSCRIPTION_QUEUE_SIZE", "3")),
+        queue_full_policy=os.getenv("QUEUE_FULL_POLICY", "block").lower(),
+        overlap_cleanup=os.getenv("OVERLAP_CLEANUP", "true").lower() == "true",
     )
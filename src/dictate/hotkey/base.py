@@ -8,11 +8,12 @@ from typing import Callable, Protocol
 class HotkeyListener(Protocol):
     """Interface that all hotkey listeners must implement."""
 
-    def start(self, on_toggle: Callable[[], None]) -> None:
+    def start(self, on_toggle: Callable[[], bool | None]) -> None:
         """Start listening for the hotkey.
 
         Args:
-            on_toggle: Callback invoked each time the hotkey is pressed.
+            on_toggle: Callback invoked each time the hotkey is pressed. Returning
+                False means a start was refused, so hold-to-talk ignores the release.
         """
         ...
 
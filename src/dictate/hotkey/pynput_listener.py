@@ -16,15 +16,15 @@ class PynputHotkeyListener:
     def __init__(self, mode: str = "toggle") -> None:
         self._mode = mode
         self._listener: keyboard.Listener | keyboard.GlobalHotKeys | None = None
-        self._on_start: Callable[[], None] | None = None
-        self._on_stop: Callable[[], None] | None = None
+        self._on_start: Callable[[], bool | None] | None = None
+        self._on_stop: Callable[[], bool | None] | None = None
 
         # For hold-to-talk mode
         self._alt_pressed = False
         self._space_pressed = False
         self._recording = False
 
-    def start(self, on_toggle: Callable[[], None]) -> None:
+    def start(self, on_toggle: Callable[[], bool | None]) -> None:
         """Start listener in toggle mode (legacy interface for backward compatibility)."""
         if self._mode == "toggle":
             self._on_start = on_toggle
@@ -71,8 +71,12 @@ class PynputHotkeyListener:
             if self._alt_pressed and not self._recording:
                 self._recording = True
                 if self._on_start:
-                    logger.info("Hold-to-talk: Recording started")
-                    self._on_start()
+                    if self._on_start() is False:
+                        # Refused: the release must not start a recording instead
+                        logger.info("Hold-to-talk: Recording refused")
+                        self._recording = False
+                    else:
+                        logger.info("Hold-to-talk: Recording started")
 
     def _on_release_hold(self, key: keyboard.Key | keyboard.KeyCode | None) -> None:
         """Handle key release in hold-to-talk mode."""
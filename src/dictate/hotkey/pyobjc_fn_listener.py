@@ -21,9 +21,9 @@ class PyObjCFnListener:
 
     def __init__(self) -> None:
         self._monitor = None
-        self._on_toggle: Callable[[], None] | None = None
+        self._on_toggle: Callable[[], bool | None] | None = None
 
-    def start(self, on_toggle: Callable[[], None]) -> None:
+    def start(self, on_toggle: Callable[[], bool | None]) -> None:
         self._on_toggle = on_toggle
         try:
             from AppKit import NSEvent, NSFlagsChangedMask
@@ -0,0 +1,32 @@
+"""Protocol interfaces for the clipboard and keyboard used by text injection."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class Clipboard(Protocol):
+    """The system clipboard, as far as plain text goes."""
+
+    def read(self) -> str:
+        """Return the clipboard's text, or an empty string if it holds none."""
+        ...
+
+    def write(self, text: str) -> None:
+        """Replace the clipboard's contents with ``text``."""
+        ...
+
+    def change_count(self) -> int | None:
+        """A counter the system bumps on every clipboard change, or None if there is none.
+
+        Lets callers tell that a write has landed without comparing contents.
+        """
+        ...
+
+
+class Keyboard(Protocol):
+    """Synthetic key presses sent to the focused application."""
+
+    def paste(self) -> None:
+        """Press the paste shortcut (Cmd+V)."""
+        ...
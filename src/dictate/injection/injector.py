@@ -3,58 +3,226 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from dataclasses import dataclass
 
-import pyperclip
-from pynput.keyboard import Controller, Key
+from dictate.injection.base import Clipboard, Keyboard
 
 logger = logging.getLogger(__name__)
 
-_keyboard = Controller()
 
+@dataclass(frozen=True)
+class InjectionTiming:
+    """Where the time went in one injection, in seconds.
+
+    Attributes:
+        clipboard_wait: From writing the text until the clipboard showed it.
+        paste: Sending the paste shortcut.
+        total: The whole injection, which is what the dictation waits for.
+    """
+
+    clipboard_wait: float
+    paste: float
+    total: float
+
+
+class TextInjector:
+    """Pastes text into the focused app through the clipboard, then restores the clipboard.
+
+    Instead of sleeping for fixed intervals, it pastes as soon as the clipboard
+    reports the new text: by change count where the clipboard has one, otherwise by
+    reading it back, polling with exponential backoff for up to ``ready_timeout``.
+    The previous contents are restored ``restore_delay`` seconds later on a timer
+    thread, off the dictation's critical path, and only if nothing else has been
+    copied in the meantime. Restores that are still pending when the next injection
+    starts are folded into it, so the original clipboard is the one brought back.
+    """
+
+    def __init__(
+        self,
+        clipboard: Clipboard,
+        keyboard: Keyboard,
+        ready_timeout: float = 0.5,
+        restore_delay: float = 0.5,
+        poll_interval: float = 0.001,
+        max_poll_interval: float = 0.02,
+    ) -> None:
+        self._clipboard = clipboard
+        self._keyboard = keyboard
+        self._ready_timeout = ready_timeout
+        self._restore_delay = restore_delay
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        # Held for a whole injection or restore, so the two never interleave
+        self._lock = threading.RLock()
+        self._restore_timer: threading.Timer | None = None
+        # (clipboard text to bring back, what we wrote, change count after our write)
+        self._restore: tuple[str, str, int | None] | None = None
+        self._last_timing: InjectionTiming | None = None
+
+    @property
+    def last_timing(self) -> InjectionTiming | None:
+        """Timing of the most recent successful injection."""
+        return self._last_timing
+
+    def __call__(self, text: str) -> None:
+        self.inject(text)
+
+    def inject(self, text: str) -> bool:
+        """Paste ``text`` into the focused app.
+
+        Returns:
+            False if nothing was pasted. The text is then left on the clipboard so it
+            can be pasted by hand.
+        """
+        if not text:
+            logger.warning("inject_text called with empty text")
+            return False
+        with self._lock:
+            return self._inject(text)
+
+    def _inject(self, text: str) -> bool:
+        start = time.perf_counter()
+        previous = self._take_pending_restore()
+        if previous is None:
+            try:
+                previous = self._clipboard.read()
+            except Exception as e:
+                logger.warning("Failed to read clipboard: %s", e)
+
+        try:
+            before = self._clipboard.change_count()
+            self._clipboard.write(text)
+        except Exception as e:
+            logger.error("Failed to copy text to clipboard: %s", e)
+            return False
+
+        written = time.perf_counter()
+        try:
+            count = self._wait_until_written(text, before)
+        except TimeoutError:
+            logger.error(
+                "Clipboard did not show the text within %.0f ms; not pasting",
+                self._ready_timeout * 1000,
+            )
+            return False
+        ready = time.perf_counter()
 
-def inject_text(text: str) -> None:
-    """Copy text to clipboard and simulate Cmd+V to paste into active app."""
-    if not text:
-        logger.warning("inject_text called with empty text")
-        return
-
-    logger.info("Attempting to inject text: %r", text)
-
-    # Save current clipboard content to restore after paste
-    try:
-        previous = pyperclip.paste()
-        logger.debug("Saved previous clipboard content")
-    except Exception as e:
-        logger.warning("Failed to read clipboard: %s", e)
-        previous = None
-
-    try:
-        pyperclip.copy(text)
-        logger.debug("Text copied to clipboard")
-    except Exception as e:
-        logger.error("Failed to copy text to clipboard: %s", e)
-        return
-
-    time.sleep(0.05)  # Brief pause to ensure clipboard is set
-
-    try:
-        logger.debug("Simulating Cmd+V keypress")
-        _keyboard.press(Key.cmd)
-        _keyboard.press("v")
-        _keyboard.release("v")
-        _keyboard.release(Key.cmd)
-        logger.info("Cmd+V keypress sent successfully")
-    except Exception as e:
-        logger.error("Failed to simulate Cmd+V keypress: %s", e)
-        logger.error("This usually means accessibility permissions are not granted")
-        return
-
-    # Restore previous clipboard content after a short delay
-    time.sleep(0.1)
-    if previous is not None:
         try:
-            pyperclip.copy(previous)
-            logger.debug("Restored previous clipboard content")
+            self._keyboard.paste()
         except Exception as e:
-            logger.debug("Failed to restore clipboard: %s", e)
+            logger.error("Failed to simulate Cmd+V keypress: %s", e)
+            logger.error("This usually means accessibility permissions are not granted")
+            return False
+        done = time.perf_counter()
+
+        if previous is not None and previous != text:
+            self._schedule_restore(previous, text, count)
+        self._last_timing = InjectionTiming(
+            clipboard_wait=ready - written, paste=done - ready, total=done - start
+        )
+        logger.info(
+            "Text pasted in %.1f ms (clipboard wait %.1f ms)",
+            self._last_timing.total * 1000,
+            self._last_timing.clipboard_wait * 1000,
+        )
+        return True
+
+    def flush(self) -> None:
+        """Restore the clipboard now if a restore is pending, e.g. before quitting."""
+        with self._lock:
+            if self._restore_timer is not None:
+                self._restore_timer.cancel()
+                self._restore_timer = None
+            self._run_restore(self._restore)
+
+    def _wait_until_written(self, text: str, before: int | None) -> int | None:
+        """Poll until the clipboard shows the write.
+
+        Returns:
+            The clipboard's change count after the write, or None if it has none.
+
+        Raises:
+            TimeoutError: The write did not show within ``ready_timeout``.
+        """
+        deadline = time.monotonic() + self._ready_timeout
+        interval = self._poll_interval
+        while True:
+            try:
+                if before is not None:
+                    count = self._clipboard.change_count()
+                    if count != before:
+                        return count
+                elif self._clipboard.read() == text:
+                    return None
+            except Exception as e:
+                logger.debug("Clipboard poll failed: %s", e)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self._max_poll_interval)
+
+    def _take_pending_restore(self) -> str | None:
+        """Cancel a pending restore and return the text it would have restored."""
+        with self._lock:
+            if self._restore_timer is not None:
+                self._restore_timer.cancel()
+                self._restore_timer = None
+            restore, self._restore = self._restore, None
+        return restore[0] if restore is not None else None
+
+    def _schedule_restore(self, previous: str, written: str, count: int | None) -> None:
+        with self._lock:
+            restore = (previous, written, count)
+            self._restore = restore
+            self._restore_timer = threading.Timer(
+                self._restore_delay, self._run_restore, args=(restore,)
+            )
+            self._restore_timer.daemon = True
+            self._restore_timer.start()
+
+    def _run_restore(self, restore: tuple[str, str, int | None] | None) -> None:
+        """Carry out ``restore`` if it is still the pending one.
+
+        cancel() can't stop a timer that has already fired and is waiting for the
+        lock; when it gets the lock after a newer injection, its restore has been
+        taken over (and a new one scheduled), so it must do nothing.
+        """
+        with self._lock:
+            # Compared by identity: each scheduled restore is its own tuple
+            if restore is None or restore is not self._restore:
+                return
+            self._restore = None
+            self._restore_timer = None
+            previous, written, count = restore
+            try:
+                # Leave the clipboard alone if the user copied something since the paste
+                if count is not None:
+                    if self._clipboard.change_count() != count:
+                        return
+                elif self._clipboard.read() != written:
+                    return
+                self._clipboard.write(previous)
+                logger.debug("Restored previous clipboard content")
+            except Exception as e:
+                logger.debug("Failed to restore clipboard: %s", e)
+
+
+_default_injector: TextInjector | None = None
+
+
+def _get_injector() -> TextInjector:
+    """Create the system injector on first use, so importing this module stays cheap."""
+    global _default_injector
+    if _default_injector is None:
+        from dictate.injection.system import PynputKeyboard, system_clipboard
+
+        _default_injector = TextInjector(system_clipboard(), PynputKeyboard())
+    return _default_injector
+
+
+def inject_text(text: str) -> None:
+    """Copy text to clipboard and simulate Cmd+V to paste into active app."""
+    _get_injector().inject(text)
@@ -0,0 +1,61 @@
+"""In-memory clipboard and keyboard, for running text injection without a desktop."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class InMemoryClipboard:
+    """A clipboard whose writes take ``propagation_seconds`` to become visible.
+
+    Mimics a clipboard owned by another process (the macOS pasteboard server, an X11
+    selection owner), where a write returns before readers can see it.
+    """
+
+    def __init__(
+        self, text: str = "", propagation_seconds: float = 0.0, change_count: bool = True
+    ) -> None:
+        self._text = text
+        self._pending: tuple[str, float] | None = None
+        self._count = 0
+        self._propagation_seconds = propagation_seconds
+        self._has_change_count = change_count
+        self._lock = threading.Lock()
+        self.writes: list[str] = []
+
+    def read(self) -> str:
+        with self._lock:
+            self._settle()
+            return self._text
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self._settle()
+            self.writes.append(text)
+            self._pending = (text, time.monotonic() + self._propagation_seconds)
+            self._settle()
+
+    def change_count(self) -> int | None:
+        if not self._has_change_count:
+            return None
+        with self._lock:
+            self._settle()
+            return self._count
+
+    def _settle(self) -> None:
+        if self._pending is not None and time.monotonic() >= self._pending[1]:
+            self._text = self._pending[0]
+            self._pending = None
+            self._count += 1
+
+
+class RecordingKeyboard:
+    """Records what a paste would have inserted: the clipboard's text at that moment."""
+
+    def __init__(self, clipboard: InMemoryClipboard) -> None:
+        self._clipboard = clipboard
+        self.pasted: list[str] = []
+
+    def paste(self) -> None:
+        self.pasted.append(self._clipboard.read())
@@ -0,0 +1,82 @@
+"""Clipboard and keyboard implementations backed by the operating system."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from dictate.injection.base import Clipboard
+
+if TYPE_CHECKING:
+    from pynput.keyboard import Controller
+
+logger = logging.getLogger(__name__)
+
+
+class PasteboardClipboard:
+    """The macOS general pasteboard via PyObjC, with its change count."""
+
+    def __init__(self) -> None:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+
+        self._pasteboard = NSPasteboard.generalPasteboard()
+        self._type = NSPasteboardTypeString
+
+    def read(self) -> str:
+        return self._pasteboard.stringForType_(self._type) or ""
+
+    def write(self, text: str) -> None:
+        self._pasteboard.clearContents()
+        if not self._pasteboard.setString_forType_(text, self._type):
+            raise RuntimeError("Pasteboard refused the text")
+
+    def change_count(self) -> int | None:
+        return int(self._pasteboard.changeCount())
+
+
+class PyperclipClipboard:
+    """Any clipboard pyperclip supports. It has no change count."""
+
+    def read(self) -> str:
+        import pyperclip
+
+        return pyperclip.paste() or ""
+
+    def write(self, text: str) -> None:
+        import pyperclip
+
+        pyperclip.copy(text)
+
+    def change_count(self) -> int | None:
+        return None
+
+
+class PynputKeyboard:
+    """Sends Cmd+V through pynput.
+
+    pynput connects to the display server when it is imported, which fails on
+    headless machines, so the controller is created on first use.
+    """
+
+    def __init__(self) -> None:
+        self._controller: Controller | None = None
+
+    def paste(self) -> None:
+        from pynput.keyboard import Controller, Key
+
+        controller = self._controller
+        if controller is None:
+            controller = self._controller = Controller()
+        controller.press(Key.cmd)
+        controller.press("v")
+        controller.release("v")
+        controller.release(Key.cmd)
+
+
+def system_clipboard() -> Clipboard:
+    """The pasteboard with change counts where PyObjC is available, pyperclip otherwise."""
+    try:
+        return PasteboardClipboard()
+    except ImportError:
+        logger.debug("PyObjC not available, using pyperclip for the clipboard")
+        return PyperclipClipboard()
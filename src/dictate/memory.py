@@ -0,0 +1,36 @@
+"""Process memory measurement for logging and status reporting."""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss_bytes() -> int | None:
+    """Return the current resident set size of this process, or None if unavailable."""
+    try:
+        # Linux: second field of statm is resident pages
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        # macOS has no /proc; ps reports RSS in kilobytes
+        out = subprocess.run(
+            ["ps", "-o", "rss=", "-p", str(os.getpid())],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return int(out.strip()) * 1024
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        logger.debug("Could not measure process memory", exc_info=True)
+        return None
+
+
+def format_bytes(n: int | None) -> str:
+    """Human-readable size in MB, e.g. '512.3 MB'."""
+    return "unknown" if n is None else f"{n / (1024 * 1024):.1f} MB"
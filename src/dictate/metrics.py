@@ -0,0 +1,118 @@
+"""Per-utterance latency spans and rolling percentile aggregates."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from dictate.audio.health import CaptureHealth
+
+# Pipeline stages in the order they run; "total" is hotkey-to-paste
+STAGES = (
+    "record_stop",
+    "trim",
+    "model_wait",
+    "decode",
+    "cleanup",
+    "notify",
+    "inject",
+    "total",
+)
+
+
+@dataclass
+class UtteranceMetrics:
+    """Timing spans for one dictation, in seconds.
+
+    Attributes:
+        audio_seconds: Length of the recorded audio.
+        stages: Seconds spent in each stage that ran, keyed by stage name.
+        started: ``time.perf_counter()`` when the stop hotkey was handled.
+        capture: How cleanly the audio was captured, if the recorder reports it.
+    """
+
+    audio_seconds: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+    capture: CaptureHealth | None = None
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as ``stage``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[stage] = self.stages.get(stage, 0.0) + time.perf_counter() - start
+
+    def finish(self) -> None:
+        """Record the hotkey-to-paste total."""
+        self.stages["total"] = time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        """One-line log form, e.g. 'audio 3.2s | decode 812ms | inject 4ms | total 0.90s'."""
+        parts = [f"audio {self.audio_seconds:.1f}s"]
+        parts += [
+            f"{stage} {self.stages[stage] * 1000:.0f}ms"
+            for stage in STAGES
+            if stage in self.stages and stage != "total"
+        ]
+        if "total" in self.stages:
+            parts.append(f"total {self.stages['total']:.2f}s")
+        return " | ".join(parts)
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Rolling latency percentiles for one stage, in seconds."""
+
+    count: int
+    p50: float
+    p95: float
+    p99: float
+
+
+class LatencyTracker:
+    """Keeps the last ``window`` utterances and reports p50/p95/p99 per stage.
+
+    Thread-safe: utterances are recorded from the processing thread and queried
+    from the UI thread.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self._utterances: deque[UtteranceMetrics] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._utterances)
+
+    def record(self, metrics: UtteranceMetrics) -> None:
+        with self._lock:
+            self._utterances.append(metrics)
+
+    def last(self) -> UtteranceMetrics | None:
+        with self._lock:
+            return self._utterances[-1] if self._utterances else None
+
+    def stats(self) -> dict[str, StageStats]:
+        """Percentiles for every stage that has at least one sample."""
+        import numpy as np
+
+        with self._lock:
+            utterances = list(self._utterances)
+
+        result: dict[str, StageStats] = {}
+        for stage in STAGES:
+            samples = [u.stages[stage] for u in utterances if stage in u.stages]
+            if not samples:
+                continue
+            p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+            result[stage] = StageStats(
+                count=len(samples), p50=float(p50), p95=float(p95), p99=float(p99)
+            )
+        return result
@@ -4,17 +4,26 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-import numpy as np
-
-from dictate.asr.base import ASREngine
-from dictate.audio.recorder import AudioRecorder
+from dictate.asr.base import ASREngine, TranscriptionStream
 from dictate.audio.sound_feedback import play_start_beep, play_stop_beep
 from dictate.injection.injector import inject_text
+from dictate.metrics import LatencyTracker, StageStats, UtteranceMetrics
 from dictate.notification.notifier import show_transcription_preview
 from dictate.processing.base import TextProcessor
+from dictate.processing.segments import OverlappedCleanup
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from dictate.audio.recorder import AudioRecorder
+    from dictate.audio.trim import TrimResult
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +34,46 @@ class PipelineState(Enum):
     PROCESSING = auto()
 
 
+@dataclass
+class _StreamingSession:
+    """Background incremental decode of the recording in progress."""
+
+    stream: TranscriptionStream
+    stop_event: threading.Event = field(default_factory=threading.Event)
+    thread: threading.Thread | None = None
+    fed_samples: int = 0
+    failed: bool = False
+
+
+@dataclass
+class _Job:
+    """A finished recording waiting for the transcription worker."""
+
+    audio: np.ndarray
+    streaming: _StreamingSession | None
+    metrics: UtteranceMetrics
+
+
 class Pipeline:
-    """Connects recorder → ASR → text processor → text injection."""
+    """Connects recorder → ASR → text processor → text injection.
+
+    Finished recordings go onto a bounded queue that one persistent worker thread
+    drains, so a new recording can start while earlier ones are still being
+    transcribed and results are always injected in recording order.
+    ``queue_full_policy`` decides what happens when ``queue_size`` recordings are
+    already waiting:
+
+    - ``"block"``: refuse to start another recording until one is picked up.
+    - ``"drop_oldest"``: discard the oldest waiting recording to make room.
+    - ``"drop_newest"``: discard the recording that was just stopped.
+
+    With ``overlap_cleanup``, a full decode hands each finished sentence to the text
+    processor on a second thread while the decoder works on the rest, so cleanup
+    latency hides behind decode instead of adding to it. ``cleanup_timeout_seconds``
+    bounds how long cleanup may take once decoding ends, across all sentences.
+
+    ``on_metrics`` receives the timing spans of every dictation that was injected.
+    """
 
     def __init__(
         self,
@@ -36,6 +83,17 @@ class Pipeline:
         on_state_change: Callable[[PipelineState], None] | None = None,
         enable_sound_feedback: bool = False,
         show_preview_notification: bool = False,
+        streaming_transcription: bool = False,
+        stream_poll_interval: float = 0.5,
+        trim_silence: bool = False,
+        silence_threshold_db: float = -50.0,
+        silence_padding_ms: float = 200.0,
+        injector: Callable[[str], None] | None = None,
+        queue_size: int = 3,
+        queue_full_policy: str = "block",
+        overlap_cleanup: bool = False,
+        cleanup_timeout_seconds: float | None = None,
+        on_metrics: Callable[[UtteranceMetrics], None] | None = None,
     ) -> None:
         self._recorder = recorder
         self._asr = asr_engine
@@ -43,6 +101,26 @@ class Pipeline:
         self._on_state_change = on_state_change
         self._enable_sound_feedback = enable_sound_feedback
         self._show_preview_notification = show_preview_notification
+        self._streaming_transcription = streaming_transcription
+        self._stream_poll_interval = stream_poll_interval
+        self._streaming: _StreamingSession | None = None
+        self._trim_silence = trim_silence
+        self._silence_threshold_db = silence_threshold_db
+        self._silence_padding_ms = silence_padding_ms
+        self._injector = injector
+        # Seconds of decode per second of audio, from the last full decode
+        self._decode_rtf: float | None = None
+        self._latency = LatencyTracker()
+        self._queue_size = queue_size
+        self._queue_full_policy = queue_full_policy
+        self._overlap_cleanup = overlap_cleanup
+        self._cleanup_timeout_seconds = cleanup_timeout_seconds
+        self._on_metrics = on_metrics
+        self._cleanup_executor: ThreadPoolExecutor | None = None
+        self._jobs: deque[_Job] = deque()
+        self._jobs_cond = threading.Condition()
+        self._busy = False  # worker is processing a job; guarded by _jobs_cond
+        self._worker: threading.Thread | None = None
         self._state = PipelineState.IDLE
         self._lock = threading.Lock()
 
@@ -50,62 +128,318 @@ class Pipeline:
     def state(self) -> PipelineState:
         return self._state
 
+    @property
+    def pending_jobs(self) -> int:
+        """Recordings waiting for the worker, not counting the one being processed."""
+        with self._jobs_cond:
+            return len(self._jobs)
+
+    def latency_stats(self) -> dict[str, StageStats]:
+        """Rolling p50/p95/p99 per stage over recent dictations, keyed by stage name."""
+        return self._latency.stats()
+
+    def reset_latency_stats(self) -> None:
+        """Forget all recorded dictations, e.g. after a warm-up run."""
+        self._latency = LatencyTracker()
+
+    @property
+    def last_metrics(self) -> UtteranceMetrics | None:
+        """Timing spans of the most recent completed dictation."""
+        return self._latency.last()
+
     def _set_state(self, state: PipelineState) -> None:
         self._state = state
         if self._on_state_change:
             self._on_state_change(state)
 
-    def toggle(self) -> None:
-        """Toggle recording on/off. Called from hotkey callback."""
+    def toggle(self) -> bool:
+        """Toggle recording on/off. Called from hotkey callback.
+
+        Returns False if a new recording was refused because the queue is full.
+        """
         with self._lock:
-            if self._state == PipelineState.IDLE:
-                self._start_recording()
-            elif self._state == PipelineState.RECORDING:
+            if self._state == PipelineState.RECORDING:
                 self._stop_and_process()
+                return True
+            return self._start_recording()
 
-    def _start_recording(self) -> None:
+    def _start_recording(self) -> bool:
+        if self._queue_full_policy == "block" and self.pending_jobs >= self._queue_size:
+            logger.warning(
+                "Transcription queue is full (%d waiting), not starting a new recording",
+                self._queue_size,
+            )
+            return False
         logger.info("Recording started")
         self._set_state(PipelineState.RECORDING)
         if self._enable_sound_feedback:
             play_start_beep()
         self._recorder.start()
+        # Load (or reload after an idle unload) while the user is still talking
+        self._asr.preload()
+        if self._streaming_transcription:
+            self._start_streaming()
+        return True
+
+    def _start_streaming(self) -> None:
+        """Decode committed audio windows in the background while recording."""
+        try:
+            session = _StreamingSession(stream=self._asr.start_stream(self._recorder.sample_rate))
+        except Exception:
+            logger.exception("Could not start streaming transcription")
+            return
+        session.thread = threading.Thread(target=self._stream_audio, args=(session,), daemon=True)
+        session.thread.start()
+        self._streaming = session
+
+    def _stream_audio(self, session: _StreamingSession) -> None:
+        while not session.stop_event.wait(self._stream_poll_interval):
+            audio = self._recorder.read(session.fed_samples)
+            if audio.size == 0:
+                continue
+            session.fed_samples += len(audio)
+            try:
+                session.stream.feed(audio)
+            except Exception:
+                logger.exception("Streaming transcription failed, falling back to full decode")
+                session.failed = True
+                return
 
     def _stop_and_process(self) -> None:
         logger.info("Recording stopped, processing...")
-        audio = self._recorder.stop()
+        metrics = UtteranceMetrics()
+        with metrics.span("record_stop"):
+            audio = self._recorder.stop()
+        metrics.capture = getattr(self._recorder, "last_capture", None)
+        if metrics.capture is not None and metrics.capture.degraded:
+            logger.warning("Audio capture degraded: %s", metrics.capture.summary())
         if self._enable_sound_feedback:
             play_stop_beep()
-        self._set_state(PipelineState.PROCESSING)
+        streaming, self._streaming = self._streaming, None
+        if streaming is not None:
+            streaming.stop_event.set()
+
+        self._enqueue(_Job(audio=audio, streaming=streaming, metrics=metrics))
+        self._set_state(self._background_state())
+
+    def _enqueue(self, job: _Job) -> None:
+        """Hand a recording to the worker, applying the queue-full policy."""
+        with self._jobs_cond:
+            if len(self._jobs) >= self._queue_size:
+                if self._queue_full_policy == "drop_newest":
+                    logger.warning("Transcription queue is full, dropping the new recording")
+                    self._discard(job)
+                    return
+                logger.warning("Transcription queue is full, dropping the oldest recording")
+                self._discard(self._jobs.popleft())
+            self._jobs.append(job)
+            self._jobs_cond.notify()
+
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._worker_loop, name="dictate-transcription", daemon=True
+            )
+            self._worker.start()
+
+    @staticmethod
+    def _discard(job: _Job) -> None:
+        if job.streaming is not None:
+            job.streaming.stop_event.set()
 
-        # Run transcription + injection in a background thread
-        thread = threading.Thread(target=self._process_audio, args=(audio,), daemon=True)
-        thread.start()
+    def _background_state(self) -> PipelineState:
+        """State to show when not recording: PROCESSING while any job is queued or running."""
+        with self._jobs_cond:
+            return PipelineState.PROCESSING if self._jobs or self._busy else PipelineState.IDLE
 
-    def _process_audio(self, audio: np.ndarray) -> None:
+    def _worker_loop(self) -> None:
+        while True:
+            with self._jobs_cond:
+                while not self._jobs:
+                    self._jobs_cond.wait()
+                job = self._jobs.popleft()
+                self._busy = True
+            try:
+                self._process_audio(job.audio, job.streaming, job.metrics)
+            finally:
+                with self._lock:
+                    with self._jobs_cond:
+                        self._busy = False
+                    if self._state != PipelineState.RECORDING:
+                        self._set_state(self._background_state())
+
+    def _trim(self, audio: np.ndarray) -> TrimResult:
+        """Cut leading/trailing silence so the decoder sees fewer samples."""
+        from dictate.audio.trim import trim_silence
+
+        sample_rate = self._recorder.sample_rate
+        start = time.perf_counter()
+        trim = trim_silence(
+            audio,
+            sample_rate,
+            threshold_db=self._silence_threshold_db,
+            padding_ms=self._silence_padding_ms,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        trimmed_seconds = trim.trimmed_samples / sample_rate
+        if self._decode_rtf is not None:
+            logger.info(
+                "Trimmed %d samples (%.2fs) of silence in %.1fms, saving ~%.2fs of decode",
+                trim.trimmed_samples,
+                trimmed_seconds,
+                elapsed_ms,
+                trimmed_seconds * self._decode_rtf,
+            )
+        else:
+            logger.info(
+                "Trimmed %d samples (%.2fs) of silence in %.1fms",
+                trim.trimmed_samples,
+                trimmed_seconds,
+                elapsed_ms,
+            )
+        return trim
+
+    def _transcribe(
+        self,
+        audio: np.ndarray,
+        streaming: _StreamingSession | None,
+        trimmed: np.ndarray | None = None,
+        metrics: UtteranceMetrics | None = None,
+    ) -> str:
+        """Wait for the model, then decode, timing the two separately."""
+        metrics = metrics if metrics is not None else UtteranceMetrics()
+        with metrics.span("model_wait"):
+            self._asr.ensure_loaded()
+        with metrics.span("decode"):
+            return self._decode(audio, streaming, trimmed)
+
+    def _decode(
+        self,
+        audio: np.ndarray,
+        streaming: _StreamingSession | None,
+        trimmed: np.ndarray | None,
+    ) -> str:
+        """Finish the streaming decode if there is one, otherwise decode the whole buffer.
+
+        ``trimmed`` is the silence-trimmed audio to use for a full decode. The
+        streaming path always continues from the untrimmed recording, since its
+        head has already been decoded.
+        """
+        sample_rate = self._recorder.sample_rate
+        if streaming is not None:
+            if streaming.thread is not None:
+                streaming.thread.join()
+            if not streaming.failed:
+                tail = audio[streaming.fed_samples:]
+                logger.info(
+                    "Streaming: %.1fs already fed, %.1fs left to decode",
+                    streaming.fed_samples / sample_rate,
+                    len(tail) / sample_rate,
+                )
+                try:
+                    streaming.stream.feed(tail)
+                    return streaming.stream.finish()
+                except Exception:
+                    logger.exception("Streaming transcription failed, falling back to full decode")
+
+        audio = audio if trimmed is None else trimmed
+        start = time.perf_counter()
+        text = self._asr.transcribe(audio, sample_rate)
+        if audio.size:
+            self._decode_rtf = (time.perf_counter() - start) / (len(audio) / sample_rate)
+        return text
+
+    def _transcribe_and_clean(
+        self, audio: np.ndarray, metrics: UtteranceMetrics
+    ) -> tuple[str, str]:
+        """Decode segment by segment, cleaning up each finished sentence in parallel.
+
+        The "cleanup" span only covers what is left after decoding ends.
+        """
+        with metrics.span("model_wait"):
+            self._asr.ensure_loaded()
+
+        if self._cleanup_executor is None:
+            self._cleanup_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="dictate-cleanup"
+            )
+        cleanup = OverlappedCleanup(
+            self._processor, self._cleanup_executor, self._cleanup_timeout_seconds
+        )
+        sample_rate = self._recorder.sample_rate
+        segments: list[str] = []
+        try:
+            with metrics.span("decode"):
+                start = time.perf_counter()
+                for segment in self._asr.transcribe_segments(audio, sample_rate):
+                    segments.append(segment)
+                    cleanup.add(segment)
+                if audio.size:
+                    self._decode_rtf = (time.perf_counter() - start) / (len(audio) / sample_rate)
+                overlapped = cleanup.busy_seconds
+            with metrics.span("cleanup"):
+                cleaned = cleanup.finish()
+        except BaseException:
+            cleanup.cancel()
+            raise
+        logger.info(
+            "Cleaned %d sentence(s); %.0fms of %.0fms cleanup overlapped with decode",
+            cleanup.submitted,
+            overlapped * 1000,
+            cleanup.busy_seconds * 1000,
+        )
+        return " ".join(segments).strip(), cleaned
+
+    def _process_audio(
+        self,
+        audio: np.ndarray,
+        streaming: _StreamingSession | None = None,
+        metrics: UtteranceMetrics | None = None,
+    ) -> None:
+        metrics = metrics if metrics is not None else UtteranceMetrics()
         try:
             if audio.size == 0:
                 logger.warning("No audio recorded")
-                self._set_state(PipelineState.IDLE)
                 return
 
-            duration = len(audio) / self._recorder.sample_rate
-            logger.info("Transcribing %.1fs of audio...", duration)
+            metrics.audio_seconds = len(audio) / self._recorder.sample_rate
+            trimmed = None
+            if self._trim_silence:
+                with metrics.span("trim"):
+                    trim = self._trim(audio)
+                if trim.is_silent:
+                    logger.info("Recording is silent, skipping transcription")
+                    return
+                trimmed = trim.audio
 
-            raw_text = self._asr.transcribe(audio, self._recorder.sample_rate)
-            logger.info("Raw transcription: %s", raw_text)
+            logger.info("Transcribing %.1fs of audio...", metrics.audio_seconds)
+
+            if self._overlap_cleanup and streaming is None:
+                raw_text, cleaned_text = self._transcribe_and_clean(
+                    audio if trimmed is None else trimmed, metrics
+                )
+                logger.info("Raw transcription: %s", raw_text)
+            else:
+                raw_text = self._transcribe(audio, streaming, trimmed, metrics)
+                logger.info("Raw transcription: %s", raw_text)
 
-            cleaned_text = self._processor.process(raw_text)
+                with metrics.span("cleanup"):
+                    cleaned_text = self._processor.process(raw_text)
             logger.info("Cleaned text: %s", cleaned_text)
 
             if cleaned_text:
                 if self._show_preview_notification:
-                    show_transcription_preview(cleaned_text)
+                    with metrics.span("notify"):
+                        show_transcription_preview(cleaned_text)
 
-                inject_text(cleaned_text)
+                with metrics.span("inject"):
+                    (self._injector or inject_text)(cleaned_text)
+                metrics.finish()
+                self._latency.record(metrics)
+                if self._on_metrics is not None:
+                    self._on_metrics(metrics)
                 logger.info("Text injected successfully")
+                logger.info("Latency: %s", metrics.summary())
             else:
                 logger.warning("No text to inject after processing")
         except Exception:
             logger.exception("Error processing audio")
-        finally:
-            self._set_state(PipelineState.IDLE)
@@ -8,11 +8,13 @@ from typing import Protocol
 class TextProcessor(Protocol):
     """Interface that all text processors must implement."""
 
-    def process(self, text: str) -> str:
+    def process(self, text: str, deadline: float | None = None) -> str:
         """Clean up and format transcribed text.
 
         Args:
             text: Raw transcription text.
+            deadline: ``time.monotonic()`` time to be done by. Processors that can be
+                slow return a fallback result once it passes; fast ones may ignore it.
 
         Returns:
             Cleaned and formatted text.
@@ -0,0 +1,180 @@
+"""LRU cache for text processor results, keyed by transcript and processor config."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from dictate.processing.base import TextProcessor
+
+logger = logging.getLogger(__name__)
+
+_FILE_VERSION = 1
+
+# New entries are written in one batch this long after the first of them
+DEFAULT_SAVE_DELAY_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit/miss counts since the processor was created."""
+
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedProcessor:
+    """Wraps a text processor and reuses its output for transcripts it has seen before.
+
+    Entries are keyed by a hash of the transcript and the processor's fingerprint: the
+    ``config_key`` given here plus ``processor.fingerprint()`` if the processor has one
+    (e.g. the dictionary it loaded). When the fingerprint changes the cache is cleared.
+    Results a processor marks as degraded (``last_fell_back``) are not stored.
+
+    With a ``path``, new entries are written by a background timer rather than on the
+    lookup that missed; call flush() before exiting to write any still pending.
+
+    Args:
+        processor: The processor to cache.
+        config_key: Settings that affect the output, e.g. the model name.
+        max_entries: Least recently used entries beyond this are dropped.
+        path: Optional JSON file to persist entries in across restarts.
+        save_delay_seconds: How long after a new entry the file is written; entries
+            added in the meantime are saved with it.
+    """
+
+    def __init__(
+        self,
+        processor: TextProcessor,
+        config_key: str = "",
+        max_entries: int = 256,
+        path: str | Path | None = None,
+        save_delay_seconds: float = DEFAULT_SAVE_DELAY_SECONDS,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self._processor = processor
+        self._config_key = config_key
+        self._max_entries = max_entries
+        self._path = Path(path).expanduser() if path else None
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._fingerprint: str | None = None
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._save_delay_seconds = save_delay_seconds
+        self._save_timer: threading.Timer | None = None
+        # Held while writing the file, so two saves never write the same temporary file
+        self._save_lock = threading.Lock()
+        if self._path is not None:
+            self._load()
+
+    @property
+    def processor(self) -> TextProcessor:
+        return self._processor
+
+    def process(self, text: str, deadline: float | None = None) -> str:
+        fingerprint = self._current_fingerprint()
+        key = hashlib.sha256(f"{fingerprint}\0{text}".encode()).hexdigest()
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                if self._entries:
+                    logger.info("Text processor config changed; clearing cleanup cache")
+                    self._entries.clear()
+                self._fingerprint = fingerprint
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        if deadline is None:
+            result = self._processor.process(text)
+        else:
+            result = self._processor.process(text, deadline=deadline)
+        if getattr(self._processor, "last_fell_back", False):
+            return result
+
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                return result  # config changed while processing
+            self._entries[key] = result
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            if self._path is not None and self._save_timer is None:
+                self._save_timer = threading.Timer(self._save_delay_seconds, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+        return result
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries))
+
+    def flush(self) -> None:
+        """Write entries added since the last save to disk now."""
+        with self._save_lock:
+            with self._lock:
+                if self._save_timer is None:
+                    return
+                self._save_timer.cancel()
+                self._save_timer = None
+                data: dict[str, object] = {
+                    "version": _FILE_VERSION,
+                    "fingerprint": self._fingerprint,
+                    "entries": dict(self._entries),
+                }
+            self._save(data)
+
+    def _current_fingerprint(self) -> str:
+        fingerprint = getattr(self._processor, "fingerprint", None)
+        dynamic = fingerprint() if callable(fingerprint) else ""
+        return f"{self._config_key}|{dynamic}"
+
+    def _load(self) -> None:
+        path = self._path
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != _FILE_VERSION:
+                return
+            entries = data["entries"]
+            fingerprint = data["fingerprint"]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable cleanup cache %s: %s", path, e)
+            return
+        # Saved least recently used first
+        self._entries.update(list(entries.items())[-self._max_entries:])
+        self._fingerprint = fingerprint
+        logger.info("Loaded %d cached cleanups from %s", len(self._entries), path)
+
+    def _save(self, data: dict[str, object]) -> None:
+        path = self._path
+        if path is None:
+            return
+        part = path.with_name(path.name + ".part")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Transcripts are private: readable by the owner only
+            fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(part, path)
+        except OSError as e:
+            logger.warning("Could not save cleanup cache to %s: %s", path, e)
@@ -0,0 +1,289 @@
+"""Single-pass transcript cleanup: dictionary phrases, comma repair and capitalization.
+
+The text is split once into alternating gaps and words (``gap word gap ... word gap``,
+where a gap is the run of spaces and punctuation between two words) and joined once at
+the end. In between, each rule visits only its candidate positions (a dictionary phrase,
+a conjunction, a gap that is not a single space) and edits that list in place, so plain
+words are never rescanned or copied. With the default dictionary the output is identical
+to the chain of ``re.sub`` passes this replaced, including its quirks (e.g. ", So Then"
+keeps "So" capitalized).
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Iterable
+
+from dictate.processing.dictionary import DictionaryEntry, PhraseMatcher, fold
+
+# Filler words/phrases to remove (case-insensitive, whole words). Earlier entries win,
+# so "uh" shadows "uh huh" and only the "uh" is dropped, as it always has been.
+DEFAULT_FILLERS = (
+    "um",
+    "uh",
+    "uh huh",
+    "mm",
+    "hmm",
+    "mhm",
+    "you know",
+    "i mean",
+    "kind of",
+    "sort of",
+    "basically",
+    "literally",
+    "okay so",
+    "yeah",
+)
+DEFAULT_DICTIONARY = tuple(DictionaryEntry(filler) for filler in DEFAULT_FILLERS)
+
+# Conjunctions that typically need a comma before them when joining clauses
+DEFAULT_CONJUNCTIONS = (
+    "but",
+    "and",
+    "so",
+    "yet",
+    "or",
+    "because",
+    "since",
+    "although",
+    "though",
+    "while",
+)
+
+_WORD = re.compile(r"(\w+)")
+_NONE = [None]
+
+# ASCII letters plus the non-ASCII characters that case-insensitively match one in ``re``
+_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZİıſK")
+
+
+@lru_cache(maxsize=1024)
+def _split_replacement(replacement: str) -> tuple[str, tuple[str, ...], tuple[str, ...], str]:
+    """Split a replacement into (leading gap, inner words and gaps, folded words, trailing gap)."""
+    parts = _WORD.split(replacement)
+    if len(parts) == 1:
+        return replacement, (), (), ""
+    inner = tuple(parts[1:-1])
+    return parts[0], inner, tuple(fold(w) for w in inner[::2]), parts[-1]
+
+
+def _flatten(items: list[Any]) -> list[Any]:
+    flat: list[Any] = []
+    for item in items:
+        if item is None:
+            continue
+        if type(item) is tuple:
+            flat.extend(item)
+        else:
+            flat.append(item)
+    return flat
+
+
+def _is_comma_or_space(char: str) -> bool:
+    return char == "," or char.isspace()
+
+
+def _strip_commas_and_spaces(gap: str, leading: bool, trailing: bool) -> str:
+    start, end = 0, len(gap)
+    while leading and start < end and _is_comma_or_space(gap[start]):
+        start += 1
+    while trailing and end > start and _is_comma_or_space(gap[end - 1]):
+        end -= 1
+    return gap[start:end]
+
+
+@lru_cache(maxsize=1024)
+def _gap_forms(gap: str) -> tuple[str, str]:
+    """Normalize the punctuation between two words.
+
+    Returns the gap as it looks before conjunction commas are inserted (whitespace runs
+    collapsed, comma pairs merged into ", ") and after (spaces before commas dropped,
+    adjacent commas merged). Gaps are short and few distinct ones occur, hence the cache.
+    """
+    pre: list[str] = []
+    post: list[str] = []
+    for is_cluster, chars in groupby(gap, key=_is_comma_or_space):
+        run = "".join(chars)
+        if not is_cluster:
+            pre.append(run)
+            post.append(run)
+            continue
+        # s0 , s1 , ... , sn with each whitespace run of 2+ collapsed to one space
+        spaces = [s if len(s) < 2 else " " for s in run.split(",")]
+        commas = len(spaces) - 1
+        pairs = commas // 2
+        if commas == 0:
+            pre.append(spaces[0])
+            post.append(spaces[0])
+        elif commas == 1:
+            pre.append(spaces[0] + "," + spaces[1])
+            post.append("," + spaces[1])
+        elif commas % 2 == 0:
+            pre.append(", " * pairs)
+            post.append("," * ((pairs + 1) // 2) + " ")
+        else:
+            pre.append(", " * pairs + "," + spaces[-1])
+            post.append("," * ((pairs + 2) // 2) + spaces[-1])
+    return "".join(pre), "".join(post)
+
+
+class CleanupEngine:
+    """Removes filler words, applies dictionary replacements and fixes commas and capitalization.
+
+    Args:
+        dictionary: Phrases to remove or replace, matched case-insensitively against whole
+            words. Earlier entries win when several match at the same word.
+        conjunctions: Words that get a comma before them when they join two clauses.
+    """
+
+    def __init__(
+        self,
+        dictionary: Iterable[DictionaryEntry] = DEFAULT_DICTIONARY,
+        conjunctions: Iterable[str] = DEFAULT_CONJUNCTIONS,
+    ) -> None:
+        self._matcher = PhraseMatcher(dictionary)
+        self._conjunctions = frozenset(fold(w) for w in conjunctions)
+
+    def clean(self, text: str) -> str:
+        if not text or text.isspace():
+            return ""
+
+        # parts[2k] is the gap before word k, parts[2k + 1] is word k
+        parts = _WORD.split(text)
+        folded = fold("\0".join(parts[1::2])).split("\0") if len(parts) > 1 else []
+        first_words = self._matcher.first_words
+        hits = [k for k, w in enumerate(folded) if w in first_words]
+        if hits:
+            parts, folded = self._apply_dictionary(parts, folded, hits)
+
+        last = len(parts) - 1
+        if last:
+            parts[0] = _strip_commas_and_spaces(parts[0], leading=True, trailing=False)
+            parts[last] = _strip_commas_and_spaces(parts[last], leading=False, trailing=True)
+        else:
+            parts[0] = _strip_commas_and_spaces(parts[0], leading=True, trailing=True)
+
+        comma_gaps = self._conjunctions_before(parts, folded)
+
+        # Everything but single spaces needs normalizing
+        odd_gaps = [j for j in range(0, last + 1, 2) if parts[j] != " "]
+        for j in odd_gaps:
+            parts[j] = _gap_forms(parts[j])[1]
+        for j in comma_gaps:
+            parts[j] = ", "
+            if parts[j + 2][:1].isspace():
+                parts[j + 2] = " " + parts[j + 2][1:]
+
+        # Only a gap ending in ",", ".", "!" or "?" plus whitespace can change the case of
+        # the word after it
+        clause_ends = [j for j in odd_gaps if j < last and parts[j] != " "]
+        if comma_gaps:
+            capitalized = [j for j in comma_gaps if "A" <= parts[j + 1][0] <= "Z"]
+            clause_ends = sorted(set(clause_ends).union(capitalized))
+        for j in clause_ends:
+            self._fix_capital(parts, j, last)
+
+        result = "".join(parts)
+        if not result:
+            return ""
+
+        result = result[0].upper() + result[1:]
+        if result[-1] not in ".!?":
+            result += "."
+        return result
+
+    def _apply_dictionary(
+        self, parts: list[Any], folded: list[Any], hits: list[int]
+    ) -> tuple[list[str], list[str]]:
+        """Remove or replace phrases starting at word indices ``hits``, merging gaps around them.
+
+        Removed parts are marked None and replacement words are stored as one tuple in
+        the first replaced slot, so the lists are only rebuilt once at the end.
+        Until then slots hold ``str | tuple[str, ...] | None``, hence ``list[Any]``.
+        """
+        match = self._matcher.match
+        merge_into = -1  # gap that absorbs the gaps around consecutive removed phrases
+        next_word = 0  # first word not inside an already matched phrase
+        expanded = False
+        for k in hits:
+            if k < next_word:
+                continue
+            found = match(parts, folded, k)
+            if found is None:
+                continue
+            span = found.words
+            first = 2 * k + 1
+            end = first + 2 * span  # one past the gap after the phrase
+            if parts[first - 1] is not None:
+                merge_into = first - 1
+            lead, words, folded_words, trail = _split_replacement(found.replacement)
+            if not words:
+                parts[merge_into] += lead + parts[end - 1]
+                parts[first:end] = _NONE * (2 * span)
+                folded[k:k + span] = _NONE * span
+            else:
+                parts[merge_into] += lead
+                parts[end - 1] = trail + parts[end - 1]
+                parts[first:end - 1] = [words] + _NONE * (2 * span - 2)
+                folded[k:k + span] = [folded_words] + _NONE * (span - 1)
+                expanded = True
+            next_word = k + span
+        if not next_word:
+            return parts, folded
+        if not expanded:
+            return [p for p in parts if p is not None], [w for w in folded if w is not None]
+        return _flatten(parts), _flatten(folded)
+
+    def _conjunctions_before(self, parts: list[str], folded: list[str]) -> list[int]:
+        """Gap indices where a comma goes before a conjunction joining two clauses.
+
+        E.g. "went home and slept": the conjunction must follow a whitespace-only gap and
+        a word ending in three letters, and be followed by whitespace.
+        """
+        conjunctions = self._conjunctions
+        found: list[int] = []
+        previous = -1
+        for k in [k for k, w in enumerate(folded) if w in conjunctions]:
+            if k == 0 or k == previous + 1:
+                continue  # no word before, or the previous one already took this gap
+            gap = 2 * k
+            before = parts[gap - 1]
+            after = parts[gap + 2]
+            if (
+                parts[gap].isspace()
+                and (after == " " or _gap_forms(after)[0][:1].isspace())
+                and len(before) >= 3
+                and _LETTERS.issuperset(before[-3:])
+            ):
+                found.append(gap)
+                previous = k
+        return found
+
+    @staticmethod
+    def _fix_capital(parts: list[str], j: int, last: int) -> None:
+        """Fix the case of the word after gap ``parts[j]`` if the gap ends a clause or sentence."""
+        gap = parts[j]
+        if not gap[-1:].isspace():
+            return
+        head = gap.rstrip()
+        end = head[-1:]
+        word = parts[j + 1]
+        first = word[0]
+        if end == "," and "A" <= first <= "Z" and len(word) > 1 and "a" <= word[1] <= "z":
+            # Lowercase a capitalized word after a comma (", And" -> ", and"), unless it
+            # is two letters long and followed by another capital
+            if (
+                len(word) == 2
+                and j + 2 < last
+                and parts[j + 2].isspace()
+                and "A" <= parts[j + 3][0] <= "Z"
+            ):
+                return
+            parts[j] = head + " "
+            parts[j + 1] = first.lower() + word[1:]
+        elif end in (".", "!", "?") and "a" <= first <= "z":
+            # Capitalize the start of a sentence
+            parts[j] = head + " "
+            parts[j + 1] = first.upper() + word[1:]
@@ -0,0 +1,173 @@
+"""User dictionary of fillers and phrase replacements, compiled into a word-level trie.
+
+Dictionary file format, one entry per line::
+
+    # Lines starting with # are comments
+    you know                  # a phrase on its own is removed as a filler
+    k8s => Kubernetes         # "phrase => replacement" swaps the phrase
+    asap => as soon as possible
+
+Phrases match whole words, case-insensitively. A phrase must start and end with a
+letter or digit; punctuation inside it (e.g. "uh-huh") must match exactly.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"(\w+)")
+
+# Non-ASCII characters that case-insensitively match an ASCII letter in ``re``
+_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+
+def fold(text: str) -> str:
+    """Case-fold ``text`` the way ``re.IGNORECASE`` compares it against ASCII phrases."""
+    return text.lower() if text.isascii() else text.translate(_FOLD).lower()
+
+
+@dataclass(frozen=True)
+class DictionaryEntry:
+    """A phrase to find and what to put in its place ("" removes it)."""
+
+    phrase: str
+    replacement: str = ""
+
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    """A dictionary hit: ``words`` words starting at the matched position."""
+
+    words: int
+    replacement: str
+    priority: int
+
+
+class _Node:
+    __slots__ = ("children", "entry", "best_below")
+
+    def __init__(self) -> None:
+        # (gap before the next word, folded next word) -> node
+        self.children: dict[tuple[str, str], _Node] = {}
+        self.entry: PhraseMatch | None = None
+        # Lowest priority of any entry strictly below this node, to stop walking early
+        self.best_below = float("inf")
+
+
+class PhraseMatcher:
+    """Finds dictionary phrases in a tokenized transcript.
+
+    Phrases are stored in a trie keyed on whole words, so checking a position walks at
+    most as many nodes as the longest phrase has words, no matter how many phrases
+    there are. When several phrases match at the same word, the one listed first wins,
+    as with a regex alternation.
+    """
+
+    def __init__(self, entries: Iterable[DictionaryEntry]) -> None:
+        self._roots: dict[str, _Node] = {}
+        for priority, entry in enumerate(entries):
+            self._add(entry, priority)
+
+    @property
+    def first_words(self) -> dict[str, _Node]:
+        """Folded words that can start a phrase (supports ``in``)."""
+        return self._roots
+
+    def _add(self, entry: DictionaryEntry, priority: int) -> None:
+        parts = _WORD.split(entry.phrase)
+        if len(parts) < 3 or parts[0] or parts[-1]:
+            raise ValueError(f"Phrase must start and end with a letter or digit: {entry.phrase!r}")
+        path: list[_Node] = []
+        node = self._roots.setdefault(fold(parts[1]), _Node())
+        for i in range(2, len(parts) - 1, 2):
+            path.append(node)
+            node = node.children.setdefault((parts[i], fold(parts[i + 1])), _Node())
+        if node.entry is not None:
+            return  # a duplicate never matches; the earlier entry shadows it
+        node.entry = PhraseMatch(len(parts) // 2, entry.replacement, priority)
+        for ancestor in path:
+            ancestor.best_below = min(ancestor.best_below, priority)
+
+    def match(self, parts: list[str], folded: list[str], k: int) -> PhraseMatch | None:
+        """Highest-priority phrase starting at word ``k``.
+
+        Args:
+            parts: Alternating gaps and words, ``parts[2 * k + 1]`` being word ``k``.
+            folded: ``fold()`` of each word.
+        """
+        node = self._roots.get(folded[k])
+        best: PhraseMatch | None = None
+        n = len(folded)
+        while node is not None:
+            if node.entry is not None and (best is None or node.entry.priority < best.priority):
+                best = node.entry
+            k += 1
+            if k >= n or (best is not None and node.best_below > best.priority):
+                break
+            node = node.children.get((parts[2 * k], folded[k]))
+        return best
+
+
+def parse_dictionary(text: str, source: str = "<dictionary>") -> list[DictionaryEntry]:
+    """Parse dictionary file contents. Raises ValueError naming the offending line."""
+    entries: list[DictionaryEntry] = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        phrase, _, replacement = line.partition("=>")
+        # Collapse runs of whitespace: transcripts are matched after the same collapse
+        phrase = " ".join(phrase.split())
+        entry = DictionaryEntry(phrase, " ".join(replacement.split()))
+        try:
+            PhraseMatcher([entry])
+        except ValueError as e:
+            raise ValueError(f"{source}:{lineno}: {e}") from None
+        entries.append(entry)
+    return entries
+
+
+def load_dictionary(path: str | Path) -> list[DictionaryEntry]:
+    path = Path(path).expanduser()
+    return parse_dictionary(path.read_text(encoding="utf-8"), str(path))
+
+
+class DictionaryFile:
+    """A dictionary file that is re-read whenever its modification time changes."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self._stamp: tuple[int, int] | None = (-1, -1)  # never matches, so the first poll loads
+
+    def poll(self) -> list[DictionaryEntry] | None:
+        """Return the entries if the file changed since the last poll, else None.
+
+        A file that disappears yields an empty dictionary. A file that fails to parse
+        is logged and skipped until it changes again, so a half-saved edit never wipes
+        out the dictionary in use.
+        """
+        try:
+            stat = os.stat(self.path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self._stamp:
+            return None
+        self._stamp = stamp
+        if stamp is None:
+            logger.warning("Dictionary %s not found; using built-in fillers only", self.path)
+            return []
+        try:
+            entries = load_dictionary(self.path)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            logger.warning("Ignoring invalid dictionary: %s", e)
+            return None
+        logger.info("Loaded %d dictionary entries from %s", len(entries), self.path)
+        return entries
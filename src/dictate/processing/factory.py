@@ -7,12 +7,28 @@ from dictate.processing.base import TextProcessor
 
 
 def create_text_processor(config: Config) -> TextProcessor:
-    """Create and return the appropriate text processor."""
+    """Create and return the appropriate text processor, cached if TEXT_CACHE_SIZE > 0."""
+    from dictate.processing.regex_processor import RegexProcessor
+
+    processor: TextProcessor = RegexProcessor(dictionary_path=config.dictionary_path or None)
     if config.text_processor == "ollama":
         from dictate.processing.ollama_processor import OllamaProcessor
 
-        return OllamaProcessor()
+        processor = OllamaProcessor(
+            host=config.ollama_host,
+            model=config.ollama_model,
+            timeout_seconds=config.ollama_timeout_seconds,
+            fallback=processor,
+        )
 
-    from dictate.processing.regex_processor import RegexProcessor
+    if config.text_cache_size == 0:
+        return processor
+
+    from dictate.processing.cache import CachedProcessor
 
-    return RegexProcessor()
+    return CachedProcessor(
+        processor,
+        config_key=config.text_processor,
+        max_entries=config.text_cache_size,
+        path=config.text_cache_path or None,
+    )
@@ -1,16 +1,191 @@
-"""Stub for future Ollama/Llama-based text processing."""
+"""LLM-based text cleanup via a local Ollama server."""
 
 from __future__ import annotations
 
+import hashlib
+import http.client
+import json
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+from dictate.processing.base import TextProcessor
+
+logger = logging.getLogger(__name__)
+
+_SYSTEM_PROMPT = (
+    "You clean up dictated text. Remove filler words and false starts, fix punctuation, "
+    "capitalization and obvious transcription errors. Keep the speaker's wording and "
+    "meaning. Reply with the cleaned text only, without quotes or commentary."
+)
+
 
 class OllamaProcessor:
-    """Placeholder for LLM-based text cleanup via Ollama.
+    """Cleans up transcripts with a model served by Ollama.
 
-    This is a stub for future implementation. Currently falls back
-    to returning the input text unchanged.
+    One keep-alive HTTP connection is reused across utterances and the reply is
+    streamed, so a slow generation can be cut off the moment ``timeout_seconds`` runs
+    out. On a missed deadline or any error the ``fallback`` processor's output is
+    returned instead, so a slow model never holds up a paste.
+
+    Args:
+        host: Ollama base URL.
+        model: Model name, as listed by ``ollama list``.
+        timeout_seconds: Hard limit per call, including connecting and waiting for another
+            call to finish. A ``deadline`` passed to process() can only shorten it.
+        fallback: Processor used when Ollama can't answer in time (default: regex).
+        keep_alive: How long Ollama keeps the model loaded after a request.
     """
 
-    def process(self, text: str) -> str:
-        # TODO: Implement Ollama-based text cleanup
-        # Example: send text to local Llama model for grammar/style fixes
-        return text
+    def __init__(
+        self,
+        host: str = "http://localhost:11434",
+        model: str = "llama3.2",
+        timeout_seconds: float = 2.0,
+        fallback: TextProcessor | None = None,
+        keep_alive: str = "30m",
+    ) -> None:
+        url = urlsplit(host if "://" in host else f"http://{host}")
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"Invalid Ollama host: {host!r}")
+        self._https = url.scheme == "https"
+        self._hostname = url.hostname
+        self._port = url.port
+        self._path = url.path.rstrip("/") + "/api/generate"
+        self._model = model
+        self._timeout_seconds = timeout_seconds
+        self._keep_alive = keep_alive
+        if fallback is None:
+            from dictate.processing.regex_processor import RegexProcessor
+
+            fallback = RegexProcessor()
+        self._fallback = fallback
+        self._conn: http.client.HTTPConnection | None = None
+        self._lock = threading.Lock()
+        # Whether the last process() call returned the fallback's output
+        self.last_fell_back = False
+
+    def fingerprint(self) -> str:
+        """Identifies the model and prompt, so cached results expire when they change."""
+        prompt = hashlib.sha256(_SYSTEM_PROMPT.encode()).hexdigest()[:16]
+        fallback = getattr(self._fallback, "fingerprint", None)
+        fallback_key = fallback() if callable(fallback) else ""
+        return f"ollama:{self._hostname}:{self._port}:{self._model}:{prompt}|{fallback_key}"
+
+    def process(self, text: str, deadline: float | None = None) -> str:
+        self.last_fell_back = False
+        if not text or text.isspace():
+            return ""
+        own_deadline = time.monotonic() + self._timeout_seconds
+        deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning("Cleanup deadline already passed; using fallback cleanup")
+            return self._fall_back(text)
+        if not self._lock.acquire(timeout=remaining):
+            logger.warning("Ollama is busy with another utterance; using fallback cleanup")
+            return self._fall_back(text)
+        try:
+            result = self._generate(text, deadline)
+        except TimeoutError:
+            logger.warning("Ollama missed the cleanup deadline; using fallback cleanup")
+            return self._fall_back(text)
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            logger.warning("Ollama cleanup failed (%s); using fallback cleanup", e)
+            return self._fall_back(text)
+        finally:
+            self._lock.release()
+        if not result:
+            logger.warning("Ollama returned nothing; using fallback cleanup")
+            return self._fall_back(text)
+        return result
+
+    def _fall_back(self, text: str) -> str:
+        self.last_fell_back = True
+        return self._fallback.process(text)
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _generate(self, text: str, deadline: float) -> str:
+        body = json.dumps(
+            {
+                "model": self._model,
+                "system": _SYSTEM_PROMPT,
+                "prompt": text,
+                "stream": True,
+                "keep_alive": self._keep_alive,
+                # Cleanup output is about as long as the input; cap runaway generations
+                "options": {"temperature": 0, "num_predict": 2 * len(text.split()) + 32},
+            }
+        ).encode()
+        headers = {"Content-Type": "application/json"}
+        try:
+            response = self._send(body, headers, deadline)
+            if response.status != 200:
+                detail = response.read().decode(errors="replace").strip()
+                raise http.client.HTTPException(f"HTTP {response.status}: {detail[:200]}")
+            pieces: list[str] = []
+            while True:
+                self._set_timeout(deadline)
+                line = response.readline()
+                if not line:
+                    raise http.client.IncompleteRead(b"".join(p.encode() for p in pieces))
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise http.client.HTTPException(chunk["error"])
+                pieces.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+            # Drain the end of the chunked body so the connection can be reused
+            self._set_timeout(deadline)
+            response.read()
+        except BaseException:
+            # A half-read response leaves the connection unusable
+            self._disconnect()
+            raise
+        return "".join(pieces).strip()
+
+    def _send(
+        self, body: bytes, headers: dict[str, str], deadline: float
+    ) -> http.client.HTTPResponse:
+        """POST ``body``, retrying once on a fresh connection if a kept-alive one went stale."""
+        while True:
+            reused = self._conn is not None
+            if self._conn is None:
+                connection_class = (
+                    http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+                )
+                self._conn = connection_class(
+                    self._hostname, self._port, timeout=self._remaining(deadline)
+                )
+            self._set_timeout(deadline)
+            try:
+                self._conn.request("POST", self._path, body, headers)
+                return self._conn.getresponse()
+            except ConnectionError:
+                self._disconnect()
+                if not reused:
+                    raise
+
+    def _set_timeout(self, deadline: float) -> None:
+        conn = self._conn
+        assert conn is not None, "called with a request in flight"
+        remaining = self._remaining(deadline)
+        conn.timeout = remaining
+        if conn.sock is not None:
+            conn.sock.settimeout(remaining)
+
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("deadline passed")
+        return remaining
+
+    def _disconnect(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,86 +1,44 @@
-"""Regex-based filler word removal and text formatting."""
+"""Filler word removal and text formatting."""
 
 from __future__ import annotations
 
-import re
+import hashlib
+from pathlib import Path
 
-
-# Filler words/phrases to remove (case-insensitive, word-boundary matched)
-_FILLERS = [
-    r"\bum\b",
-    r"\buh\b",
-    r"\buh huh\b",
-    r"\bmm\b",
-    r"\bhmm\b",
-    r"\bmhm\b",
-    r"\byou know\b",
-    r"\bi mean\b",
-    r"\bkind of\b",
-    r"\bsort of\b",
-    r"\bbasically\b",
-    r"\bliterally\b",
-    r"\bokay so\b",
-    r"\byeah\b",
-]
-
-_FILLER_PATTERN = re.compile(
-    "|".join(_FILLERS),
-    re.IGNORECASE,
-)
-
-# Conjunctions that typically need a comma before them when joining clauses.
-# Requires 3+ word chars before the conjunction to avoid "So ," at sentence starts.
-_COMMA_BEFORE_CONJ = re.compile(
-    r"(?<=[a-z]{3})(\s+)(but|and|so|yet|or|because|since|although|though|while)\s",
-    re.IGNORECASE,
-)
+from dictate.processing.cleanup import DEFAULT_DICTIONARY, CleanupEngine
+from dictate.processing.dictionary import DictionaryFile
 
 
 class RegexProcessor:
-    """Removes filler words and cleans up transcription output."""
-
-    def process(self, text: str) -> str:
-        if not text or not text.strip():
-            return ""
-
-        result = _FILLER_PATTERN.sub("", text)
-
-        # Collapse multiple spaces
-        result = re.sub(r"\s{2,}", " ", result).strip()
-
-        # Remove leading/trailing commas and spaces left by filler removal
-        result = re.sub(r"(^[,\s]+|[,\s]+$)", "", result)
-        result = re.sub(r"\s*,\s*,\s*", ", ", result)
-        result = re.sub(r"^\s*,\s*", "", result)
-
-        # Add commas before conjunctions joining clauses (if not already there)
-        result = _COMMA_BEFORE_CONJ.sub(r", \2 ", result)
-
-        # Clean up double commas or space-comma artifacts
-        result = re.sub(r"\s+,", ",", result)
-        result = re.sub(r",\s*,", ",", result)
-
-        # Fix capitalization after commas: lowercase words after commas (mid-sentence)
-        # This fixes ", So" and ", And" artifacts
-        result = re.sub(
-            r",\s+([A-Z])([a-z]+)(?!\s+[A-Z])",
-            lambda m: ", " + m.group(1).lower() + m.group(2),
-            result,
-        )
-
-        # Capitalize after sentence-ending punctuation
-        result = re.sub(
-            r"([.!?])\s+([a-z])",
-            lambda m: m.group(1) + " " + m.group(2).upper(),
-            result,
-        )
-
-        # Capitalize first letter
-        if result:
-            result = result[0].upper() + result[1:]
-
-        # Ensure trailing period if no sentence-ending punctuation
-        if result and result[-1] not in ".!?":
-            result += "."
-
-        return result
+    """Removes filler words and cleans up transcription output.
+
+    Args:
+        dictionary_path: Optional user dictionary of extra fillers and replacements.
+            Its entries take priority over the built-in fillers, and the file is
+            reloaded whenever it changes.
+    """
+
+    def __init__(self, dictionary_path: str | Path | None = None) -> None:
+        self._dictionary = DictionaryFile(dictionary_path) if dictionary_path else None
+        self._engine = CleanupEngine()
+        self._fingerprint = "regex"
+        self._reload()
+
+    def _reload(self) -> None:
+        if self._dictionary is None:
+            return
+        entries = self._dictionary.poll()
+        if entries is not None:
+            self._engine = CleanupEngine([*entries, *DEFAULT_DICTIONARY])
+            digest = hashlib.sha256(repr(entries).encode()).hexdigest()[:16]
+            self._fingerprint = f"regex:{digest}"
+
+    def fingerprint(self) -> str:
+        """Identifies the dictionary in use, so cached results expire when it changes."""
+        self._reload()
+        return self._fingerprint
+
+    def process(self, text: str, deadline: float | None = None) -> str:
+        # Takes microseconds, so the deadline never matters
+        self._reload()
+        return self._engine.clean(text)
@@ -0,0 +1,88 @@
+"""Sentence-by-sentence text cleanup that overlaps with decoding."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from concurrent.futures import Executor, Future
+
+from dictate.processing.base import TextProcessor
+
+# A segment ends a sentence if it ends in ., ! or ?, optionally followed by closing quotes
+# or brackets
+_SENTENCE_END = re.compile(r"[.!?][\"'”’)\]]*$")
+
+
+class OverlappedCleanup:
+    """Runs a text processor on each finished sentence while later segments still decode.
+
+    Segments are buffered until one ends a sentence, then the buffered sentence is
+    handed to ``processor`` on ``executor``. Cleanup therefore never sees half a
+    sentence, so fillers, commas and capitalization come out as they would for the
+    whole text. Use a single-worker executor to keep processor calls serialized.
+
+    With ``timeout_seconds``, cleanup ends at most that long after finish(): every
+    sentence not yet cleaned by then shares one deadline, so a slow processor falls
+    back for all of them at once instead of timing out one sentence after another.
+    """
+
+    def __init__(
+        self, processor: TextProcessor, executor: Executor, timeout_seconds: float | None = None
+    ) -> None:
+        self._processor = processor
+        self._executor = executor
+        self._timeout_seconds = timeout_seconds
+        self._deadline: float | None = None
+        self._pending: list[str] = []
+        self._futures: list[Future[str]] = []
+        self._busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def busy_seconds(self) -> float:
+        """Total time spent in the processor so far."""
+        with self._lock:
+            return self._busy_seconds
+
+    @property
+    def submitted(self) -> int:
+        """Number of sentences handed to the processor so far."""
+        return len(self._futures)
+
+    def add(self, segment: str) -> None:
+        segment = segment.strip()
+        if not segment:
+            return
+        self._pending.append(segment)
+        if _SENTENCE_END.search(segment):
+            self._submit()
+
+    def finish(self) -> str:
+        """Clean the unfinished last sentence and return all cleaned sentences, in order."""
+        if self._timeout_seconds is not None:
+            with self._lock:
+                self._deadline = time.monotonic() + self._timeout_seconds
+        self._submit()
+        return " ".join(text for text in (f.result() for f in self._futures) if text)
+
+    def cancel(self) -> None:
+        for future in self._futures:
+            future.cancel()
+
+    def _submit(self) -> None:
+        if self._pending:
+            self._futures.append(self._executor.submit(self._process, " ".join(self._pending)))
+            self._pending = []
+
+    def _process(self, text: str) -> str:
+        start = time.perf_counter()
+        with self._lock:
+            deadline = self._deadline
+        try:
+            if deadline is None:
+                return self._processor.process(text)
+            return self._processor.process(text, deadline=deadline)
+        finally:
+            with self._lock:
+                self._busy_seconds += time.perf_counter() - start
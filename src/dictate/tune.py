@@ -0,0 +1,205 @@
+"""Benchmark decode settings on this machine and pick the fastest that stays accurate."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import statistics
+import string
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+from dictate.asr.base import ASREngine
+
+logger = logging.getLogger(__name__)
+
+# Most to least precise; the most precise candidate's output is the default reference
+_PRECISION = (
+    "float32", "bfloat16", "float16", "int16",
+    "int8_float32", "int8_bfloat16", "int8_float16", "int8",
+)
+
+DEFAULT_COMPUTE_TYPES = ("int8", "int8_float32", "int16", "float32")
+DEFAULT_BEAM_SIZES = (1, 3, 5)
+
+
+@dataclass(frozen=True)
+class DecodeSettings:
+    compute_type: str
+    cpu_threads: int
+    beam_size: int
+
+    def env(self) -> dict[str, str]:
+        """The settings as .env entries."""
+        return {
+            "WHISPER_COMPUTE_TYPE": self.compute_type,
+            "WHISPER_CPU_THREADS": str(self.cpu_threads),
+            "WHISPER_BEAM_SIZE": str(self.beam_size),
+        }
+
+
+@dataclass(frozen=True)
+class TuneResult:
+    """Measurements for one combination of settings.
+
+    Attributes:
+        latency_seconds: Median decode time of the reference clip.
+        wer: Word error rate against the reference transcript.
+    """
+
+    settings: DecodeSettings
+    latency_seconds: float
+    wer: float
+    text: str
+
+
+# Builds an engine that decodes with the given settings
+EngineFactory = Callable[[DecodeSettings], ASREngine]
+
+
+def _words(text: str) -> list[str]:
+    return [w for w in (w.strip(string.punctuation).lower() for w in text.split()) if w]
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level edit distance divided by the reference length, ignoring case and punctuation."""
+    ref, hyp = _words(reference), _words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, word in enumerate(ref, 1):
+        current = [i]
+        for j, other in enumerate(hyp, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (word != other))
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def load_clip(path: Path, sample_rate: int = 16000) -> np.ndarray:
+    from faster_whisper.audio import decode_audio
+
+    return decode_audio(str(path), sampling_rate=sample_rate)
+
+
+def supported_compute_types(device: str = "cpu") -> set[str]:
+    import ctranslate2
+
+    return ctranslate2.get_supported_compute_types(device)
+
+
+def default_thread_counts() -> list[int]:
+    """Powers of two up to the core count, plus the core count itself."""
+    cores = os.cpu_count() or 1
+    counts = {cores}
+    count = 1
+    while count < cores:
+        counts.add(count)
+        count *= 2
+    return sorted(counts)
+
+
+def candidate_settings(
+    compute_types: Iterable[str], cpu_threads: Iterable[int], beam_sizes: Iterable[int]
+) -> list[DecodeSettings]:
+    return [
+        DecodeSettings(compute_type, threads, beam)
+        for compute_type, threads, beam in itertools.product(compute_types, cpu_threads, beam_sizes)
+    ]
+
+
+def _reference_rank(settings: DecodeSettings) -> tuple[int, int, int]:
+    precision = (
+        len(_PRECISION) - _PRECISION.index(settings.compute_type)
+        if settings.compute_type in _PRECISION
+        else 0
+    )
+    return precision, settings.beam_size, settings.cpu_threads
+
+
+def measure(
+    engine_factory: EngineFactory,
+    settings: DecodeSettings,
+    audio: np.ndarray,
+    reference: str | None,
+    sample_rate: int = 16000,
+    repeat: int = 3,
+) -> TuneResult:
+    """Decode ``audio`` once to warm up, then ``repeat`` more times to time it.
+
+    A ``reference`` of None scores the output against itself.
+    """
+    engine = engine_factory(settings)
+    try:
+        engine.ensure_loaded()
+        text = engine.transcribe(audio, sample_rate)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            engine.transcribe(audio, sample_rate)
+            timings.append(time.perf_counter() - start)
+    finally:
+        unload = getattr(engine, "unload", None)
+        if unload is not None:
+            unload()
+    wer = word_error_rate(text if reference is None else reference, text)
+    return TuneResult(settings, statistics.median(timings), wer, text)
+
+
+def tune(
+    audio: np.ndarray,
+    engine_factory: EngineFactory,
+    candidates: Sequence[DecodeSettings],
+    reference: str | None = None,
+    sample_rate: int = 16000,
+    repeat: int = 3,
+    on_result: Callable[[TuneResult], None] | None = None,
+) -> list[TuneResult]:
+    """Measure every candidate on ``audio``.
+
+    Without a ``reference`` transcript, the output of the most precise candidate
+    (widest compute type, largest beam) stands in for one, so WER then measures how
+    far the cheaper settings drift from the best this model can do.
+    """
+    pending = list(candidates)
+    results: list[TuneResult] = []
+
+    def run(settings: DecodeSettings, reference: str | None) -> TuneResult:
+        result = measure(engine_factory, settings, audio, reference, sample_rate, repeat)
+        logger.info(
+            "%s: %.3fs, WER %.1f%%", settings, result.latency_seconds, 100 * result.wer
+        )
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    if reference is None:
+        best = max(pending, key=_reference_rank)
+        pending.remove(best)
+        reference = run(best, None).text
+    for settings in pending:
+        run(settings, reference)
+    return results
+
+
+def pick_best(results: Iterable[TuneResult], max_wer: float) -> TuneResult | None:
+    """The fastest result whose WER is at most ``max_wer``, or None if none qualifies."""
+    accurate = [r for r in results if r.wer <= max_wer]
+    return min(accurate, key=lambda r: r.latency_seconds, default=None)
+
+
+def write_settings(env_path: Path, settings: DecodeSettings, device: str = "cpu") -> None:
+    """Set the WHISPER_* decode entries in ``env_path``, keeping all other lines."""
+    from dotenv import set_key
+
+    env_path.touch(mode=0o600, exist_ok=True)
+    entries = {"WHISPER_DEVICE": device, **settings.env()}
+    for key, value in entries.items():
+        set_key(str(env_path), key, value, quote_mode="never")
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import threading
+from typing import Iterator
+
 import pytest
+from transcription_api import FakeTranscriptionAPI
 
 from dictate.config import Config
 
@@ -15,3 +19,13 @@ def default_config() -> Config:
 @pytest.fixture
 def api_config() -> Config:
     return Config(asr_engine="openai_api", openai_api_key="test-key-123")
+
+
+@pytest.fixture
+def fake_api() -> Iterator[FakeTranscriptionAPI]:
+    server = FakeTranscriptionAPI()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
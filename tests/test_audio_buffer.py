@@ -0,0 +1,200 @@
+"""Tests for the growable capture buffer."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dictate.audio.buffer import AudioBuffer, RingBuffer, SpillingAudioBuffer
+
+
+class TestAudioBuffer:
+    def test_starts_empty(self) -> None:
+        buffer = AudioBuffer(block_frames=100)
+        assert len(buffer) == 0
+        assert buffer.view().size == 0
+        assert buffer.capacity == 100
+
+    def test_invalid_block_size(self) -> None:
+        with pytest.raises(ValueError, match="block_frames"):
+            AudioBuffer(block_frames=0)
+
+    def test_append_flattens_column_blocks(self) -> None:
+        buffer = AudioBuffer(block_frames=100)
+        buffer.append(np.full((10, 1), 0.5, dtype=np.float32))
+        buffer.append(np.full((5, 1), 0.25, dtype=np.float32))
+
+        audio = buffer.view()
+        assert audio.shape == (15,)
+        assert audio.dtype == np.float32
+        assert np.allclose(audio[:10], 0.5)
+        assert np.allclose(audio[10:], 0.25)
+
+    def test_grows_in_whole_blocks(self) -> None:
+        buffer = AudioBuffer(block_frames=100)
+        buffer.append(np.ones(250, dtype=np.float32))
+
+        assert len(buffer) == 250
+        assert buffer.capacity == 300
+        assert buffer.capacity % 100 == 0
+
+    def test_growth_preserves_samples(self) -> None:
+        buffer = AudioBuffer(block_frames=64)
+        expected = np.arange(1000, dtype=np.float32)
+        for start in range(0, 1000, 37):
+            buffer.append(expected[start:start + 37])
+
+        assert np.array_equal(buffer.view(), expected)
+
+    def test_view_is_zero_copy(self) -> None:
+        buffer = AudioBuffer(block_frames=100)
+        buffer.append(np.ones(50, dtype=np.float32))
+
+        assert np.shares_memory(buffer.view(), buffer.view(10, 20))
+
+    def test_view_survives_growth(self) -> None:
+        buffer = AudioBuffer(block_frames=10)
+        buffer.append(np.ones(10, dtype=np.float32))
+        before = buffer.view()
+        buffer.append(np.zeros(100, dtype=np.float32))
+
+        assert np.allclose(before, 1.0)
+        assert len(buffer) == 110
+
+    def test_growth_never_moves_stored_samples(self) -> None:
+        buffer = AudioBuffer(block_frames=100)
+        buffer.append(np.ones(100, dtype=np.float32))
+        first_block = buffer.view()
+        for _ in range(50):
+            buffer.append(np.zeros(64, dtype=np.float32))
+
+        assert buffer.capacity == 3300
+        assert np.shares_memory(first_block, buffer.view(0, 100))
+
+    def test_view_across_blocks(self) -> None:
+        buffer = AudioBuffer(block_frames=10)
+        buffer.append(np.arange(35, dtype=np.float32))
+
+        assert np.array_equal(buffer.view(5, 25), np.arange(5, 25))
+        assert np.array_equal(buffer.view(20), np.arange(20, 35))
+        assert np.shares_memory(buffer.view(30, 35), buffer.view(32))  # one block: no copy
+
+    def test_view_bounds_are_clamped(self) -> None:
+        buffer = AudioBuffer(block_frames=100)
+        buffer.append(np.ones(20, dtype=np.float32))
+
+        assert buffer.view(15).shape == (5,)
+        assert buffer.view(5, 500).shape == (15,)
+        assert buffer.view(50).size == 0
+
+    def test_view_of_exactly_full_buffer_end(self) -> None:
+        buffer = AudioBuffer(block_frames=10)
+        buffer.append(np.ones(20, dtype=np.float32))
+
+        assert buffer.view(20).size == 0
+
+
+class TestSpillingAudioBuffer:
+    def test_stays_in_ram_below_threshold(self) -> None:
+        buffer = SpillingAudioBuffer(block_frames=100, spill_frames=1000)
+        buffer.append(np.ones(900, dtype=np.float32))
+
+        assert not buffer.spilled
+        assert not isinstance(buffer.view(), np.memmap)
+        assert buffer.capacity <= 1000
+
+    def test_spills_to_memmap_past_threshold(self) -> None:
+        buffer = SpillingAudioBuffer(block_frames=100, spill_frames=250)
+        expected = np.arange(1000, dtype=np.float32)
+        for start in range(0, 1000, 64):
+            buffer.append(expected[start:start + 64])
+
+        assert buffer.spilled
+        audio = buffer.view()
+        assert isinstance(audio, np.memmap)
+        assert np.array_equal(audio, expected)
+
+    def test_file_grows_in_single_blocks(self) -> None:
+        buffer = SpillingAudioBuffer(block_frames=100, spill_frames=100)
+        buffer.append(np.ones(150, dtype=np.float32))
+        assert buffer.capacity == 200
+        buffer.append(np.ones(100, dtype=np.float32))
+        assert buffer.capacity == 300
+
+    def test_views_survive_remap(self) -> None:
+        buffer = SpillingAudioBuffer(block_frames=10, spill_frames=10)
+        buffer.append(np.full(15, 0.5, dtype=np.float32))
+        before = buffer.view()
+        buffer.append(np.zeros(100, dtype=np.float32))
+
+        assert np.allclose(before, 0.5)
+        assert np.allclose(buffer.view(0, 15), 0.5)
+
+    def test_close_releases_file_and_keeps_views(self) -> None:
+        buffer = SpillingAudioBuffer(block_frames=10, spill_frames=10)
+        expected = np.arange(35, dtype=np.float32)
+        buffer.append(expected)
+        before = buffer.view()
+        file = buffer._file
+        assert file is not None
+
+        buffer.close()
+
+        assert file.closed
+        assert np.array_equal(before, expected)
+        assert np.array_equal(buffer.view(), expected)
+        buffer.close()  # idempotent
+
+    def test_garbage_collection_closes_file(self) -> None:
+        buffer = SpillingAudioBuffer(block_frames=10, spill_frames=10)
+        buffer.append(np.ones(25, dtype=np.float32))
+        file = buffer._file
+        assert file is not None
+
+        del buffer
+
+        assert file.closed
+
+
+class TestRingBuffer:
+    def test_keeps_samples_in_order_until_full(self) -> None:
+        ring = RingBuffer(5)
+        ring.write(np.arange(3, dtype=np.float32))
+
+        assert len(ring) == 3
+        assert np.array_equal(ring.read(), [0, 1, 2])
+
+    def test_drops_oldest_when_wrapping(self) -> None:
+        ring = RingBuffer(5)
+        ring.write(np.arange(3, dtype=np.float32))
+        ring.write(np.arange(3, 7, dtype=np.float32).reshape(-1, 1))
+
+        assert np.array_equal(ring.read(), [2, 3, 4, 5, 6])
+
+    def test_write_larger_than_capacity(self) -> None:
+        ring = RingBuffer(4)
+        ring.write(np.arange(10, dtype=np.float32))
+
+        assert np.array_equal(ring.read(), [6, 7, 8, 9])
+
+    def test_read_returns_copy(self) -> None:
+        ring = RingBuffer(4)
+        ring.write(np.ones(4, dtype=np.float32))
+        snapshot = ring.read()
+        ring.write(np.zeros(4, dtype=np.float32))
+
+        assert np.allclose(snapshot, 1.0)
+
+    def test_clear(self) -> None:
+        ring = RingBuffer(4)
+        ring.write(np.ones(3, dtype=np.float32))
+        ring.clear()
+
+        assert len(ring) == 0
+        assert ring.read().size == 0
+
+    def test_zero_capacity_keeps_nothing(self) -> None:
+        ring = RingBuffer(0)
+        ring.write(np.ones(3, dtype=np.float32))
+
+        assert ring.read().size == 0
@@ -0,0 +1,193 @@
+"""Tests for offline batch transcription."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from dictate.batch import (
+    BatchStats,
+    FileResult,
+    JsonlWriter,
+    TextWriter,
+    find_audio_files,
+    transcribe_directory,
+)
+
+
+class _FakeEngine:
+    """Reports the clip length instead of decoding, so tests need no model."""
+
+    def ensure_loaded(self) -> None:
+        pass
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
+        if audio.size == 0:
+            raise ValueError("empty clip")
+        return f"um {len(audio) / sample_rate:.0f} seconds"
+
+
+def _fake_engine() -> _FakeEngine:
+    # Module-level so the process pool can pickle it
+    return _FakeEngine()
+
+
+def _write_wav(path: Path, seconds: float, sample_rate: int = 16000) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    audio = (0.1 * np.sin(np.arange(int(seconds * sample_rate)) / 10)).astype(np.float32)
+    wavfile.write(path, sample_rate, audio)
+
+
+@pytest.fixture
+def recordings(tmp_path: Path) -> Path:
+    root = tmp_path / "recordings"
+    _write_wav(root / "a.wav", 1)
+    _write_wav(root / "b.wav", 2)
+    _write_wav(root / "nested" / "c.wav", 3, sample_rate=8000)  # resampled on load
+    (root / "notes.txt").parent.mkdir(parents=True, exist_ok=True)
+    (root / "notes.txt").write_text("not audio")
+    return root
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestFindAudioFiles:
+    def test_finds_audio_recursively(self, recordings: Path) -> None:
+        found = [p.relative_to(recordings).as_posix() for p in find_audio_files(recordings)]
+        assert found == ["a.wav", "b.wav", "nested/c.wav"]
+
+
+class TestTranscribeDirectory:
+    def test_writes_jsonl_in_process(self, recordings: Path, tmp_path: Path) -> None:
+        output = tmp_path / "out.jsonl"
+
+        stats = transcribe_directory(recordings, JsonlWriter(output), _fake_engine, workers=0)
+
+        records = {r["path"]: r for r in _read_jsonl(output)}
+        assert set(records) == {"a.wav", "b.wav", "nested/c.wav"}
+        assert records["b.wav"]["text"] == "2 seconds."  # cleaned up by RegexProcessor
+        assert records["nested/c.wav"]["audio_seconds"] == pytest.approx(3.0, abs=0.01)
+        assert stats.files == 3
+        assert stats.audio_seconds == pytest.approx(6.0, abs=0.05)
+
+    def test_no_cleanup_keeps_raw_text(self, recordings: Path, tmp_path: Path) -> None:
+        output = tmp_path / "out.jsonl"
+
+        transcribe_directory(
+            recordings, JsonlWriter(output), _fake_engine, workers=0, cleanup=False
+        )
+
+        texts = {r["text"] for r in _read_jsonl(output)}
+        assert texts == {"um 1 seconds", "um 2 seconds", "um 3 seconds"}
+
+    def test_process_pool(self, recordings: Path, tmp_path: Path) -> None:
+        output = tmp_path / "out.jsonl"
+        seen: list[str] = []
+
+        stats = transcribe_directory(
+            recordings,
+            JsonlWriter(output),
+            _fake_engine,
+            workers=2,
+            on_result=lambda result: seen.append(result.path),
+        )
+
+        assert sorted(seen) == ["a.wav", "b.wav", "nested/c.wav"]
+        assert len(_read_jsonl(output)) == 3
+        assert stats.files == 3
+
+    def test_resume_skips_completed_files(self, recordings: Path, tmp_path: Path) -> None:
+        output = tmp_path / "out.jsonl"
+        # An earlier run finished a.wav, failed on b.wav and was killed mid-write
+        output.write_text(
+            json.dumps({"path": "a.wav", "text": "done", "error": ""}) + "\n"
+            + json.dumps({"path": "b.wav", "text": "", "error": "boom"}) + "\n"
+            + '{"path": "nested/c.wav", "te'
+        )
+
+        stats = transcribe_directory(recordings, JsonlWriter(output), _fake_engine, workers=0)
+
+        assert stats.skipped == 1
+        assert stats.files == 2
+        lines = output.read_text().splitlines()
+        assert json.loads(lines[-1])["path"] == "nested/c.wav"
+        assert json.loads(lines[-2])["path"] == "b.wav"
+
+    def test_no_resume_redoes_everything(self, recordings: Path, tmp_path: Path) -> None:
+        output = tmp_path / "out.jsonl"
+        transcribe_directory(recordings, JsonlWriter(output), _fake_engine, workers=0)
+
+        stats = transcribe_directory(
+            recordings, JsonlWriter(output), _fake_engine, workers=0, resume=False
+        )
+
+        assert stats.files == 3
+        assert len(_read_jsonl(output)) == 6
+
+    def test_text_output_and_resume(self, recordings: Path, tmp_path: Path) -> None:
+        out_dir = tmp_path / "text"
+        sources = [p.relative_to(recordings).as_posix() for p in find_audio_files(recordings)]
+
+        transcribe_directory(recordings, TextWriter(out_dir, sources), _fake_engine, workers=0)
+        stats = transcribe_directory(
+            recordings, TextWriter(out_dir, sources), _fake_engine, workers=0
+        )
+
+        assert (out_dir / "nested" / "c.txt").read_text() == "3 seconds.\n"
+        assert not list(out_dir.rglob("*.part"))
+        assert stats.skipped == 3
+        assert stats.files == 0
+
+    def test_text_output_keeps_extension_when_names_collide(self, tmp_path: Path) -> None:
+        writer = TextWriter(tmp_path, ["a.wav", "a.flac", "b.wav"])
+
+        writer.write(FileResult(path="a.wav", text="from wav"))
+        writer.write(FileResult(path="a.flac", text="from flac"))
+        writer.write(FileResult(path="b.wav", text="only b"))
+
+        assert (tmp_path / "a.wav.txt").read_text() == "from wav\n"
+        assert (tmp_path / "a.flac.txt").read_text() == "from flac\n"
+        assert (tmp_path / "b.txt").read_text() == "only b\n"
+        assert writer.completed() == {"a.wav", "a.flac", "b.wav"}
+
+    def test_jsonl_lines_are_on_disk_before_close(self, tmp_path: Path) -> None:
+        output = tmp_path / "out.jsonl"
+        writer = JsonlWriter(output)
+
+        writer.write(FileResult(path="a.wav", text="first"))
+        writer.write(FileResult(path="b.wav", text="second"))
+
+        assert [r["text"] for r in _read_jsonl(output)] == ["first", "second"]
+        writer.close()
+
+    def test_unreadable_file_is_reported_not_fatal(self, recordings: Path, tmp_path: Path) -> None:
+        (recordings / "broken.wav").write_bytes(b"not a wav file")
+        output = tmp_path / "out.jsonl"
+
+        stats = transcribe_directory(recordings, JsonlWriter(output), _fake_engine, workers=0)
+
+        records = {r["path"]: r for r in _read_jsonl(output)}
+        assert records["broken.wav"]["error"]
+        assert stats.failed == 1
+        assert stats.files == 3
+
+
+class TestBatchStats:
+    def test_rates(self) -> None:
+        stats = BatchStats(wall_seconds=2.0)
+        stats.add(FileResult("a.wav", "x", audio_seconds=10.0, decode_seconds=3.0))
+        stats.add(FileResult("b.wav", "y", audio_seconds=10.0, decode_seconds=1.0))
+        stats.add(FileResult("c.wav", "", error="bad"))
+
+        assert stats.files == 2
+        assert stats.failed == 1
+        assert stats.files_per_second == pytest.approx(1.0)
+        assert stats.rtf == pytest.approx(0.1)
+        assert stats.decode_rtf == pytest.approx(0.2)
+        assert "files/s" in stats.summary()
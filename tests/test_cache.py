@@ -0,0 +1,173 @@
+"""Tests for the text processor result cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from dictate.config import Config
+from dictate.processing.cache import CachedProcessor
+from dictate.processing.factory import create_text_processor
+from dictate.processing.regex_processor import RegexProcessor
+
+
+class _CountingProcessor:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.version = "v1"
+        self.last_fell_back = False
+
+    def fingerprint(self) -> str:
+        return self.version
+
+    def process(self, text: str) -> str:
+        self.calls.append(text)
+        return f"{text.upper()} ({self.version})"
+
+
+@pytest.fixture
+def inner() -> _CountingProcessor:
+    return _CountingProcessor()
+
+
+class TestCachedProcessor:
+    def test_hit_skips_processor(self, inner: _CountingProcessor) -> None:
+        cache = CachedProcessor(inner)
+
+        assert cache.process("thanks") == "THANKS (v1)"
+        assert cache.process("thanks") == "THANKS (v1)"
+
+        assert inner.calls == ["thanks"]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self, inner: _CountingProcessor) -> None:
+        cache = CachedProcessor(inner, max_entries=2)
+        cache.process("a")
+        cache.process("b")
+        cache.process("a")  # "b" is now least recently used
+        cache.process("c")
+
+        cache.process("a")
+        cache.process("b")
+
+        assert inner.calls == ["a", "b", "c", "b"]
+        assert cache.stats().entries == 2
+
+    def test_fingerprint_change_clears(self, inner: _CountingProcessor) -> None:
+        cache = CachedProcessor(inner)
+        cache.process("thanks")
+
+        inner.version = "v2"
+
+        assert cache.process("thanks") == "THANKS (v2)"
+        assert cache.stats().entries == 1
+
+    def test_fallback_results_not_stored(self, inner: _CountingProcessor) -> None:
+        cache = CachedProcessor(inner)
+        inner.last_fell_back = True
+        cache.process("thanks")
+
+        inner.last_fell_back = False
+        cache.process("thanks")
+        cache.process("thanks")
+
+        assert len(inner.calls) == 2
+
+    def test_works_without_fingerprint(self) -> None:
+        inner = MagicMock(spec=["process"])
+        inner.process.return_value = "Sounds good."
+        cache = CachedProcessor(inner, config_key="regex")
+
+        cache.process("sounds good")
+        cache.process("sounds good")
+
+        inner.process.assert_called_once_with("sounds good")
+
+    def test_persists_to_disk(self, inner: _CountingProcessor, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "cleanup.json"
+        cache = CachedProcessor(inner, path=path)
+        cache.process("thanks")
+        cache.flush()
+
+        reloaded = CachedProcessor(inner, path=path)
+
+        assert reloaded.process("thanks") == "THANKS (v1)"
+        assert inner.calls == ["thanks"]
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_persisted_entries_expire_with_config(
+        self, inner: _CountingProcessor, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "cleanup.json"
+        cache = CachedProcessor(inner, config_key="ollama", path=path)
+        cache.process("thanks")
+        cache.flush()
+
+        cache = CachedProcessor(inner, config_key="regex", path=path)
+        cache.process("thanks")
+        cache.flush()
+
+        assert len(inner.calls) == 2
+        assert len(json.loads(path.read_text())["entries"]) == 1
+
+    def test_misses_saved_together_in_background(
+        self, inner: _CountingProcessor, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "cleanup.json"
+        cache = CachedProcessor(inner, path=path, save_delay_seconds=0.1)
+
+        for text in ("a", "b", "c"):
+            cache.process(text)
+
+        # Nothing is written on the lookups themselves
+        assert not path.exists()
+        deadline = time.monotonic() + 2.0
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(json.loads(path.read_text())["entries"]) == 3
+
+    def test_flush_without_new_entries_writes_nothing(
+        self, inner: _CountingProcessor, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "cleanup.json"
+        cache = CachedProcessor(inner, path=path)
+        cache.process("thanks")
+        cache.flush()
+        path.unlink()
+
+        cache.process("thanks")  # a hit adds nothing to save
+        cache.flush()
+
+        assert not path.exists()
+
+    def test_unreadable_file_is_ignored(self, inner: _CountingProcessor, tmp_path: Path) -> None:
+        path = tmp_path / "cleanup.json"
+        path.write_text("{not json")
+
+        assert CachedProcessor(inner, path=path).process("thanks") == "THANKS (v1)"
+
+    def test_dictionary_change_expires_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "dictionary.txt"
+        path.write_text("k8s => Kubernetes\n")
+        cache = CachedProcessor(RegexProcessor(dictionary_path=path))
+        assert cache.process("deploy k8s") == "Deploy Kubernetes."
+
+        path.write_text("k8s => K8s cluster\n")
+        os.utime(path, (2_000, 2_000))
+
+        assert cache.process("deploy k8s") == "Deploy K8s cluster."
+        assert cache.stats().hits == 0
+
+    def test_factory_wraps_processor(self) -> None:
+        processor = create_text_processor(Config(text_cache_size=8))
+
+        assert isinstance(processor, CachedProcessor)
+        assert isinstance(processor.processor, RegexProcessor)
+        assert isinstance(create_text_processor(Config(text_cache_size=0)), RegexProcessor)
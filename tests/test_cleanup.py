@@ -0,0 +1,134 @@
+"""Tests for the single-pass cleanup engine."""
+
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from dictate.processing.cleanup import CleanupEngine
+from dictate.processing.dictionary import DictionaryEntry
+
+# The chained re.sub implementation the engine replaced; its output is the spec
+_FILLER_PATTERN = re.compile(
+    r"\bum\b|\buh\b|\buh huh\b|\bmm\b|\bhmm\b|\bmhm\b|\byou know\b|\bi mean\b|\bkind of\b"
+    r"|\bsort of\b|\bbasically\b|\bliterally\b|\bokay so\b|\byeah\b",
+    re.IGNORECASE,
+)
+_COMMA_BEFORE_CONJ = re.compile(
+    r"(?<=[a-z]{3})(\s+)(but|and|so|yet|or|because|since|although|though|while)\s",
+    re.IGNORECASE,
+)
+
+
+def _reference(text: str) -> str:
+    if not text or not text.strip():
+        return ""
+    result = _FILLER_PATTERN.sub("", text)
+    result = re.sub(r"\s{2,}", " ", result).strip()
+    result = re.sub(r"(^[,\s]+|[,\s]+$)", "", result)
+    result = re.sub(r"\s*,\s*,\s*", ", ", result)
+    result = re.sub(r"^\s*,\s*", "", result)
+    result = _COMMA_BEFORE_CONJ.sub(r", \2 ", result)
+    result = re.sub(r"\s+,", ",", result)
+    result = re.sub(r",\s*,", ",", result)
+    result = re.sub(
+        r",\s+([A-Z])([a-z]+)(?!\s+[A-Z])",
+        lambda m: ", " + m.group(1).lower() + m.group(2),
+        result,
+    )
+    result = re.sub(r"([.!?])\s+([a-z])", lambda m: m.group(1) + " " + m.group(2).upper(), result)
+    if result:
+        result = result[0].upper() + result[1:]
+    if result and result[-1] not in ".!?":
+        result += "."
+    return result
+
+
+@pytest.fixture
+def engine() -> CleanupEngine:
+    return CleanupEngine()
+
+
+class TestCleanupEngine:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("", ""),
+            (" \n ", ""),
+            ("um uh yeah", ""),
+            ("um.", "."),
+            ("I went home and then I slept", "I went home, and then I slept."),
+            ("we tried but it failed so we left", "We tried, but it failed, so we left."),
+            ("cats and or dogs", "Cats, and or dogs."),
+            ("it is ok and fine", "It is ok and fine."),
+            ("wait, And then", "Wait, and then."),
+            ("wait, So Then", "Wait, So Then."),
+            ("done. next thing! and? more", "Done. Next thing! And? More."),
+            ("well , , , yes", "Well, yes."),
+            ("well,,,,, yes", "Well,, yes."),
+            ("a, ,b", "A, b."),
+            ("uh huh that works", "Huh that works."),
+            ("you  know it", "You know it."),
+            ("I mean it works you know", "It works."),
+            ("okay so here we go", "Here we go."),
+            ("UM Kind Of great", "Great."),
+            ("line one\nline two", "Line one\nline two."),
+        ],
+    )
+    def test_cases(self, engine: CleanupEngine, text: str, expected: str) -> None:
+        assert engine.clean(text) == expected
+        assert _reference(text) == expected
+
+    def test_matches_chained_regex_on_random_input(self, engine: CleanupEngine) -> None:
+        words = [
+            "um", "Um", "UH", "uh", "huh", "you", "know", "I", "i", "mean", "kind", "of",
+            "okay", "so", "So", "yeah", "and", "And", "but", "or", "Or", "though", "since",
+            "cat", "Dog", "Hello", "Ab", "ab", "A", "McDonald", "x1", "_a", "Ok", "It",
+            "İ", "ſo", "Kind", "naïve", "42",
+        ]
+        gaps = [
+            " ", " ", " ", "  ", "\n", "\t", ",", " ,", ", ", ",,", " , , ", "...", ". ",
+            "! ", "? ", " . ", "-", "'", "(", ",, , ,,",
+        ]
+        rng = random.Random(0)
+        for _ in range(5000):
+            pieces = [rng.choice(gaps)] if rng.random() < 0.3 else []
+            for _ in range(rng.randint(1, 12)):
+                pieces += [rng.choice(words), rng.choice(gaps) if rng.random() < 0.5 else " "]
+            text = "".join(pieces)
+            assert engine.clean(text) == _reference(text), repr(text)
+
+    def test_custom_fillers_and_conjunctions(self) -> None:
+        engine = CleanupEngine(
+            [DictionaryEntry("like"), DictionaryEntry("at the end of the day")],
+            conjunctions=("then",),
+        )
+
+        result = engine.clean("it was like good at the end of the day then we left")
+
+        assert result == "It was good, then we left."
+
+    def test_replacements(self) -> None:
+        engine = CleanupEngine(
+            [
+                DictionaryEntry("uh-huh"),
+                DictionaryEntry("k8s", "Kubernetes"),
+                DictionaryEntry("asap", "as soon as possible"),
+                DictionaryEntry("node js", "Node.js"),
+            ]
+        )
+
+        result = engine.clean("uh-huh deploy k8s asap. K8S runs node js apps")
+
+        assert result == "Deploy Kubernetes as soon as possible. Kubernetes runs Node.js apps."
+
+    def test_replacement_joins_clause_rules(self) -> None:
+        engine = CleanupEngine([DictionaryEntry("um"), DictionaryEntry("bc", "because")])
+
+        assert engine.clean("we stopped um bc it rained") == "We stopped, because it rained."
+
+    def test_rejects_phrase_with_edge_punctuation(self) -> None:
+        with pytest.raises(ValueError, match="c\\+\\+"):
+            CleanupEngine([DictionaryEntry("c++", "C++")])
@@ -37,10 +37,95 @@ class TestConfig:
         with pytest.raises(ValueError, match="TEXT_PROCESSOR"):
             Config(text_processor="gpt")
 
+    def test_invalid_text_cache_size(self) -> None:
+        with pytest.raises(ValueError, match="TEXT_CACHE_SIZE"):
+            Config(text_cache_size=-1)
+
+    def test_invalid_ollama_timeout(self) -> None:
+        with pytest.raises(ValueError, match="OLLAMA_TIMEOUT_SECONDS"):
+            Config(ollama_timeout_seconds=0)
+
     def test_invalid_hotkey_backend(self) -> None:
         with pytest.raises(ValueError, match="HOTKEY_BACKEND"):
             Config(hotkey_backend="keyboard")
 
+    def test_streaming_defaults(self) -> None:
+        config = Config()
+        assert config.streaming_transcription is False
+        assert config.stream_window_seconds == 10.0
+
+    def test_invalid_stream_window(self) -> None:
+        with pytest.raises(ValueError, match="STREAM_WINDOW_SECONDS"):
+            Config(stream_window_seconds=0)
+
+    def test_invalid_capture_backend(self) -> None:
+        with pytest.raises(ValueError, match="CAPTURE_BACKEND"):
+            Config(capture_backend="tape")
+
+    def test_invalid_disk_spill_seconds(self) -> None:
+        with pytest.raises(ValueError, match="DISK_SPILL_SECONDS"):
+            Config(capture_backend="disk", disk_spill_seconds=-1)
+
+    def test_invalid_idle_unload(self) -> None:
+        with pytest.raises(ValueError, match="MODEL_IDLE_UNLOAD_SECONDS"):
+            Config(model_idle_unload_seconds=-5)
+
+    def test_invalid_routing_settings(self) -> None:
+        with pytest.raises(ValueError, match="WHISPER_MODELS"):
+            Config(whisper_models=("tiny", "huge"))
+        with pytest.raises(ValueError, match="LATENCY_TARGET_SECONDS"):
+            Config(latency_target_seconds=0)
+        with pytest.raises(ValueError, match="MODEL_MEMORY_BUDGET_MB"):
+            Config(model_memory_budget_mb=0)
+
+    def test_invalid_decode_settings(self) -> None:
+        with pytest.raises(ValueError, match="WHISPER_DEVICE"):
+            Config(whisper_device="tpu")
+        with pytest.raises(ValueError, match="WHISPER_COMPUTE_TYPE"):
+            Config(whisper_compute_type="int4")
+        with pytest.raises(ValueError, match="WHISPER_BEAM_SIZE"):
+            Config(whisper_beam_size=0)
+        with pytest.raises(ValueError, match="WHISPER_CPU_THREADS"):
+            Config(whisper_cpu_threads=-1)
+
+    def test_invalid_parallel_decode_workers(self) -> None:
+        with pytest.raises(ValueError, match="PARALLEL_DECODE_WORKERS"):
+            Config(parallel_decode_workers=0)
+
+    def test_hybrid_engine_requires_key(self) -> None:
+        with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+            Config(asr_engine="hybrid")
+
+    def test_invalid_hybrid_timings(self) -> None:
+        with pytest.raises(ValueError, match="HYBRID_BUDGET_SECONDS"):
+            Config(hybrid_budget_seconds=0)
+        with pytest.raises(ValueError, match="HYBRID_DEADLINE_SECONDS"):
+            Config(hybrid_deadline_seconds=-1)
+
+    def test_invalid_preroll(self) -> None:
+        with pytest.raises(ValueError, match="PREROLL_MS"):
+            Config(preroll_ms=-1)
+
+    def test_invalid_api_upload_workers(self) -> None:
+        with pytest.raises(ValueError, match="API_UPLOAD_WORKERS"):
+            Config(api_upload_workers=0)
+
+    def test_invalid_long_form_seconds(self) -> None:
+        with pytest.raises(ValueError, match="LONG_FORM_SECONDS"):
+            Config(long_form_seconds=0)
+
+    def test_invalid_silence_threshold(self) -> None:
+        with pytest.raises(ValueError, match="SILENCE_THRESHOLD_DB"):
+            Config(silence_threshold_db=3)
+
+    def test_invalid_queue_size(self) -> None:
+        with pytest.raises(ValueError, match="TRANSCRIPTION_QUEUE_SIZE"):
+            Config(queue_size=0)
+
+    def test_invalid_queue_full_policy(self) -> None:
+        with pytest.raises(ValueError, match="QUEUE_FULL_POLICY"):
+            Config(queue_full_policy="wait")
+
     def test_frozen(self) -> None:
         config = Config()
         with pytest.raises(AttributeError):
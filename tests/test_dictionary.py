@@ -0,0 +1,139 @@
+"""Tests for the user dictionary and phrase matcher."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from dictate.config import Config
+from dictate.processing.dictionary import (
+    DictionaryEntry,
+    DictionaryFile,
+    PhraseMatcher,
+    parse_dictionary,
+)
+from dictate.processing.factory import create_text_processor
+from dictate.processing.regex_processor import RegexProcessor
+
+
+def _tokens(text: str) -> tuple[list[str], list[str]]:
+    import re
+
+    parts = re.split(r"(\w+)", text)
+    return parts, [w.lower() for w in parts[1::2]]
+
+
+def _write(path: Path, text: str, mtime: int) -> None:
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+class TestParseDictionary:
+    def test_fillers_replacements_and_comments(self) -> None:
+        entries = parse_dictionary(
+            "# comment\n\nlike\nk8s => Kubernetes  # inline\nasap   =>   as  soon as possible\n"
+            "you   know\n"
+        )
+
+        assert entries == [
+            DictionaryEntry("like"),
+            DictionaryEntry("k8s", "Kubernetes"),
+            DictionaryEntry("asap", "as soon as possible"),
+            DictionaryEntry("you know"),
+        ]
+
+    def test_error_names_line(self) -> None:
+        with pytest.raises(ValueError, match="words.txt:2: .*'-ok'"):
+            parse_dictionary("fine\n-ok => okay\n", "words.txt")
+
+
+class TestPhraseMatcher:
+    def test_first_listed_phrase_wins(self) -> None:
+        matcher = PhraseMatcher([DictionaryEntry("uh"), DictionaryEntry("uh huh", "yes")])
+        parts, folded = _tokens("uh huh")
+
+        assert matcher.match(parts, folded, 0).words == 1
+
+    def test_longer_phrase_listed_first_wins(self) -> None:
+        matcher = PhraseMatcher([DictionaryEntry("uh huh", "yes"), DictionaryEntry("uh")])
+        parts, folded = _tokens("uh huh")
+
+        match = matcher.match(parts, folded, 0)
+
+        assert (match.words, match.replacement) == (2, "yes")
+
+    def test_requires_exact_gaps_and_whole_words(self) -> None:
+        matcher = PhraseMatcher([DictionaryEntry("uh-huh"), DictionaryEntry("you know")])
+
+        for text in ("uh huh", "you, know", "you  know", "youknow"):
+            parts, folded = _tokens(text)
+            assert matcher.match(parts, folded, 0) is None, text
+
+    def test_large_dictionary(self) -> None:
+        entries = [DictionaryEntry(f"term{i} suffix{i % 7}", f"T{i}") for i in range(20000)]
+        matcher = PhraseMatcher(entries)
+        parts, folded = _tokens("say TERM12345 suffix4 now")
+
+        match = matcher.match(parts, folded, 1)
+
+        assert (match.words, match.replacement) == (2, "T12345")
+        assert matcher.match(parts, folded, 0) is None
+
+
+class TestDictionaryFile:
+    def test_polls_only_on_change(self, tmp_path: Path) -> None:
+        path = tmp_path / "dictionary.txt"
+        _write(path, "k8s => Kubernetes\n", 1_000)
+        dictionary = DictionaryFile(path)
+
+        assert dictionary.poll() == [DictionaryEntry("k8s", "Kubernetes")]
+        assert dictionary.poll() is None
+
+        _write(path, "k8s => K8s\n", 2_000)
+        assert dictionary.poll() == [DictionaryEntry("k8s", "K8s")]
+
+    def test_invalid_edit_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "dictionary.txt"
+        _write(path, "like\n", 1_000)
+        dictionary = DictionaryFile(path)
+        dictionary.poll()
+
+        _write(path, "like\n=> broken\n", 2_000)
+
+        assert dictionary.poll() is None
+        assert dictionary.poll() is None
+
+    def test_missing_file_is_empty(self, tmp_path: Path) -> None:
+        assert DictionaryFile(tmp_path / "missing.txt").poll() == []
+
+
+class TestDictionaryProcessor:
+    def test_hot_reload(self, tmp_path: Path) -> None:
+        path = tmp_path / "dictionary.txt"
+        _write(path, "k8s => Kubernetes\n", 1_000)
+        processor = RegexProcessor(dictionary_path=path)
+
+        assert processor.process("um deploy to k8s") == "Deploy to Kubernetes."
+
+        _write(path, "k8s => Kubernetes\ndeploy => ship\n", 2_000)
+        assert processor.process("um deploy to k8s") == "Ship to Kubernetes."
+
+        path.unlink()
+        assert processor.process("um deploy to k8s") == "Deploy to k8s."
+
+    def test_user_entries_take_priority_over_builtin(self, tmp_path: Path) -> None:
+        path = tmp_path / "dictionary.txt"
+        path.write_text("uh huh => yes\n")
+
+        assert RegexProcessor(dictionary_path=path).process("uh huh") == "Yes."
+        assert RegexProcessor().process("uh huh") == "Huh."
+
+    def test_factory_passes_dictionary_path(self, tmp_path: Path) -> None:
+        path = tmp_path / "dictionary.txt"
+        path.write_text("gonna => going to\n")
+
+        processor = create_text_processor(Config(dictionary_path=str(path)))
+
+        assert processor.process("I'm gonna go") == "I'm going to go."
@@ -0,0 +1,98 @@
+"""Tests for the pynput hotkey listener's hold-to-talk handling, without a display."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+import types
+from typing import Any, Callable, Iterator
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from dictate.pipeline import Pipeline, PipelineState
+
+
+class _Key:
+    alt = "alt"
+    alt_l = "alt_l"
+    alt_r = "alt_r"
+    space = "space"
+
+
+@pytest.fixture
+def listener_module(monkeypatch: pytest.MonkeyPatch) -> Iterator[types.ModuleType]:
+    # pynput needs a display to import, so the listener gets a stand-in keyboard module
+    keyboard = types.ModuleType("pynput.keyboard")
+    keyboard.Key = _Key  # type: ignore[attr-defined]
+    pynput = types.ModuleType("pynput")
+    pynput.keyboard = keyboard  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "pynput", pynput)
+    monkeypatch.setitem(sys.modules, "pynput.keyboard", keyboard)
+    monkeypatch.delitem(sys.modules, "dictate.hotkey.pynput_listener", raising=False)
+    yield importlib.import_module("dictate.hotkey.pynput_listener")
+    sys.modules.pop("dictate.hotkey.pynput_listener", None)
+
+
+def _hold_listener(module: types.ModuleType, on_toggle: Callable[[], bool | None]) -> Any:
+    listener = module.PynputHotkeyListener(mode="hold")
+    listener._on_start = listener._on_stop = on_toggle
+    return listener
+
+
+class TestHoldToTalk:
+    def test_press_starts_and_release_stops(self, listener_module: types.ModuleType) -> None:
+        on_toggle = MagicMock(return_value=True)
+        listener = _hold_listener(listener_module, on_toggle)
+
+        listener._on_press_hold(_Key.alt)
+        listener._on_press_hold(_Key.space)
+        listener._on_release_hold(_Key.space)
+
+        assert on_toggle.call_count == 2
+
+    def test_release_after_refused_start_does_nothing(
+        self, listener_module: types.ModuleType
+    ) -> None:
+        on_toggle = MagicMock(return_value=False)
+        listener = _hold_listener(listener_module, on_toggle)
+
+        listener._on_press_hold(_Key.alt)
+        listener._on_press_hold(_Key.space)
+        listener._on_release_hold(_Key.space)
+
+        on_toggle.assert_called_once()
+
+    def test_full_queue_does_not_record_from_release(
+        self, listener_module: types.ModuleType
+    ) -> None:
+        recorder = MagicMock()
+        recorder.sample_rate = 16000
+        recorder.last_capture = None
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        asr = MagicMock()
+
+        def transcribe(audio: np.ndarray, sample_rate: int) -> str:
+            time.sleep(0.3)
+            return "hello"
+
+        asr.transcribe.side_effect = transcribe
+        pipeline = Pipeline(
+            recorder, asr, MagicMock(), injector=lambda text: None,
+            queue_size=1, queue_full_policy="block",
+        )
+        listener = _hold_listener(listener_module, pipeline.toggle)
+        listener._on_press_hold(_Key.alt)
+        for _ in range(2):  # the first is picked up by the worker, the second waits
+            listener._on_press_hold(_Key.space)
+            listener._on_release_hold(_Key.space)
+            time.sleep(0.05)
+
+        listener._on_press_hold(_Key.space)  # refused: the queue is full
+        time.sleep(0.4)  # the worker takes the waiting job, making room
+        listener._on_release_hold(_Key.space)
+
+        assert recorder.start.call_count == 2
+        assert pipeline.state != PipelineState.RECORDING
@@ -0,0 +1,178 @@
+"""Tests for the hybrid engine racing a local decode against a stand-in API."""
+
+from __future__ import annotations
+
+import time
+from typing import Iterator
+
+import numpy as np
+import pytest
+from transcription_api import FakeTranscriptionAPI
+
+from dictate.asr.base import ModelState, ModelStatus
+from dictate.asr.factory import create_asr_engine
+from dictate.asr.hybrid import HybridEngine
+from dictate.asr.streaming import WindowedTranscriptionStream
+from dictate.asr.whisper_api import WhisperAPIEngine
+from dictate.asr.whisper_local import WhisperLocalEngine
+from dictate.config import Config
+
+# The API side of the race is the real engine, talking to a stand-in endpoint
+pytest.importorskip("openai")
+
+SR = 16000
+
+
+class _FakeLocal:
+    """Local engine that takes ``delay`` seconds per segment."""
+
+    def __init__(self, segments: int = 1, delay: float = 0.0) -> None:
+        self.status = ModelStatus(state=ModelState.READY)
+        self.segments = segments
+        self.delay = delay
+        self.error: Exception | None = None
+        self.decoded = 0
+
+    def preload(self) -> None:
+        pass
+
+    def ensure_loaded(self) -> None:
+        pass
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
+        return " ".join(self.transcribe_segments(audio, sample_rate))
+
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000) -> Iterator[str]:
+        for i in range(self.segments):
+            time.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            self.decoded += 1
+            yield f"local {i + 1}"
+
+    def start_stream(self, sample_rate: int = 16000) -> WindowedTranscriptionStream:
+        return WindowedTranscriptionStream(
+            lambda audio, rate, prompt: self.transcribe(audio, rate), sample_rate
+        )
+
+
+def _audio(seconds: float = 1.0) -> np.ndarray:
+    # Peaks at 0.3, which the stand-in API transcribes as "part 3"
+    t = np.arange(int(seconds * SR)) / SR
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _hybrid(
+    local: _FakeLocal, api: FakeTranscriptionAPI, budget: float = 1.0, deadline: float = 2.0
+) -> HybridEngine:
+    remote = WhisperAPIEngine(api_key="sk-test", base_url=api.url, max_retries=0)
+    return HybridEngine(local, remote, budget_seconds=budget, deadline_seconds=deadline)
+
+
+class TestHybridEngine:
+    def test_fast_local_decode_never_calls_api(self, fake_api: FakeTranscriptionAPI) -> None:
+        engine = _hybrid(_FakeLocal(segments=2), fake_api)
+
+        assert engine.transcribe(_audio()) == "local 1 local 2"
+        assert engine.last_winner == "local"
+        assert fake_api.requests == []
+
+    def test_api_races_after_deadline_and_cancels_local(
+        self, fake_api: FakeTranscriptionAPI
+    ) -> None:
+        local = _FakeLocal(segments=10, delay=0.1)
+        engine = _hybrid(local, fake_api, deadline=0.2)
+
+        start = time.monotonic()
+        assert engine.transcribe(_audio()) == "part 3"
+        elapsed = time.monotonic() - start
+
+        assert engine.last_winner == "remote"
+        assert 0.2 <= elapsed < 0.8
+        time.sleep(0.3)
+        # Stopped at the next segment boundary instead of decoding all ten
+        assert local.decoded < 10
+
+    def test_api_races_at_once_when_local_model_must_load(
+        self, fake_api: FakeTranscriptionAPI
+    ) -> None:
+        local = _FakeLocal(delay=1.0)
+        local.status = ModelStatus(state=ModelState.UNLOADED, load_seconds=5.0)
+        engine = _hybrid(local, fake_api, budget=1.0, deadline=5.0)
+
+        start = time.monotonic()
+        assert engine.transcribe(_audio()) == "part 3"
+        assert time.monotonic() - start < 0.5
+
+    def test_learns_local_real_time_factor(self, fake_api: FakeTranscriptionAPI) -> None:
+        local = _FakeLocal(delay=0.3)
+        engine = _hybrid(local, fake_api, budget=1.0, deadline=2.0)
+        assert engine.predict_local_seconds(10.0) is None
+
+        assert engine.transcribe(_audio(0.5)) == "local 1"
+
+        # 0.3 s for 0.5 s of audio: about 0.6x real time
+        assert engine.predict_local_seconds(10.0) == pytest.approx(6.0, rel=0.2)
+        start = time.monotonic()
+        assert engine.transcribe(_audio(10.0)) == "part 3"
+        assert time.monotonic() - start < 0.3
+
+    def test_losing_uploads_do_not_delay_next_local_decode(
+        self, fake_api: FakeTranscriptionAPI
+    ) -> None:
+        # Once the local speed is known every utterance races the API, whose uploads
+        # keep running for a second after losing
+        fake_api.delay = 1.0
+        engine = _hybrid(_FakeLocal(delay=0.1), fake_api, budget=0.0)
+
+        for _ in range(6):
+            start = time.monotonic()
+            assert engine.transcribe(_audio()) == "local 1"
+            assert time.monotonic() - start < 0.4
+
+    def test_api_failure_falls_back_to_local(self, fake_api: FakeTranscriptionAPI) -> None:
+        fake_api.status = 500
+        engine = _hybrid(_FakeLocal(delay=0.3), fake_api, deadline=0.1)
+
+        assert engine.transcribe(_audio()) == "local 1"
+        assert engine.last_winner == "local"
+        assert len(fake_api.requests) == 1
+
+    def test_local_failure_uses_api(self, fake_api: FakeTranscriptionAPI) -> None:
+        local = _FakeLocal()
+        local.error = RuntimeError("model failed to load")
+        engine = _hybrid(local, fake_api)
+
+        assert engine.transcribe(_audio()) == "part 3"
+        assert engine.last_winner == "remote"
+
+    def test_both_failing_raises_local_error(self, fake_api: FakeTranscriptionAPI) -> None:
+        fake_api.status = 500
+        local = _FakeLocal()
+        local.error = RuntimeError("model failed to load")
+
+        with pytest.raises(RuntimeError, match="model failed to load"):
+            _hybrid(local, fake_api).transcribe(_audio())
+
+    def test_empty_audio(self, fake_api: FakeTranscriptionAPI) -> None:
+        local = _FakeLocal()
+
+        assert _hybrid(local, fake_api).transcribe(np.array([], dtype=np.float32)) == ""
+        assert local.decoded == 0
+
+    def test_stream_decodes_locally(self, fake_api: FakeTranscriptionAPI) -> None:
+        stream = _hybrid(_FakeLocal(), fake_api).start_stream(SR)
+
+        stream.feed(_audio())
+
+        assert stream.finish() == "local 1"
+        assert fake_api.requests == []
+
+    def test_factory_builds_hybrid(self, fake_api: FakeTranscriptionAPI) -> None:
+        config = Config(asr_engine="hybrid", openai_api_key="sk-test", openai_base_url=fake_api.url)
+
+        engine = create_asr_engine(config)
+
+        assert isinstance(engine, HybridEngine)
+        assert isinstance(engine._local, WhisperLocalEngine)
+        assert isinstance(engine._remote, WhisperAPIEngine)
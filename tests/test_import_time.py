@@ -0,0 +1,73 @@
+"""Startup regression test: core modules must import quickly and without heavy dependencies."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+# Everything the menu bar app imports before its icon appears, except rumps itself
+CORE_MODULES = (
+    "dictate.__main__",
+    "dictate.config",
+    "dictate.pipeline",
+    "dictate.metrics",
+    "dictate.memory",
+    "dictate.audio.recorder",
+    "dictate.injection.injector",
+    "dictate.asr.factory",
+    "dictate.processing.factory",
+    "dictate.processing.cache",
+    "dictate.hotkey.factory",
+)
+
+# Loaded on first use instead: at the first recording, paste or decode
+DEFERRED = (
+    "numpy",
+    "scipy",
+    "sounddevice",
+    "pynput",
+    "pyperclip",
+    "faster_whisper",
+    "ctranslate2",
+    "av",
+    "openai",
+)
+
+# Generous enough for a slow CI machine; the core modules take ~70 ms on a laptop
+BUDGET_SECONDS = 0.3
+
+
+def _import_times() -> list[tuple[int, str, int]]:
+    """(nesting depth, module, cumulative microseconds) per import, from ``-X importtime``."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(CORE_MODULES)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        # Names are indented two spaces per level of nesting, after one separator space
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((depth, name.strip(), int(cumulative)))
+    return imports
+
+
+class TestImportTime:
+    def test_heavy_dependencies_are_deferred(self) -> None:
+        imported = {name.split(".")[0] for _depth, name, _us in _import_times()}
+        assert sorted(imported.intersection(DEFERRED)) == []
+
+    def test_core_modules_within_budget(self) -> None:
+        # Outermost dictate imports; their cumulative times include everything they pull in
+        total = sum(
+            us for depth, name, us in _import_times()
+            if depth == 0 and name.split(".")[0] == "dictate"
+        )
+        assert total / 1e6 < BUDGET_SECONDS, f"core imports took {total / 1000:.0f} ms"
@@ -0,0 +1,120 @@
+"""Tests for clipboard text injection (in-memory clipboard and keyboard)."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+from dictate.injection.injector import TextInjector
+from dictate.injection.memory import InMemoryClipboard, RecordingKeyboard
+
+
+def _injector(clipboard: InMemoryClipboard, **kwargs) -> tuple[TextInjector, RecordingKeyboard]:
+    keyboard = RecordingKeyboard(clipboard)
+    kwargs.setdefault("restore_delay", 60.0)  # tests restore explicitly with flush()
+    return TextInjector(clipboard, keyboard, **kwargs), keyboard
+
+
+class TestTextInjector:
+    def test_pastes_text_and_restores_clipboard(self) -> None:
+        clipboard = InMemoryClipboard("original")
+        injector, keyboard = _injector(clipboard)
+
+        assert injector.inject("Hello world.") is True
+        assert keyboard.pasted == ["Hello world."]
+        assert clipboard.read() == "Hello world."  # restore is deferred
+
+        injector.flush()
+        assert clipboard.read() == "original"
+
+    def test_no_fixed_delay_when_clipboard_is_ready(self) -> None:
+        injector, _keyboard = _injector(InMemoryClipboard("original"))
+        injector.inject("Hello world.")
+
+        timing = injector.last_timing
+        assert timing is not None
+        assert timing.total < 0.05
+
+    def test_waits_for_slow_clipboard(self) -> None:
+        clipboard = InMemoryClipboard("original", propagation_seconds=0.05)
+        injector, keyboard = _injector(clipboard)
+
+        assert injector.inject("Hello world.") is True
+        assert keyboard.pasted == ["Hello world."]
+        assert injector.last_timing.clipboard_wait >= 0.04
+
+    def test_waits_by_reading_back_without_change_count(self) -> None:
+        clipboard = InMemoryClipboard("original", propagation_seconds=0.05, change_count=False)
+        injector, keyboard = _injector(clipboard)
+
+        assert injector.inject("Hello world.") is True
+        assert keyboard.pasted == ["Hello world."]
+        injector.flush()
+        assert clipboard.writes == ["Hello world.", "original"]
+
+    def test_does_not_paste_stale_clipboard_after_timeout(self) -> None:
+        clipboard = InMemoryClipboard("original", propagation_seconds=1.0)
+        injector, keyboard = _injector(clipboard, ready_timeout=0.05)
+
+        assert injector.inject("Hello world.") is False
+        assert keyboard.pasted == []
+
+    def test_restore_runs_in_background(self) -> None:
+        clipboard = InMemoryClipboard("original")
+        injector, _keyboard = _injector(clipboard, restore_delay=0.01)
+        injector.inject("Hello world.")
+
+        deadline = time.monotonic() + 2.0
+        while clipboard.read() != "original" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert clipboard.read() == "original"
+
+    def test_user_copy_is_not_overwritten_by_restore(self) -> None:
+        clipboard = InMemoryClipboard("original")
+        injector, _keyboard = _injector(clipboard)
+        injector.inject("Hello world.")
+
+        clipboard.write("copied by the user")
+        injector.flush()
+        assert clipboard.read() == "copied by the user"
+
+    def test_back_to_back_injections_restore_original(self) -> None:
+        clipboard = InMemoryClipboard("original")
+        injector, keyboard = _injector(clipboard)
+
+        injector.inject("First.")
+        injector.inject("Second.")
+        injector.flush()
+
+        assert keyboard.pasted == ["First.", "Second."]
+        assert clipboard.read() == "original"
+
+    def test_timer_that_fired_during_next_injection_does_nothing(self) -> None:
+        clipboard = InMemoryClipboard("original")
+        injector, keyboard = _injector(clipboard, restore_delay=0.01)
+        injector.inject("First.")
+
+        # The first restore's timer fires and blocks on the lock held by the next injection
+        with injector._lock:
+            time.sleep(0.1)
+            injector._restore_delay = 60.0
+            injector.inject("Second.")
+        time.sleep(0.1)
+
+        assert keyboard.pasted == ["First.", "Second."]
+        assert clipboard.read() == "Second."
+        injector.flush()
+        assert clipboard.read() == "original"
+
+    def test_paste_failure_reported(self) -> None:
+        keyboard = MagicMock()
+        keyboard.paste.side_effect = RuntimeError("not trusted")
+        injector = TextInjector(InMemoryClipboard("original"), keyboard)
+        assert injector.inject("Hello world.") is False
+
+    def test_empty_text_ignored(self) -> None:
+        clipboard = InMemoryClipboard("original")
+        injector, keyboard = _injector(clipboard)
+        assert injector.inject("") is False
+        assert clipboard.writes == []
+        assert keyboard.pasted == []
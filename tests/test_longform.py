@@ -0,0 +1,117 @@
+"""Tests for silence-split parallel decoding of long recordings."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from dictate.asr.longform import (
+    Chunk,
+    Stitcher,
+    decode_chunks,
+    plan_chunks,
+    stitch,
+    transcribe_long_form,
+)
+
+SR = 100  # samples per second, so sample counts read as hundredths of a second
+
+
+class TestPlanChunks:
+    def test_no_speech(self) -> None:
+        assert plan_chunks([], SR) == []
+
+    def test_short_recording_is_one_chunk(self) -> None:
+        assert plan_chunks([(50, 400), (500, 900)], SR, max_seconds=30) == [Chunk(50, 900)]
+
+    def test_cuts_in_latest_silence_that_fits(self) -> None:
+        speech = [(0, 1000), (1100, 2000), (2200, 2900), (3100, 4000)]
+        chunks = plan_chunks(speech, SR, max_seconds=30)
+        # Silence midpoints are 1050, 2100 and 3000; 3000 is the last within 30 s
+        assert chunks == [Chunk(0, 3000), Chunk(3000, 4000)]
+
+    def test_chunks_never_exceed_max(self) -> None:
+        speech = [(i * 700, i * 700 + 600) for i in range(20)]
+        chunks = plan_chunks(speech, SR, max_seconds=30)
+        assert all(c.end - c.start <= 3000 for c in chunks)
+        assert [c.start for c in chunks[1:]] == [c.end for c in chunks[:-1]]
+        assert chunks[0].start == 0 and chunks[-1].end == speech[-1][1]
+
+    def test_unbroken_speech_is_split_with_overlap(self) -> None:
+        chunks = plan_chunks([(0, 7000)], SR, max_seconds=30, overlap_seconds=1)
+        assert chunks == [Chunk(0, 3000), Chunk(2900, 5900, 100), Chunk(5800, 7000, 100)]
+
+    def test_overlap_must_be_shorter_than_chunk(self) -> None:
+        with pytest.raises(ValueError, match="overlap_seconds"):
+            plan_chunks([(0, 7000)], SR, max_seconds=1, overlap_seconds=1)
+
+
+class TestStitch:
+    def test_joins_in_order(self) -> None:
+        chunks = [Chunk(0, 10), Chunk(10, 20)]
+        assert stitch(["Hello there.", "How are you?"], chunks) == "Hello there. How are you?"
+
+    def test_drops_words_heard_by_both_overlapping_chunks(self) -> None:
+        chunks = [Chunk(0, 10), Chunk(9, 20, overlap=1)]
+        text = stitch(["we should move the", "The meeting to Thursday."], chunks)
+        assert text == "we should move the meeting to Thursday."
+
+    def test_single_word_repeat_kept_at_silence_cut(self) -> None:
+        chunks = [Chunk(0, 10), Chunk(10, 20)]
+        assert stitch(["That is that.", "That is all."], chunks) == "That is that. That is all."
+
+    def test_repeated_phrase_kept_at_silence_cut(self) -> None:
+        chunks = [Chunk(0, 10), Chunk(10, 20), Chunk(20, 30)]
+        text = stitch(["It was very, very", "very good. No, no", "no, no."], chunks)
+        assert text == "It was very, very very good. No, no no, no."
+
+    def test_repeat_longer_than_overlap_kept(self) -> None:
+        # Six words in 30 s leave room for two in the 1 s both chunks heard, not three
+        chunks = [Chunk(0, 3000), Chunk(2900, 5900, overlap=100)]
+        text = stitch(["I said call me back", "call me back tomorrow, call me."], chunks)
+        assert text == "I said call me back call me back tomorrow, call me."
+
+    def test_empty_chunks_skipped(self) -> None:
+        stitcher = Stitcher()
+        assert stitcher.add("", Chunk(0, 10)) == ""
+        assert stitcher.add("hello", Chunk(10, 20)) == "hello"
+        assert stitcher.add("", Chunk(20, 30)) == ""
+
+
+class TestDecodeChunks:
+    def test_results_in_chunk_order(self) -> None:
+        audio = np.arange(30, dtype=np.float32)
+        chunks = [Chunk(0, 10), Chunk(10, 20), Chunk(20, 30)]
+
+        def decode(piece: np.ndarray, sample_rate: int) -> str:
+            # Later chunks finish first
+            time.sleep((30 - float(piece[0])) / 1000)
+            return str(int(piece[0]))
+
+        assert list(decode_chunks(decode, audio, chunks, workers=3)) == ["0", "10", "20"]
+
+    def test_chunks_decoded_concurrently(self) -> None:
+        audio = np.zeros(40, dtype=np.float32)
+        chunks = [Chunk(i * 10, i * 10 + 10) for i in range(4)]
+        barrier = threading.Barrier(4, timeout=2)
+
+        def decode(piece: np.ndarray, sample_rate: int) -> str:
+            barrier.wait()  # only passes if all four decodes run at once
+            return "ok"
+
+        assert list(decode_chunks(decode, audio, chunks, workers=4)) == ["ok"] * 4
+
+
+class TestTranscribeLongForm:
+    def test_stitches_decoded_chunks(self) -> None:
+        audio = np.zeros(4000, dtype=np.float32)
+        speech = [(0, 1000), (1100, 2000), (2200, 2900), (3100, 4000)]
+
+        def decode(piece: np.ndarray, sample_rate: int) -> str:
+            return f"{len(piece)} samples."
+
+        pieces = transcribe_long_form(decode, audio, SR, workers=2, speech=speech)
+        assert list(pieces) == ["3000 samples.", "1000 samples."]
@@ -0,0 +1,16 @@
+"""Tests for process memory helpers."""
+
+from __future__ import annotations
+
+from dictate.memory import current_rss_bytes, format_bytes
+
+
+class TestMemory:
+    def test_current_rss_is_positive(self) -> None:
+        rss = current_rss_bytes()
+        assert rss is not None
+        assert rss > 0
+
+    def test_format_bytes(self) -> None:
+        assert format_bytes(512 * 1024 * 1024) == "512.0 MB"
+        assert format_bytes(None) == "unknown"
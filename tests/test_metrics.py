@@ -0,0 +1,67 @@
+"""Tests for latency spans and rolling aggregates."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from dictate.metrics import LatencyTracker, UtteranceMetrics
+
+
+def _metrics(**stages: float) -> UtteranceMetrics:
+    metrics = UtteranceMetrics(audio_seconds=2.0)
+    metrics.stages.update(stages)
+    return metrics
+
+
+class TestUtteranceMetrics:
+    def test_span_records_elapsed_time(self) -> None:
+        metrics = UtteranceMetrics()
+        with metrics.span("decode"):
+            time.sleep(0.02)
+        assert metrics.stages["decode"] >= 0.02
+
+    def test_span_records_on_exception(self) -> None:
+        metrics = UtteranceMetrics()
+        with pytest.raises(RuntimeError), metrics.span("decode"):
+            raise RuntimeError("boom")
+        assert "decode" in metrics.stages
+
+    def test_finish_records_total_since_start(self) -> None:
+        metrics = UtteranceMetrics()
+        time.sleep(0.01)
+        metrics.finish()
+        assert metrics.stages["total"] >= 0.01
+
+    def test_summary_lists_stages_in_order(self) -> None:
+        metrics = _metrics(inject=0.004, decode=0.8, total=0.9)
+        assert metrics.summary() == "audio 2.0s | decode 800ms | inject 4ms | total 0.90s"
+
+
+class TestLatencyTracker:
+    def test_empty_tracker_has_no_stats(self) -> None:
+        tracker = LatencyTracker()
+        assert tracker.stats() == {}
+        assert tracker.last() is None
+
+    def test_percentiles_per_stage(self) -> None:
+        tracker = LatencyTracker()
+        for i in range(1, 101):
+            tracker.record(_metrics(decode=i / 100, total=i / 10))
+
+        stats = tracker.stats()
+        assert stats["decode"].count == 100
+        assert stats["decode"].p50 == pytest.approx(0.505)
+        assert stats["total"].p95 == pytest.approx(9.505)
+        assert stats["total"].p99 == pytest.approx(9.901)
+        assert "inject" not in stats
+
+    def test_window_drops_oldest(self) -> None:
+        tracker = LatencyTracker(window=3)
+        for value in (10.0, 1.0, 1.0, 1.0):
+            tracker.record(_metrics(total=value))
+
+        assert len(tracker) == 3
+        assert tracker.stats()["total"].p99 == pytest.approx(1.0)
+        assert tracker.last().stages["total"] == 1.0
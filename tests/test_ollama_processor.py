@@ -0,0 +1,205 @@
+"""Tests for the Ollama text processor against a local stand-in server."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from dictate.config import Config
+from dictate.processing.factory import create_text_processor
+from dictate.processing.ollama_processor import OllamaProcessor
+from dictate.processing.regex_processor import RegexProcessor
+from dictate.processing.segments import OverlappedCleanup
+
+
+class _FakeOllama(ThreadingHTTPServer):
+    """Serves /api/generate as a stream of canned tokens."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.tokens = ["Hello", ",", " world", "."]
+        self.token_delay = 0.0
+        self.status = 200
+        self.drop_idle_connections = False
+        self.connections = 0
+        self.requests: list[dict] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _FakeOllama
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(json.loads(body))
+        if self.server.status != 200:
+            payload = b'{"error": "model not found"}'
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        chunks = [{"response": t, "done": False} for t in self.server.tokens]
+        chunks.append({"response": "", "done": True})
+        try:
+            for chunk in chunks:
+                time.sleep(self.server.token_delay)
+                line = json.dumps(chunk).encode() + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+            return
+        # Like a server whose idle timeout fired: hang up without saying so
+        self.close_connection = self.server.drop_idle_connections
+
+
+@pytest.fixture
+def server() -> Iterator[_FakeOllama]:
+    server = _FakeOllama()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _processor(server: _FakeOllama, timeout: float = 2.0) -> OllamaProcessor:
+    return OllamaProcessor(host=server.url, model="test-model", timeout_seconds=timeout)
+
+
+class TestOllamaProcessor:
+    def test_streams_reply(self, server: _FakeOllama) -> None:
+        processor = _processor(server)
+
+        assert processor.process("um hello world") == "Hello, world."
+
+        request = server.requests[0]
+        assert request["model"] == "test-model"
+        assert request["prompt"] == "um hello world"
+        assert request["stream"] is True
+
+    def test_reuses_connection(self, server: _FakeOllama) -> None:
+        processor = _processor(server)
+
+        for _ in range(3):
+            assert processor.process("hello world") == "Hello, world."
+
+        assert server.connections == 1
+
+    def test_reconnects_after_server_drops_idle_connection(self, server: _FakeOllama) -> None:
+        server.drop_idle_connections = True
+        processor = _processor(server)
+
+        assert processor.process("hello world") == "Hello, world."
+        time.sleep(0.05)
+        assert processor.process("hello world") == "Hello, world."
+        assert server.connections == 2
+
+    def test_deadline_falls_back_to_regex(self, server: _FakeOllama) -> None:
+        server.token_delay = 0.2
+        processor = _processor(server, timeout=0.3)
+
+        start = time.monotonic()
+        result = processor.process("um I went home and slept")
+        elapsed = time.monotonic() - start
+
+        assert result == RegexProcessor().process("um I went home and slept")
+        assert elapsed < 0.6
+
+    def test_passed_deadline_skips_request(self, server: _FakeOllama) -> None:
+        processor = _processor(server)
+
+        result = processor.process("um hello", deadline=time.monotonic() - 1)
+
+        assert result == "Hello."
+        assert processor.last_fell_back
+        assert server.requests == []
+
+    def test_sentences_share_one_utterance_deadline(self, server: _FakeOllama) -> None:
+        server.token_delay = 0.2
+        processor = _processor(server, timeout=0.3)
+        sentences = ["um I went home.", "Then I slept.", "uh It rained.", "The end."]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cleanup = OverlappedCleanup(processor, executor, timeout_seconds=0.3)
+            start = time.monotonic()
+            for sentence in sentences:
+                cleanup.add(sentence)
+            result = cleanup.finish()
+            elapsed = time.monotonic() - start
+
+        # One 0.3s budget for the utterance, not 0.3s per sentence
+        assert elapsed < 0.6
+        assert result == " ".join(RegexProcessor().process(s) for s in sentences)
+
+    def test_recovers_after_deadline(self, server: _FakeOllama) -> None:
+        server.token_delay = 0.2
+        processor = _processor(server, timeout=0.3)
+        processor.process("hello world")
+
+        server.token_delay = 0.0
+
+        assert processor.process("hello world") == "Hello, world."
+
+    def test_http_error_falls_back(self, server: _FakeOllama) -> None:
+        server.status = 404
+
+        assert _processor(server).process("um hello") == "Hello."
+
+    def test_unreachable_server_falls_back(self) -> None:
+        processor = OllamaProcessor(host="http://127.0.0.1:9", timeout_seconds=0.5)
+
+        assert processor.process("um hello") == "Hello."
+
+    def test_empty_reply_falls_back(self, server: _FakeOllama) -> None:
+        server.tokens = [" ", "\n"]
+
+        assert _processor(server).process("um hello") == "Hello."
+
+    def test_empty_input_skips_request(self, server: _FakeOllama) -> None:
+        assert _processor(server).process("  ") == ""
+        assert server.requests == []
+
+    def test_invalid_host(self) -> None:
+        with pytest.raises(ValueError, match="Invalid Ollama host"):
+            OllamaProcessor(host="ftp://localhost")
+
+    def test_factory_wires_config(self, server: _FakeOllama) -> None:
+        config = Config(
+            text_processor="ollama",
+            ollama_host=server.url,
+            ollama_model="m",
+            ollama_timeout_seconds=1,
+            text_cache_size=0,
+        )
+
+        processor = create_text_processor(config)
+
+        assert isinstance(processor, OllamaProcessor)
+        assert processor.process("hello world") == "Hello, world."
+        assert server.requests[0]["model"] == "m"
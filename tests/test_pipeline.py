@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import logging
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
+from dictate.audio.health import CaptureHealth
 from dictate.pipeline import Pipeline, PipelineState
+from dictate.processing.regex_processor import RegexProcessor
 
 
 @pytest.fixture
@@ -16,6 +20,7 @@ def mock_components() -> tuple[MagicMock, MagicMock, MagicMock]:
     recorder = MagicMock()
     recorder.sample_rate = 16000
     recorder.is_recording = False
+    recorder.last_capture = None
 
     asr_engine = MagicMock()
     asr_engine.transcribe.return_value = "um hello world"
@@ -43,6 +48,14 @@ class TestPipeline:
         recorder.start.assert_called_once()
         assert PipelineState.RECORDING in states
 
+    def test_start_recording_preloads_engine(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        pipeline = Pipeline(recorder, asr, processor)
+
+        pipeline.toggle()
+
+        asr.preload.assert_called_once()
+
     @patch("dictate.pipeline.inject_text")
     def test_toggle_twice_processes_audio(
         self, mock_inject: MagicMock, mock_components: tuple
@@ -86,3 +99,364 @@ class TestPipeline:
         asr.transcribe.assert_not_called()
         mock_inject.assert_not_called()
         assert pipeline.state == PipelineState.IDLE
+
+    @patch("dictate.pipeline.inject_text")
+    def test_streaming_decodes_during_recording(
+        self, mock_inject: MagicMock, mock_components: tuple
+    ) -> None:
+        recorder, asr, processor = mock_components
+        audio_data = np.ones(48000, dtype=np.float32)
+        recorder.read.side_effect = lambda start: audio_data[start:32000]
+        recorder.stop.return_value = audio_data
+
+        stream = MagicMock()
+        stream.finish.return_value = "um hello world"
+        asr.start_stream.return_value = stream
+
+        pipeline = Pipeline(
+            recorder,
+            asr,
+            processor,
+            streaming_transcription=True,
+            stream_poll_interval=0.01,
+        )
+        pipeline.toggle()  # start
+        time.sleep(0.2)
+        pipeline.toggle()  # stop
+
+        time.sleep(0.5)
+
+        asr.start_stream.assert_called_once_with(16000)
+        asr.transcribe.assert_not_called()
+        fed = [call.args[0] for call in stream.feed.call_args_list]
+        # Audio read while recording, then only the remaining tail after stop
+        assert sum(len(chunk) for chunk in fed) == 48000
+        assert len(fed[-1]) == 16000
+        processor.process.assert_called_once_with("um hello world")
+        mock_inject.assert_called_once_with("Hello world.")
+        assert pipeline.state == PipelineState.IDLE
+
+    @patch("dictate.pipeline.inject_text")
+    def test_streaming_failure_falls_back_to_full_decode(
+        self, mock_inject: MagicMock, mock_components: tuple
+    ) -> None:
+        recorder, asr, processor = mock_components
+        audio_data = np.ones(16000, dtype=np.float32)
+        recorder.read.side_effect = lambda start: audio_data[start:]
+        recorder.stop.return_value = audio_data
+
+        stream = MagicMock()
+        stream.feed.side_effect = RuntimeError("decoder crashed")
+        asr.start_stream.return_value = stream
+
+        pipeline = Pipeline(
+            recorder,
+            asr,
+            processor,
+            streaming_transcription=True,
+            stream_poll_interval=0.01,
+        )
+        pipeline.toggle()
+        time.sleep(0.1)
+        pipeline.toggle()
+
+        time.sleep(0.5)
+
+        asr.transcribe.assert_called_once_with(audio_data, 16000)
+        mock_inject.assert_called_once_with("Hello world.")
+
+    @patch("dictate.pipeline.inject_text")
+    def test_silent_recording_skips_transcription(
+        self, mock_inject: MagicMock, mock_components: tuple
+    ) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.zeros(16000, dtype=np.float32)
+
+        pipeline = Pipeline(recorder, asr, processor, trim_silence=True)
+        pipeline.toggle()
+        pipeline.toggle()
+
+        time.sleep(0.5)
+
+        asr.transcribe.assert_not_called()
+        mock_inject.assert_not_called()
+        assert pipeline.state == PipelineState.IDLE
+
+    @patch("dictate.pipeline.inject_text")
+    def test_trimmed_audio_is_transcribed(
+        self, mock_inject: MagicMock, mock_components: tuple
+    ) -> None:
+        recorder, asr, processor = mock_components
+        audio_data = np.zeros(48000, dtype=np.float32)
+        audio_data[16000:32000] = 0.5
+        recorder.stop.return_value = audio_data
+
+        pipeline = Pipeline(recorder, asr, processor, trim_silence=True, silence_padding_ms=0)
+        pipeline.toggle()
+        pipeline.toggle()
+
+        time.sleep(0.5)
+
+        transcribed = asr.transcribe.call_args.args[0]
+        assert len(transcribed) == 16000
+        mock_inject.assert_called_once_with("Hello world.")
+
+    @patch("dictate.pipeline.inject_text")
+    def test_latency_is_recorded_per_stage(
+        self, mock_inject: MagicMock, mock_components: tuple
+    ) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(32000, dtype=np.float32)
+
+        pipeline = Pipeline(recorder, asr, processor)
+        assert pipeline.latency_stats() == {}
+        pipeline.toggle()
+        pipeline.toggle()
+
+        time.sleep(0.5)
+
+        asr.ensure_loaded.assert_called_once()
+        metrics = pipeline.last_metrics
+        assert metrics is not None
+        assert metrics.audio_seconds == 2.0
+        for stage in ("record_stop", "model_wait", "decode", "cleanup", "inject", "total"):
+            assert stage in metrics.stages
+        assert pipeline.latency_stats()["total"].count == 1
+
+    def test_custom_injector_is_used(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        injected: list[str] = []
+
+        pipeline = Pipeline(recorder, asr, processor, injector=injected.append)
+        pipeline.toggle()
+        pipeline.toggle()
+
+        time.sleep(0.5)
+
+        assert injected == ["Hello world."]
+
+    def test_metrics_reported_after_injection(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        reported = []
+
+        pipeline = Pipeline(
+            recorder, asr, processor, injector=lambda text: None, on_metrics=reported.append
+        )
+        pipeline.toggle()
+        pipeline.toggle()
+
+        time.sleep(0.5)
+
+        assert reported == [pipeline.last_metrics]
+        assert "total" in reported[0].stages
+
+    def test_degraded_capture_warns(
+        self, mock_components: tuple, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        recorder.last_capture = CaptureHealth(callbacks=100, overflows=2, block_seconds=0.01)
+
+        pipeline = Pipeline(recorder, asr, processor, injector=lambda text: None)
+        pipeline.toggle()
+        with caplog.at_level(logging.WARNING, logger="dictate.pipeline"):
+            pipeline.toggle()
+
+        time.sleep(0.5)
+
+        assert "Audio capture degraded: 100 callbacks, 2 overflow(s)" in caplog.text
+        assert pipeline.last_metrics.capture is recorder.last_capture
+
+    def test_healthy_capture_does_not_warn(
+        self, mock_components: tuple, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        recorder.last_capture = CaptureHealth(callbacks=100, block_seconds=0.01)
+
+        pipeline = Pipeline(recorder, asr, processor, injector=lambda text: None)
+        pipeline.toggle()
+        with caplog.at_level(logging.WARNING, logger="dictate.pipeline"):
+            pipeline.toggle()
+
+        time.sleep(0.5)
+
+        assert "capture degraded" not in caplog.text
+
+
+def _slow_asr(asr: MagicMock, delay: float = 0.3) -> None:
+    """Make transcribe() slow and return a distinct text per call."""
+    calls = iter(range(1, 100))
+
+    def transcribe(audio: np.ndarray, sample_rate: int) -> str:
+        time.sleep(delay)
+        return f"utterance {next(calls)}"
+
+    asr.transcribe.side_effect = transcribe
+
+
+class TestPipelineQueue:
+    def test_can_record_while_previous_is_transcribing(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        _slow_asr(asr)
+        processor.process.side_effect = lambda text: text
+        injected: list[str] = []
+
+        pipeline = Pipeline(recorder, asr, processor, injector=injected.append)
+        pipeline.toggle()
+        pipeline.toggle()  # first utterance starts transcribing
+        assert pipeline.state == PipelineState.PROCESSING
+
+        pipeline.toggle()  # second recording starts right away
+        assert pipeline.state == PipelineState.RECORDING
+        pipeline.toggle()
+
+        time.sleep(1.0)
+
+        assert injected == ["utterance 1", "utterance 2"]
+        assert pipeline.state == PipelineState.IDLE
+
+    def test_results_are_injected_in_order(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        _slow_asr(asr, delay=0.1)
+        processor.process.side_effect = lambda text: text
+        injected: list[str] = []
+
+        pipeline = Pipeline(recorder, asr, processor, injector=injected.append, queue_size=5)
+        for _ in range(4):
+            pipeline.toggle()
+            pipeline.toggle()
+
+        time.sleep(1.0)
+
+        assert injected == [f"utterance {i}" for i in range(1, 5)]
+
+    def test_block_policy_refuses_recording_when_full(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        _slow_asr(asr, delay=0.5)
+
+        pipeline = Pipeline(recorder, asr, processor, queue_size=1, queue_full_policy="block")
+        pipeline.toggle()
+        pipeline.toggle()  # picked up by the worker
+        time.sleep(0.1)
+        pipeline.toggle()
+        pipeline.toggle()  # waits in the queue, which is now full
+
+        assert pipeline.toggle() is False  # refused
+
+        assert pipeline.state == PipelineState.PROCESSING
+        assert recorder.start.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("policy", "kept"),
+        [("drop_oldest", 0.3), ("drop_newest", 0.2)],
+    )
+    def test_drop_policies(self, mock_components: tuple, policy: str, kept: float) -> None:
+        recorder, asr, processor = mock_components
+        first, second, third = (np.full(16000, v, dtype=np.float32) for v in (0.1, 0.2, 0.3))
+        recorder.stop.side_effect = [first, second, third]
+        transcribed: list[float] = []
+
+        def transcribe(audio: np.ndarray, sample_rate: int) -> str:
+            time.sleep(0.3)
+            transcribed.append(float(audio[0]))
+            return f"utterance {len(transcribed)}"
+
+        asr.transcribe.side_effect = transcribe
+        processor.process.side_effect = lambda text: text
+        injected: list[str] = []
+
+        pipeline = Pipeline(
+            recorder, asr, processor,
+            injector=injected.append, queue_size=1, queue_full_policy=policy,
+        )
+        pipeline.toggle()
+        pipeline.toggle()  # first: picked up by the worker
+        time.sleep(0.1)
+        for _ in range(2):  # second waits, third overflows
+            pipeline.toggle()
+            pipeline.toggle()
+
+        time.sleep(1.0)
+
+        assert injected == ["utterance 1", "utterance 2"]
+        assert transcribed == pytest.approx([0.1, kept])
+
+
+def _segment_asr(asr: MagicMock, segments: list[str], delay: float = 0.0) -> threading.Event:
+    """Make transcribe_segments() yield ``segments``, ``delay`` seconds apart."""
+    done = threading.Event()
+
+    def transcribe_segments(audio: np.ndarray, sample_rate: int):
+        for segment in segments:
+            time.sleep(delay)
+            yield segment
+        done.set()
+
+    asr.transcribe_segments.side_effect = transcribe_segments
+    return done
+
+
+class TestPipelineOverlappedCleanup:
+    def test_cleans_sentences_while_decoding(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        decoded = _segment_asr(asr, ["so I went home", "and slept.", "then I woke up"], 0.1)
+        seen_during_decode: list[bool] = []
+
+        def process(text: str) -> str:
+            seen_during_decode.append(not decoded.is_set())
+            return text.capitalize()
+
+        processor.process.side_effect = process
+        injected: list[str] = []
+
+        pipeline = Pipeline(
+            recorder, asr, processor, injector=injected.append, overlap_cleanup=True
+        )
+        pipeline.toggle()
+        pipeline.toggle()
+        time.sleep(0.8)
+
+        asr.transcribe.assert_not_called()
+        assert processor.process.call_args_list[0].args == ("so I went home and slept.",)
+        assert seen_during_decode == [True, False]
+        assert injected == ["So i went home and slept. Then i woke up"]
+        assert "cleanup" in pipeline.last_metrics.stages
+
+    def test_regex_output_matches_whole_text(self, mock_components: tuple) -> None:
+        recorder, asr, _ = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        segments = ["um we tried but", "it failed.", "uh so we left and", "went home you know"]
+        _segment_asr(asr, segments)
+        injected: list[str] = []
+
+        pipeline = Pipeline(
+            recorder, asr, RegexProcessor(), injector=injected.append, overlap_cleanup=True
+        )
+        pipeline.toggle()
+        pipeline.toggle()
+        time.sleep(0.5)
+
+        assert injected == [RegexProcessor().process(" ".join(segments))]
+
+    def test_decode_error_injects_nothing(self, mock_components: tuple) -> None:
+        recorder, asr, processor = mock_components
+        recorder.stop.return_value = np.ones(16000, dtype=np.float32)
+        asr.transcribe_segments.side_effect = RuntimeError("decoder crashed")
+        injected: list[str] = []
+
+        pipeline = Pipeline(
+            recorder, asr, processor, injector=injected.append, overlap_cleanup=True
+        )
+        pipeline.toggle()
+        pipeline.toggle()
+        time.sleep(0.3)
+
+        assert injected == []
+        assert pipeline.state == PipelineState.IDLE
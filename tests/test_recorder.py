@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import time
+from typing import Callable
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
 from dictate.audio.recorder import AudioRecorder
+from dictate.audio.simulated import SimulatedSource
 
 
 class TestAudioRecorder:
@@ -21,7 +24,7 @@ class TestAudioRecorder:
         assert isinstance(result, np.ndarray)
         assert result.size == 0
 
-    @patch("dictate.audio.recorder.sd.InputStream")
+    @patch("sounddevice.InputStream")
     def test_start_begins_recording(self, mock_stream_cls: MagicMock) -> None:
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
@@ -32,7 +35,7 @@ class TestAudioRecorder:
         assert recorder.is_recording
         mock_stream.start.assert_called_once()
 
-    @patch("dictate.audio.recorder.sd.InputStream")
+    @patch("sounddevice.InputStream")
     def test_start_is_idempotent(self, mock_stream_cls: MagicMock) -> None:
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
@@ -43,7 +46,7 @@ class TestAudioRecorder:
 
         assert mock_stream_cls.call_count == 1
 
-    @patch("dictate.audio.recorder.sd.InputStream")
+    @patch("sounddevice.InputStream")
     def test_stop_returns_concatenated_audio(self, mock_stream_cls: MagicMock) -> None:
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
@@ -64,6 +67,290 @@ class TestAudioRecorder:
         mock_stream.stop.assert_called_once()
         mock_stream.close.assert_called_once()
 
+    @patch("sounddevice.InputStream")
+    def test_stop_returns_view_of_capture_buffer(self, mock_stream_cls: MagicMock) -> None:
+        recorder = AudioRecorder(sample_rate=16000)
+        recorder.start()
+        recorder._audio_callback(np.ones((1024, 1), dtype=np.float32), 1024, None, None)
+        captured = recorder.read()
+
+        result = recorder.stop()
+
+        assert np.shares_memory(result, captured)
+
+    @patch("sounddevice.InputStream")
+    def test_restart_does_not_overwrite_previous_audio(self, mock_stream_cls: MagicMock) -> None:
+        recorder = AudioRecorder(sample_rate=16000)
+        recorder.start()
+        recorder._audio_callback(np.full((1024, 1), 0.5, dtype=np.float32), 1024, None, None)
+        first = recorder.stop()
+
+        recorder.start()
+        recorder._audio_callback(np.full((1024, 1), 0.1, dtype=np.float32), 1024, None, None)
+        recorder.stop()
+
+        assert np.allclose(first, 0.5)
+
+    @patch("sounddevice.InputStream")
+    def test_read_returns_audio_while_recording(self, mock_stream_cls: MagicMock) -> None:
+        recorder = AudioRecorder(sample_rate=16000)
+        recorder.start()
+
+        chunk1 = np.ones((1024, 1), dtype=np.float32) * 0.5
+        chunk2 = np.ones((1024, 1), dtype=np.float32) * 0.3
+        recorder._audio_callback(chunk1, 1024, None, None)
+        recorder._audio_callback(chunk2, 1024, None, None)
+
+        assert recorder.read().shape == (2048,)
+        tail = recorder.read(1000)
+        assert tail.shape == (1048,)
+        assert np.allclose(tail[:24], 0.5)
+        assert np.allclose(tail[24:], 0.3)
+        assert recorder.read(2048).size == 0
+        assert recorder.is_recording
+
+    def test_disk_backend_spills_long_recordings(self) -> None:
+        recorder = AudioRecorder(
+            sample_rate=1000, source=SimulatedSource(blocksize=50), capture_backend="disk",
+            disk_spill_seconds=0.1,
+        )
+        recorder.start()
+        _wait_for(lambda: recorder.read().size >= 400)
+
+        result = recorder.stop()
+
+        assert isinstance(result, np.memmap)
+        assert result.shape == (recorder.last_capture.callbacks * 50,)
+
+    def test_next_recording_closes_previous_spill_file(self) -> None:
+        recorder = AudioRecorder(
+            sample_rate=1000, source=SimulatedSource(blocksize=10), capture_backend="disk",
+            disk_spill_seconds=0.01,
+        )
+        recorder.start()
+        _wait_for(lambda: recorder.read().size >= 30)
+        first = recorder.stop()
+        spill_file = recorder._buffer._file
+
+        recorder.start()
+        recorder.stop()
+
+        assert spill_file is not None and spill_file.closed
+        assert isinstance(first, np.memmap)
+        assert np.all(first == 0.0)
+
     def test_sample_rate(self) -> None:
         recorder = AudioRecorder(sample_rate=44100)
         assert recorder.sample_rate == 44100
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.002)
+
+
+class TestAlwaysOnRecorder:
+    """Simulated device: 10 ms blocks at 1 kHz, 50 ms to open."""
+
+    @pytest.fixture
+    def source(self) -> SimulatedSource:
+        ramp = np.arange(1000, dtype=np.float32) / 1000
+        return SimulatedSource(signal=ramp, blocksize=10, open_seconds=0.05)
+
+    def _recorder(self, source: SimulatedSource, always_on: bool) -> AudioRecorder:
+        return AudioRecorder(
+            sample_rate=1000, source=source, always_on=always_on, preroll_seconds=0.2
+        )
+
+    def test_opens_device_once(self, source: SimulatedSource) -> None:
+        recorder = self._recorder(source, always_on=True)
+        recorder.open()
+        for _ in range(3):
+            recorder.start()
+            recorder.stop()
+        recorder.close()
+
+        assert source.streams_opened == 1
+
+    def test_per_start_mode_reopens_device(self, source: SimulatedSource) -> None:
+        recorder = self._recorder(source, always_on=False)
+        for _ in range(3):
+            recorder.start()
+            recorder.stop()
+
+        assert source.streams_opened == 3
+
+    def test_prepends_preroll(self, source: SimulatedSource) -> None:
+        recorder = self._recorder(source, always_on=True)
+        recorder.open()
+        time.sleep(0.3)
+
+        recorder.start()
+        preroll = recorder.read().copy()
+        time.sleep(0.05)
+        audio = recorder.stop()
+        recorder.close()
+
+        assert len(preroll) == 200
+        # Continuous ramp: the recording picks up exactly where the pre-roll left off
+        steps = np.diff(audio) % 1.0
+        assert np.allclose(steps, 0.001, atol=1e-5)
+        assert len(audio) > len(preroll)
+
+    def test_first_sample_latency(self, source: SimulatedSource) -> None:
+        cold = self._recorder(source, always_on=False)
+        cold.start()
+        _wait_for(lambda: cold.start_latency is not None)
+        cold.stop()
+
+        warm = self._recorder(source, always_on=True)
+        warm.open()
+        time.sleep(0.05)
+        warm.start()
+        warm.stop()
+        warm.close()
+
+        assert cold.start_latency >= 0.05  # paid the device open
+        assert warm.start_latency < 0.01
+
+    def test_preroll_not_reused_across_recordings(self, source: SimulatedSource) -> None:
+        recorder = self._recorder(source, always_on=True)
+        recorder.open()
+        time.sleep(0.3)
+        recorder.start()
+        first = recorder.stop()
+        recorder.start()
+        second = recorder.stop()
+        recorder.close()
+
+        assert len(first) >= 200
+        assert len(second) < 200
+
+
+class TestCaptureHealth:
+    """Simulated device at 1 kHz with dropouts injected by block index."""
+
+    def test_counts_overflows_and_gaps(self) -> None:
+        # Blocks 2-4 are lost: 30 ms of audio, reported on the block after them
+        source = SimulatedSource(blocksize=10, buffer_blocks=50, drop_blocks=range(2, 5))
+        recorder = AudioRecorder(sample_rate=1000, source=source)
+        recorder.start()
+        _wait_for(lambda: recorder.read().size >= 40)
+        recorder.stop()
+
+        health = recorder.last_capture
+        assert health.callbacks >= 4
+        assert health.overflows == 1
+        assert health.gaps == 1
+        assert health.lost_seconds == pytest.approx(0.03)
+        assert health.block_seconds == pytest.approx(0.01)
+        assert health.max_callback_seconds > 0
+        assert health.degraded
+
+    def test_clean_capture(self) -> None:
+        recorder = AudioRecorder(
+            sample_rate=1000, source=SimulatedSource(blocksize=20, buffer_blocks=50)
+        )
+        recorder.start()
+        _wait_for(lambda: recorder.read().size >= 100)
+        recorder.stop()
+
+        assert recorder.last_capture.callbacks >= 5
+        assert not recorder.last_capture.degraded
+
+    def test_counts_reset_per_recording(self) -> None:
+        # Always-on, so block indices run on across recordings and only the first drops
+        source = SimulatedSource(blocksize=10, buffer_blocks=50, drop_blocks=[2])
+        recorder = AudioRecorder(
+            sample_rate=1000, source=source, always_on=True, preroll_seconds=0.0
+        )
+        recorder.open()
+        recorder.start()
+        _wait_for(lambda: recorder.read().size >= 30)
+        recorder.stop()
+        assert recorder.last_capture.overflows == 1
+
+        recorder.start()
+        _wait_for(lambda: recorder.read().size >= 30)
+        recorder.stop()
+        recorder.close()
+
+        assert recorder.last_capture.overflows == 0
+        assert recorder.last_capture.gaps == 0
+        assert recorder.last_capture.callbacks >= 3
+
+    def test_starved_audio_thread_is_detected(self) -> None:
+        source = SimulatedSource(blocksize=10, buffer_blocks=4)
+        recorder = AudioRecorder(sample_rate=1000, source=source, always_on=True)
+        recorder.open()
+        recorder.start()
+        time.sleep(0.05)
+        # Hold the callback up for 20 blocks, like a busy thread hogging the GIL
+        with recorder._capture_lock:
+            time.sleep(0.2)
+        time.sleep(0.05)
+        recorder.stop()
+        recorder.close()
+
+        health = recorder.last_capture
+        assert health.overflows >= 1
+        assert health.gaps >= 1
+        assert health.max_interval_seconds >= 0.15
+        assert health.degraded
+
+
+class TestNativeRateCapture:
+    """Simulated 48 kHz stereo device, recorded as 16 kHz mono."""
+
+    @pytest.fixture
+    def source(self) -> SimulatedSource:
+        t = np.arange(48000) / 48000
+        # 1 kHz tone split across the two channels
+        stereo = np.stack([np.sin(2 * np.pi * 1000 * t), np.zeros_like(t)], axis=1)
+        return SimulatedSource(
+            signal=stereo.astype(np.float32), blocksize=480, native_rate=48000, channels=2
+        )
+
+    @pytest.mark.parametrize("always_on", [False, True])
+    def test_downmixes_and_resamples(self, source: SimulatedSource, always_on: bool) -> None:
+        # No pre-roll, so every stored sample comes from a callback counted for this recording
+        recorder = AudioRecorder(
+            sample_rate=16000,
+            source=source,
+            always_on=always_on,
+            native_rate=True,
+            preroll_seconds=0.0,
+        )
+        recorder.start()
+        time.sleep(0.2)
+        audio = recorder.stop()
+        recorder.close()
+
+        assert len(audio) >= 1600
+        # One third of the device frames, give or take the resampler's filter delay
+        assert abs(len(audio) - recorder.last_capture.callbacks * 160) <= 10
+        spectrum = np.abs(np.fft.rfft(audio[-1600:]))
+        assert np.argmax(spectrum) * 16000 / 1600 == pytest.approx(1000)
+        assert np.abs(audio[-1600:]).max() == pytest.approx(0.5, abs=0.01)
+        # Block timing is in device frames: 480 at 48 kHz
+        assert recorder.last_capture.block_seconds == pytest.approx(0.01)
+
+    def test_per_start_output_length_is_exact(self, source: SimulatedSource) -> None:
+        recorder = AudioRecorder(sample_rate=16000, source=source, native_rate=True)
+        recorder.start()
+        time.sleep(0.1)
+        audio = recorder.stop()
+
+        assert len(audio) == recorder.last_capture.callbacks * 160
+
+    def test_off_by_default(self, source: SimulatedSource) -> None:
+        recorder = AudioRecorder(sample_rate=16000, source=source)
+        recorder.start()
+        _wait_for(lambda: recorder.read().size >= 960)
+        audio = recorder.stop()
+
+        # Opened at 16 kHz mono: each 480-frame block is stored as-is, not resampled
+        assert recorder._resampler is None
+        assert len(audio) == recorder.last_capture.callbacks * 480
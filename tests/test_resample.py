@@ -0,0 +1,95 @@
+"""Tests for the streaming polyphase resampler."""
+
+from __future__ import annotations
+
+from math import gcd
+
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+from dictate.audio.resample import Resampler, downmix, resample
+
+
+def _noise(frames: int) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-0.5, 0.5, frames).astype(np.float32)
+
+
+class TestResampler:
+    @pytest.mark.parametrize("rate", [44100, 48000, 96000, 22050, 8000])
+    def test_matches_scipy(self, rate: int) -> None:
+        audio = _noise(rate + 123)
+        divisor = gcd(rate, 16000)
+        expected = resample_poly(audio, 16000 // divisor, rate // divisor)
+
+        result = resample(audio, rate, 16000)
+
+        assert len(result) == len(expected)
+        np.testing.assert_allclose(result, expected, atol=1e-6)
+
+    @pytest.mark.parametrize("rate", [44100, 48000])
+    def test_blocks_of_any_size_match_whole_signal(self, rate: int) -> None:
+        audio = _noise(rate // 2)
+        resampler = Resampler(rate, 16000)
+        sizes = np.random.default_rng(1).integers(1, 3000, len(audio))
+        parts = []
+        position = 0
+        for size in sizes:
+            parts.append(resampler.process(audio[position:position + size]))
+            position += size
+            if position >= len(audio):
+                break
+        parts.append(resampler.flush())
+
+        np.testing.assert_allclose(np.concatenate(parts), resample(audio, rate, 16000), atol=1e-6)
+
+    def test_keeps_a_tone_and_removes_aliases(self) -> None:
+        t = np.arange(48000) / 48000
+        tone = np.sin(2 * np.pi * 1000 * t)
+        # 11 kHz is above the 8 kHz output Nyquist and would alias to 5 kHz
+        audio = (tone + np.sin(2 * np.pi * 11000 * t)).astype(np.float32)
+
+        result = resample(audio, 48000, 16000)
+
+        expected = np.sin(2 * np.pi * 1000 * np.arange(16000) / 16000)
+        # Away from the edges, where the filter sees the signal start and end
+        error = result[500:-500] - expected[500:-500]
+        assert np.sqrt(np.mean(error**2)) < 1e-3
+
+    def test_flush_resets(self) -> None:
+        resampler = Resampler(48000, 16000)
+        audio = _noise(4800)
+        first = np.concatenate((resampler.process(audio), resampler.flush()))
+        second = np.concatenate((resampler.process(audio), resampler.flush()))
+
+        np.testing.assert_array_equal(first, second)
+
+    def test_same_rate_passes_through(self) -> None:
+        audio = _noise(1000)
+        resampler = Resampler(16000, 16000)
+
+        np.testing.assert_array_equal(resampler.process(audio), audio)
+        assert resampler.flush().size == 0
+
+    def test_empty_input(self) -> None:
+        assert resample(np.zeros(0, dtype=np.float32), 48000, 16000).size == 0
+
+    def test_downmixes_channels(self) -> None:
+        resampler = Resampler(16000, 16000)
+        block = np.array([[1.0, 0.0], [0.5, 0.5]], dtype=np.float32)
+
+        np.testing.assert_array_equal(resampler.process(block), [0.5, 0.5])
+
+    def test_invalid_rate(self) -> None:
+        with pytest.raises(ValueError, match="Sample rates"):
+            Resampler(0, 16000)
+
+
+class TestDownmix:
+    def test_averages_channels(self) -> None:
+        block = np.array([[1.0, -1.0], [0.5, 0.25]], dtype=np.float32)
+        np.testing.assert_array_equal(downmix(block), [0.0, 0.375])
+
+    def test_mono_is_a_view(self) -> None:
+        block = np.zeros((10, 1), dtype=np.float32)
+        assert np.shares_memory(downmix(block), block)
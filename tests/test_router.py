@@ -0,0 +1,143 @@
+"""Tests for the model-routing ASR engine (engines faked — no model download)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dictate.asr.base import ModelState, ModelStatus
+from dictate.asr.router import ModelProfile, RoutingEngine
+from dictate.metrics import UtteranceMetrics
+
+# Load, fixed decode, decode per audio second, memory
+_PROFILES = {
+    "tiny": ModelProfile(0.5, 0.1, 0.01, 100),
+    "base": ModelProfile(1.0, 0.3, 0.03, 200),
+    "small": ModelProfile(2.0, 0.8, 0.08, 500),
+}
+
+
+class _FakeEngine:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.status = ModelStatus()
+        self.decoded = 0
+
+    def preload(self) -> None:
+        self.ensure_loaded()
+
+    def ensure_loaded(self) -> None:
+        self.status = ModelStatus(state=ModelState.READY, load_seconds=0.0)
+
+    def unload(self) -> bool:
+        self.status = ModelStatus(state=ModelState.UNLOADED)
+        return True
+
+    def transcribe_segments(self, audio: np.ndarray, sample_rate: int = 16000):
+        self.ensure_loaded()
+        self.decoded += 1
+        yield self.name
+
+    def start_stream(self, sample_rate: int = 16000):
+        return self.name
+
+
+def _audio(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * 16000), dtype=np.float32)
+
+
+def _router(**kwargs) -> tuple[RoutingEngine, dict[str, _FakeEngine]]:
+    engines = {name: _FakeEngine(name) for name in _PROFILES}
+    kwargs.setdefault("profiles", _PROFILES)
+    return RoutingEngine(list(engines.items()), **kwargs), engines
+
+
+def _load_all(engines: dict[str, _FakeEngine]) -> None:
+    for engine in engines.values():
+        engine.ensure_loaded()
+
+
+class TestRoutingEngine:
+    def test_largest_model_within_budget(self) -> None:
+        router, engines = _router(latency_target_seconds=1.0, memory_budget_mb=1000)
+        _load_all(engines)
+        # small: 0.8 + 0.08 * 2 = 0.96s fits; at 10 s it needs 1.6s, base needs 0.6s
+        assert router.choose(2.0) == "small"
+        assert router.choose(10.0) == "base"
+        assert router.choose(60.0) == "tiny"
+
+    def test_fastest_model_when_nothing_fits(self) -> None:
+        router, engines = _router(latency_target_seconds=0.05, memory_budget_mb=1000)
+        _load_all(engines)
+        assert router.choose(2.0) == "tiny"
+
+    def test_unloaded_model_pays_load_time(self) -> None:
+        router, engines = _router(latency_target_seconds=1.0, memory_budget_mb=1000)
+        assert router.choose(2.0) == "tiny"  # base would need 0.36s + 1.0s to load
+        engines["base"].ensure_loaded()
+        assert router.choose(2.0) == "base"
+
+    def test_transcribe_uses_chosen_model(self) -> None:
+        router, engines = _router(latency_target_seconds=1.0, memory_budget_mb=1000)
+        _load_all(engines)
+        assert router.transcribe(_audio(2.0)) == "small"
+        assert router.current_model == "small"
+        assert router.transcribe(np.zeros(0, dtype=np.float32)) == ""
+
+    def test_learns_from_slow_decodes(self) -> None:
+        router, engines = _router(latency_target_seconds=1.0, memory_budget_mb=1000)
+        _load_all(engines)
+        route = router._routes[2]
+        for _ in range(5):
+            route.observe(2.0, 1.5)  # small is slower than its profile on this machine
+        assert router.choose(2.0) == "base"
+
+    def test_pipeline_overhead_shrinks_budget(self) -> None:
+        router, engines = _router(latency_target_seconds=1.0, memory_budget_mb=1000)
+        _load_all(engines)
+        metrics = UtteranceMetrics(audio_seconds=2.0)
+        metrics.stages.update(decode=0.9, model_wait=0.0, total=1.3)
+        router.observe(metrics)
+
+        assert router.decode_budget() == pytest.approx(0.6)
+        assert router.choose(2.0) == "base"
+
+    def test_unfinished_metrics_ignored(self) -> None:
+        router, _engines = _router()
+        router.observe(UtteranceMetrics(audio_seconds=2.0))
+        assert router.decode_budget() == 1.5
+
+    def test_memory_budget_unloads_least_recently_used(self) -> None:
+        router, engines = _router(latency_target_seconds=1.0, memory_budget_mb=550)
+        assert router.transcribe(_audio(2.0)) == "tiny"  # the others are too slow to load
+        engines["small"].ensure_loaded()
+        # small is resident now, but it and tiny don't both fit in 550 MB
+        assert router.transcribe(_audio(2.0)) == "small"
+
+        assert engines["tiny"].status.state is ModelState.UNLOADED
+
+    def test_models_over_memory_budget_excluded(self, caplog: pytest.LogCaptureFixture) -> None:
+        router, engines = _router(memory_budget_mb=250)
+        _load_all(engines)
+        assert router.choose(1.0) in ("tiny", "base")
+        assert "Not routing to 'small'" in caplog.text
+        assert "'base'" not in caplog.text
+        with pytest.raises(ValueError, match="memory budget"):
+            _router(memory_budget_mb=50)
+
+    def test_preload_warms_the_model_the_next_utterance_uses(self) -> None:
+        router, engines = _router(latency_target_seconds=1.0, memory_budget_mb=550)
+        engines["small"].ensure_loaded()
+        assert router.transcribe(_audio(2.0)) == "small"
+        engines["small"].unload()
+        engines["base"].ensure_loaded()
+        # A 2 s utterance now goes to the resident base; preload must not evict it
+        router.preload()
+        router.ensure_loaded()
+
+        assert engines["base"].status.state is ModelState.READY
+        assert router.transcribe(_audio(2.0)) == "base"
+
+    def test_stream_uses_current_model(self) -> None:
+        router, _engines = _router()
+        assert router.start_stream() == "tiny"
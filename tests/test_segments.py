@@ -0,0 +1,96 @@
+"""Tests for sentence-by-sentence overlapped cleanup."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from dictate.processing.regex_processor import RegexProcessor
+from dictate.processing.segments import OverlappedCleanup
+
+
+class _RecordingProcessor:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: list[str] = []
+        self.delay = delay
+
+    def process(self, text: str) -> str:
+        time.sleep(self.delay)
+        self.calls.append(text)
+        return text.upper()
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+class TestOverlappedCleanup:
+    def test_submits_whole_sentences(self, executor: ThreadPoolExecutor) -> None:
+        processor = _RecordingProcessor()
+        cleanup = OverlappedCleanup(processor, executor)
+
+        for segment in (" so I went home", "and slept.", 'He said "done."', " ", "then we"):
+            cleanup.add(segment)
+        assert cleanup.submitted == 2
+
+        result = cleanup.finish()
+
+        assert processor.calls == ["so I went home and slept.", 'He said "done."', "then we"]
+        assert result == 'SO I WENT HOME AND SLEPT. HE SAID "DONE." THEN WE'
+
+    def test_cleanup_runs_while_segments_arrive(self, executor: ThreadPoolExecutor) -> None:
+        processor = _RecordingProcessor()
+        cleanup = OverlappedCleanup(processor, executor)
+
+        cleanup.add("First sentence.")
+        deadline = time.monotonic() + 2
+        while not processor.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert processor.calls == ["First sentence."]
+        assert cleanup.finish() == "FIRST SENTENCE."
+
+    def test_keeps_order_with_parallel_workers(self) -> None:
+        processor = MagicMock()
+
+        def process(text: str) -> str:
+            time.sleep(0.2 if text == "one." else 0)  # first sentence finishes last
+            return text
+
+        processor.process.side_effect = process
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cleanup = OverlappedCleanup(processor, executor)
+            cleanup.add("one.")
+            cleanup.add("two.")
+
+            assert cleanup.finish() == "one. two."
+
+    def test_matches_whole_text_cleanup(self, executor: ThreadPoolExecutor) -> None:
+        segments = ["um I went home and", "then I slept.", "uh next day it", "rained you know"]
+        processor = RegexProcessor()
+        cleanup = OverlappedCleanup(processor, executor)
+
+        for segment in segments:
+            cleanup.add(segment)
+
+        assert cleanup.finish() == processor.process(" ".join(segments))
+
+    def test_busy_seconds(self, executor: ThreadPoolExecutor) -> None:
+        cleanup = OverlappedCleanup(_RecordingProcessor(delay=0.05), executor)
+        cleanup.add("a.")
+        cleanup.add("b")
+        cleanup.finish()
+
+        assert cleanup.busy_seconds >= 0.1
+
+    def test_empty(self, executor: ThreadPoolExecutor) -> None:
+        processor = _RecordingProcessor()
+
+        assert OverlappedCleanup(processor, executor).finish() == ""
+        assert processor.calls == []
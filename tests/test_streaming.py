@@ -0,0 +1,127 @@
+"""Tests for windowed incremental transcription."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dictate.asr.base import PartialTranscript
+from dictate.asr.streaming import (
+    WindowedTranscriptionStream,
+    iter_blocks,
+    transcribe_in_blocks,
+)
+
+
+class FakeDecoder:
+    """Records every decode call and returns a numbered word per call."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, str]] = []
+
+    def __call__(self, audio: np.ndarray, sample_rate: int, prompt: str) -> str:
+        self.calls.append((len(audio), prompt))
+        return f"word{len(self.calls)}"
+
+
+@pytest.fixture
+def decoder() -> FakeDecoder:
+    return FakeDecoder()
+
+
+class TestPartialTranscript:
+    def test_text_joins_stable_and_provisional(self) -> None:
+        assert PartialTranscript("hello", "world").text == "hello world"
+
+    def test_text_skips_empty_parts(self) -> None:
+        assert PartialTranscript("", "world").text == "world"
+        assert PartialTranscript("hello", "").text == "hello"
+
+
+class TestWindowedTranscriptionStream:
+    def test_short_feed_does_not_decode(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=2.0)
+        partial = stream.feed(np.zeros(500, dtype=np.float32))
+
+        assert decoder.calls == []
+        assert partial == PartialTranscript("", "")
+        assert stream.pending_samples == 500
+
+    def test_full_window_is_committed(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=2.0)
+        partial = stream.feed(np.ones(2500, dtype=np.float32))
+
+        assert stream.windows_committed == 1
+        assert partial.stable == "word1"
+        assert stream.pending_samples + decoder.calls[0][0] == 2500
+
+    def test_window_cut_at_quietest_frame(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(
+            decoder, sample_rate=1000, window_seconds=2.0, cut_search_seconds=1.0
+        )
+        audio = np.ones(2000, dtype=np.float32)
+        audio[1500:1520] = 0.0  # silent 20 ms frame inside the search region
+        stream.feed(audio)
+
+        assert decoder.calls[0][0] == 1510
+
+    def test_stable_text_is_passed_as_prompt(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=1.0)
+        stream.feed(np.ones(2500, dtype=np.float32))
+
+        prompts = [prompt for _, prompt in decoder.calls]
+        assert prompts == ["", "word1"]
+
+    def test_finish_decodes_tail(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=1.0)
+        stream.feed(np.ones(1500, dtype=np.float32))
+
+        assert stream.finish() == "word1 word2"
+        assert stream.pending_samples == 0
+
+    def test_finish_without_audio_returns_empty(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000)
+        assert stream.finish() == ""
+        assert decoder.calls == []
+
+    def test_decode_tail_returns_provisional_text(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=5.0)
+        partial = stream.feed(np.ones(1500, dtype=np.float32), decode_tail=True)
+
+        assert partial == PartialTranscript("", "word1")
+        # Provisional decodes are not committed
+        assert stream.windows_committed == 0
+        assert stream.pending_samples == 1500
+
+
+class TestTranscribeInBlocks:
+    def test_feeds_blocks_and_finishes(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=1.0)
+        audio = np.ones(2500, dtype=np.float32)
+
+        text = transcribe_in_blocks(stream, audio, block_frames=1000)
+
+        assert text == "word1 word2 word3"
+        assert sum(length for length, _ in decoder.calls) == 2500
+
+    def test_decodes_memmap_without_loading_it(self, decoder: FakeDecoder, tmp_path) -> None:
+        audio = np.memmap(tmp_path / "audio.f32", dtype=np.float32, mode="w+", shape=(3000,))
+        audio[:] = 0.25
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=1.0)
+
+        text = transcribe_in_blocks(stream, audio, block_frames=1000)
+
+        assert text.startswith("word1 word2 word3")
+        assert sum(length for length, _ in decoder.calls) == 3000
+        assert max(length for length, _ in decoder.calls) <= 1000
+
+
+class TestIterBlocks:
+    def test_yields_each_window_as_committed(self, decoder: FakeDecoder) -> None:
+        stream = WindowedTranscriptionStream(decoder, sample_rate=1000, window_seconds=1.0)
+        audio = np.ones(2500, dtype=np.float32)
+        segments = iter_blocks(stream, audio, block_frames=1000)
+
+        assert next(segments) == "word1"
+        assert len(decoder.calls) == 1  # later windows are not decoded yet
+        assert list(segments) == ["word2", "word3"]
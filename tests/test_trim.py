@@ -0,0 +1,65 @@
+"""Tests for energy-based silence trimming."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from dictate.audio.trim import trim_silence
+
+SR = 16000
+
+
+def _clip(silence_head: float, speech: float, silence_tail: float) -> np.ndarray:
+    """Build a clip of silence / loud noise / silence with the given durations in seconds."""
+    rng = np.random.default_rng(0)
+    head = np.zeros(int(silence_head * SR), dtype=np.float32)
+    voiced = rng.uniform(-0.5, 0.5, int(speech * SR)).astype(np.float32)
+    tail = np.zeros(int(silence_tail * SR), dtype=np.float32)
+    return np.concatenate([head, voiced, tail])
+
+
+class TestTrimSilence:
+    def test_trims_head_and_tail_with_padding(self) -> None:
+        audio = _clip(1.0, 2.0, 1.5)
+        result = trim_silence(audio, SR, padding_ms=200)
+
+        assert result.start == int(0.8 * SR)
+        assert result.end == int(3.2 * SR)
+        assert result.trimmed_samples == len(audio) - int(2.4 * SR)
+        assert not result.is_silent
+
+    def test_result_is_a_view(self) -> None:
+        audio = _clip(1.0, 1.0, 1.0)
+        result = trim_silence(audio, SR)
+        assert np.shares_memory(result.audio, audio)
+
+    def test_nothing_to_trim_returns_original(self) -> None:
+        audio = _clip(0.0, 1.0, 0.0)
+        result = trim_silence(audio, SR)
+
+        assert result.audio is audio
+        assert result.trimmed_samples == 0
+
+    def test_all_silence_is_detected(self) -> None:
+        audio = np.zeros(SR, dtype=np.float32)
+        result = trim_silence(audio, SR)
+
+        assert result.is_silent
+        assert result.audio.size == 0
+        assert result.trimmed_samples == SR
+
+    def test_low_noise_floor_counts_as_silence(self) -> None:
+        noise = np.random.default_rng(1).normal(0, 1e-4, SR).astype(np.float32)  # ~ -80 dBFS
+        assert trim_silence(noise, SR, threshold_db=-50).is_silent
+
+    def test_speech_in_ragged_remainder_is_kept(self) -> None:
+        audio = np.zeros(SR + 7, dtype=np.float32)
+        audio[-7:] = 0.5
+        result = trim_silence(audio, SR, padding_ms=0)
+
+        assert result.end == len(audio)
+        assert not result.is_silent
+
+    def test_empty_audio(self) -> None:
+        result = trim_silence(np.array([], dtype=np.float32), SR)
+        assert result.is_silent
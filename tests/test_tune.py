@@ -0,0 +1,109 @@
+"""Tests for decode-settings tuning (engines faked — no model download)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from dictate.tune import (
+    DecodeSettings,
+    TuneResult,
+    candidate_settings,
+    pick_best,
+    tune,
+    word_error_rate,
+    write_settings,
+)
+
+_REFERENCE = "move the meeting to thursday because the team is out on friday"
+
+
+def _fake_factory(outputs: dict[DecodeSettings, str]) -> MagicMock:
+    def build(settings: DecodeSettings) -> MagicMock:
+        engine = MagicMock()
+        engine.transcribe.return_value = outputs[settings]
+        return engine
+
+    return MagicMock(side_effect=build)
+
+
+class TestWordErrorRate:
+    def test_identical_ignoring_case_and_punctuation(self) -> None:
+        assert word_error_rate("Hello, world.", "hello world") == 0.0
+
+    def test_substitution_insertion_deletion(self) -> None:
+        assert word_error_rate("a b c d", "a x c d") == 0.25
+        assert word_error_rate("a b c d", "a b c d e") == 0.25
+        assert word_error_rate("a b c d", "a c d") == 0.25
+
+    def test_empty_reference(self) -> None:
+        assert word_error_rate("", "") == 0.0
+        assert word_error_rate("", "noise") == 1.0
+
+
+class TestTune:
+    def test_candidates_cover_every_combination(self) -> None:
+        candidates = candidate_settings(["int8", "float32"], [1, 2], [1, 5])
+        assert len(candidates) == 8
+        assert DecodeSettings("float32", 2, 1) in candidates
+
+    def test_most_precise_output_is_default_reference(self) -> None:
+        precise = DecodeSettings("float32", 1, 5)
+        fast = DecodeSettings("int8", 1, 1)
+        factory = _fake_factory({precise: _REFERENCE, fast: _REFERENCE.replace("friday", "fried")})
+
+        results = tune(np.zeros(16000, dtype=np.float32), factory, [fast, precise], repeat=1)
+
+        assert [r.settings for r in results] == [precise, fast]
+        assert results[0].wer == 0.0
+        assert results[1].wer == pytest.approx(1 / 12)
+
+    def test_given_reference_scores_every_candidate(self) -> None:
+        settings = DecodeSettings("int8", 1, 1)
+        factory = _fake_factory({settings: _REFERENCE})
+        results = tune(np.zeros(16000, dtype=np.float32), factory, [settings], "wrong", repeat=2)
+
+        assert factory.call_count == 1
+        assert results[0].wer > 0
+
+    def test_engines_unloaded_after_measuring(self) -> None:
+        settings = DecodeSettings("int8", 1, 1)
+        engine = MagicMock()
+        engine.transcribe.return_value = "text"
+        tune(np.zeros(16000, dtype=np.float32), lambda s: engine, [settings], repeat=1)
+        engine.unload.assert_called_once()
+        assert engine.transcribe.call_count == 2  # warm-up plus one timed decode
+
+
+class TestPickBest:
+    def _result(self, latency: float, wer: float) -> TuneResult:
+        return TuneResult(DecodeSettings("int8", 1, 1), latency, wer, "")
+
+    def test_fastest_within_quality_floor(self) -> None:
+        results = [self._result(0.5, 0.0), self._result(0.1, 0.2), self._result(0.3, 0.04)]
+        assert pick_best(results, max_wer=0.05) is results[2]
+
+    def test_none_when_nothing_is_accurate_enough(self) -> None:
+        assert pick_best([self._result(0.1, 0.2)], max_wer=0.05) is None
+
+
+class TestWriteSettings:
+    def test_updates_existing_and_adds_missing_keys(self, tmp_path: Path) -> None:
+        env = tmp_path / ".env"
+        env.write_text("# Whisper\nWHISPER_MODEL=small\nWHISPER_BEAM_SIZE=3\n")
+
+        write_settings(env, DecodeSettings("int8_float32", 4, 1))
+
+        lines = env.read_text().splitlines()
+        assert lines[:3] == ["# Whisper", "WHISPER_MODEL=small", "WHISPER_BEAM_SIZE=1"]
+        assert "WHISPER_COMPUTE_TYPE=int8_float32" in lines
+        assert "WHISPER_CPU_THREADS=4" in lines
+        assert "WHISPER_DEVICE=cpu" in lines
+
+    def test_creates_missing_file(self, tmp_path: Path) -> None:
+        env = tmp_path / ".env"
+        write_settings(env, DecodeSettings("int8", 2, 3))
+        assert "WHISPER_BEAM_SIZE=3" in env.read_text().splitlines()
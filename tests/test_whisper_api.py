@@ -0,0 +1,168 @@
+"""Tests for the Whisper API engine against a local stand-in transcription endpoint."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+from transcription_api import FakeTranscriptionAPI
+
+from dictate.asr import longform
+from dictate.asr.factory import create_asr_engine
+from dictate.asr.whisper_api import WhisperAPIEngine
+from dictate.config import Config
+
+openai = pytest.importorskip("openai")
+
+SR = 16000
+
+
+def _tone(seconds: float, peak: float) -> np.ndarray:
+    t = np.arange(int(seconds * SR)) / SR
+    return (peak * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _engine(api: FakeTranscriptionAPI, **kwargs: object) -> WhisperAPIEngine:
+    return WhisperAPIEngine(api_key="sk-test", base_url=api.url, **kwargs)
+
+
+class TestWhisperAPIEngine:
+    def test_uploads_flac_losslessly(self, fake_api: FakeTranscriptionAPI) -> None:
+        audio = _tone(2.0, 0.2)
+
+        assert _engine(fake_api).transcribe(audio) == "part 2"
+
+        request = fake_api.requests[0]
+        assert request["path"] == "/v1/audio/transcriptions"
+        assert request["headers"]["Authorization"] == "Bearer sk-test"
+        assert request["fields"]["model"] == b"whisper-1"
+        np.testing.assert_array_equal(request["pcm"], (audio * 32767).astype(np.int16))
+
+    def test_upload_is_smaller_than_wav(self, fake_api: FakeTranscriptionAPI) -> None:
+        audio = _tone(5.0, 0.2)
+
+        _engine(fake_api).transcribe(audio)
+
+        wav_bytes = 44 + 2 * len(audio)
+        assert fake_api.requests[0]["bytes"] < 0.5 * wav_bytes
+
+    def test_upload_streams_while_encoding(self, fake_api: FakeTranscriptionAPI) -> None:
+        _engine(fake_api).transcribe(_tone(3.0, 0.2))
+
+        headers = fake_api.requests[0]["headers"]
+        assert headers["Content-Length"] is None
+        assert headers["Transfer-Encoding"] == "chunked"
+
+    def test_sends_prompt_from_stream(self, fake_api: FakeTranscriptionAPI) -> None:
+        stream = _engine(fake_api, stream_window_seconds=1.0).start_stream(SR)
+        stream.feed(_tone(1.0, 0.1))
+        stream.feed(_tone(1.0, 0.4))
+        stream.finish()
+
+        assert "prompt" not in fake_api.requests[0]["fields"]
+        assert fake_api.requests[1]["fields"]["prompt"] == b"part 1"
+
+    def test_reuses_pooled_connection(self, fake_api: FakeTranscriptionAPI) -> None:
+        engine = _engine(fake_api)
+
+        for _ in range(3):
+            assert engine.transcribe(_tone(0.5, 0.3)) == "part 3"
+
+        assert fake_api.connections == 1
+
+    def test_reconnects_after_server_drops_idle_connection(
+        self, fake_api: FakeTranscriptionAPI
+    ) -> None:
+        fake_api.drop_idle_connections = True
+        engine = _engine(fake_api)
+
+        assert engine.transcribe(_tone(0.5, 0.3)) == "part 3"
+        time.sleep(0.05)
+        assert engine.transcribe(_tone(0.5, 0.3)) == "part 3"
+        assert fake_api.connections == 2
+
+    def test_retries_rate_limits_and_server_errors(self, fake_api: FakeTranscriptionAPI) -> None:
+        fake_api.statuses = [429, 503]
+
+        assert _engine(fake_api, max_retries=2).transcribe(_tone(0.5, 0.3)) == "part 3"
+        assert len(fake_api.requests) == 3
+        # Each retry replays the whole upload, not what was left of the stream
+        assert len({r["bytes"] for r in fake_api.requests}) == 1
+
+    def test_http_error_raises(self, fake_api: FakeTranscriptionAPI) -> None:
+        fake_api.status = 401
+
+        with pytest.raises(openai.AuthenticationError):
+            _engine(fake_api).transcribe(_tone(0.5, 0.3))
+        assert len(fake_api.requests) == 1
+
+    def test_empty_audio_skips_request(self, fake_api: FakeTranscriptionAPI) -> None:
+        assert _engine(fake_api).transcribe(np.array([], dtype=np.float32)) == ""
+        assert fake_api.requests == []
+
+    def test_invalid_base_url(self) -> None:
+        with pytest.raises(ValueError, match="Invalid OpenAI base URL"):
+            WhisperAPIEngine(api_key="sk-test", base_url="ftp://example.com")
+
+    def test_factory_wires_config(self, fake_api: FakeTranscriptionAPI) -> None:
+        config = Config(
+            asr_engine="openai_api",
+            openai_api_key="sk-test",
+            openai_base_url=fake_api.url,
+            api_upload_workers=2,
+        )
+
+        engine = create_asr_engine(config)
+
+        assert isinstance(engine, WhisperAPIEngine)
+        assert engine.transcribe(_tone(0.5, 0.3)) == "part 3"
+
+
+class TestWhisperAPILongForm:
+    @pytest.fixture
+    def long_recording(self, monkeypatch: pytest.MonkeyPatch) -> np.ndarray:
+        """Four 20 s stretches of "speech" at peaks 0.1 to 0.4, one second apart."""
+        pieces, speech = [], []
+        for part in range(1, 5):
+            start = sum(len(p) for p in pieces)
+            pieces.append(_tone(20.0, part / 10))
+            speech.append((start, start + 20 * SR))
+            pieces.append(np.zeros(SR, dtype=np.float32))
+        # Pin the speech regions instead of running VAD on synthetic tones
+        monkeypatch.setattr(longform, "find_speech", lambda audio, sample_rate: speech)
+        return np.concatenate(pieces)
+
+    def test_uploads_chunks_concurrently_in_order(
+        self, fake_api: FakeTranscriptionAPI, long_recording: np.ndarray
+    ) -> None:
+        # Later chunks answer first, so order comes from reassembly, not completion
+        fake_api.delays = {1: 0.4, 2: 0.3, 3: 0.2, 4: 0.1}
+        engine = _engine(fake_api, upload_workers=4, long_form_seconds=60.0)
+
+        start = time.perf_counter()
+        text = engine.transcribe(long_recording)
+        elapsed = time.perf_counter() - start
+
+        assert text == "part 1 part 2 part 3 part 4"
+        assert len(fake_api.requests) == 4
+        assert fake_api.max_active > 1
+        assert elapsed < sum(fake_api.delays.values())
+        assert sum(r["bytes"] for r in fake_api.requests) < 0.5 * 2 * len(long_recording)
+
+    def test_segments_stream_in_order(
+        self, fake_api: FakeTranscriptionAPI, long_recording: np.ndarray
+    ) -> None:
+        engine = _engine(fake_api, upload_workers=2, long_form_seconds=60.0)
+
+        assert list(engine.transcribe_segments(long_recording)) == [
+            "part 1", "part 2", "part 3", "part 4"
+        ]
+
+    def test_single_worker_uploads_whole_recording(
+        self, fake_api: FakeTranscriptionAPI, long_recording: np.ndarray
+    ) -> None:
+        engine = _engine(fake_api, upload_workers=1, long_form_seconds=60.0)
+
+        assert engine.transcribe(long_recording) == "part 4"
+        assert len(fake_api.requests) == 1
@@ -0,0 +1,186 @@
+"""Tests for the local Whisper engine (WhisperModel mocked — no model download)."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from dictate.asr.base import ModelState
+from dictate.asr.whisper_local import WhisperLocalEngine
+
+
+def _segments(*texts: str) -> tuple:
+    return iter(MagicMock(text=text) for text in texts), MagicMock()
+
+
+@pytest.fixture
+def mock_model_cls():
+    with patch("dictate.asr.whisper_local.WhisperModel") as model_cls:
+        model_cls.return_value.transcribe.side_effect = lambda *a, **k: _segments(
+            " hello ", "world"
+        )
+        yield model_cls
+
+
+def _wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _wait_for(engine: WhisperLocalEngine, state: ModelState) -> None:
+    _wait_until(lambda: engine.status.state is state)
+
+
+class TestWhisperLocalEngine:
+    def test_cpu_threads_passed_to_model(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine(cpu_threads=4)
+        engine.ensure_loaded()
+        assert mock_model_cls.call_args.kwargs["cpu_threads"] == 4
+
+    def test_decode_settings_passed_to_model(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine(compute_type="float32", beam_size=5)
+        engine.transcribe(np.ones(16000, dtype=np.float32))
+        assert mock_model_cls.call_args.kwargs["compute_type"] == "float32"
+        assert mock_model_cls.return_value.transcribe.call_args.kwargs["beam_size"] == 5
+
+    def test_model_not_loaded_at_init(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        mock_model_cls.assert_not_called()
+        assert engine.status.state is ModelState.UNLOADED
+
+    def test_transcribe_loads_model_once(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        audio = np.ones(16000, dtype=np.float32)
+
+        assert engine.transcribe(audio) == "hello world"
+        assert engine.transcribe(audio) == "hello world"
+
+        mock_model_cls.assert_called_once()
+        assert engine.status.state is ModelState.READY
+        assert engine.status.load_seconds is not None
+
+    def test_transcribe_segments_yields_lazily(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        segments = engine.transcribe_segments(np.ones(16000, dtype=np.float32))
+
+        assert next(segments) == "hello"
+        assert engine.unload() is False  # model pinned until the segments are consumed
+        assert list(segments) == ["world"]
+        assert engine.unload() is True
+
+    def test_empty_audio_skips_model(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        assert engine.transcribe(np.array([], dtype=np.float32)) == ""
+        mock_model_cls.assert_not_called()
+
+    def test_preload_loads_and_warms_up_in_background(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        engine.preload()
+        _wait_until(lambda: engine.status.warmup_seconds is not None)
+
+        status = engine.status
+        assert status.state is ModelState.READY
+        assert status.load_seconds is not None
+        assert status.warmup_seconds is not None
+
+        warmup_call = mock_model_cls.return_value.transcribe.call_args
+        assert warmup_call.kwargs["vad_filter"] is False
+        assert not warmup_call.args[0].any()  # synthetic silence
+
+    def test_preload_without_warm_up(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        engine.preload(warm_up=False)
+        _wait_for(engine, ModelState.READY)
+
+        assert engine.status.warmup_seconds is None
+        mock_model_cls.return_value.transcribe.assert_not_called()
+
+    def test_failed_load_is_reported_and_retried(self, mock_model_cls: MagicMock) -> None:
+        mock_model_cls.side_effect = [OSError("no such model"), MagicMock()]
+        engine = WhisperLocalEngine()
+
+        engine.preload()
+        _wait_for(engine, ModelState.FAILED)
+        assert engine.status.state is ModelState.FAILED
+        assert "no such model" in engine.status.error
+
+        mock_model_cls.return_value.transcribe.side_effect = None
+        engine._ensure_model_loaded()
+        assert engine.status.state is ModelState.READY
+        assert engine.status.error == ""
+
+    def test_unload_releases_model_and_reloads_on_use(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        audio = np.ones(16000, dtype=np.float32)
+        engine.transcribe(audio)
+        model = mock_model_cls.return_value
+
+        assert engine.unload() is True
+        model.model.unload_model.assert_called_once()
+        assert engine.status.state is ModelState.UNLOADED
+
+        assert engine.transcribe(audio) == "hello world"
+        assert mock_model_cls.call_count == 2
+
+    def test_unload_without_model_is_noop(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        assert engine.unload() is False
+
+    def test_unload_skipped_while_decoding(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine()
+        unload_results: list[bool] = []
+
+        def transcribe_and_try_unload(*args: object, **kwargs: object) -> tuple:
+            unload_results.append(engine.unload())
+            return _segments("hello")
+
+        mock_model_cls.return_value.transcribe.side_effect = transcribe_and_try_unload
+        assert engine.transcribe(np.ones(16000, dtype=np.float32)) == "hello"
+        assert unload_results == [False]
+        assert engine.status.state is ModelState.READY
+
+    def test_idle_timeout_unloads_model(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine(idle_unload_seconds=0.05)
+        engine.transcribe(np.ones(16000, dtype=np.float32))
+
+        _wait_for(engine, ModelState.UNLOADED)
+        assert engine.status.state is ModelState.UNLOADED
+
+    def test_preload_restarts_idle_countdown(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine(idle_unload_seconds=0.2)
+        engine.transcribe(np.ones(16000, dtype=np.float32))
+
+        for _ in range(4):
+            time.sleep(0.1)
+            engine.preload()
+        assert engine.status.state is ModelState.READY
+
+
+class TestWhisperLocalLongForm:
+    def test_workers_share_one_model(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine(parallel_workers=4)
+        engine.ensure_loaded()
+        mock_model_cls.assert_called_once()
+        assert mock_model_cls.call_args.kwargs["num_workers"] == 4
+        assert mock_model_cls.call_args.kwargs["cpu_threads"] >= 1
+
+    def test_long_recording_decoded_in_chunks(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine(parallel_workers=2, long_form_seconds=60)
+        # Two 25 s stretches of speech fit in one chunk each
+        speech = [(0, 25 * 16000), (26 * 16000, 51 * 16000), (52 * 16000, 77 * 16000)]
+        with patch("dictate.asr.longform.find_speech", return_value=speech):
+            text = engine.transcribe(np.ones(80 * 16000, dtype=np.float32))
+
+        assert mock_model_cls.return_value.transcribe.call_count == 3
+        # Cuts fall in silence, so each chunk's "hello world" is kept
+        assert text == "hello world hello world hello world"
+
+    def test_short_recording_decoded_whole(self, mock_model_cls: MagicMock) -> None:
+        engine = WhisperLocalEngine(parallel_workers=2, long_form_seconds=60)
+        with patch("dictate.asr.longform.find_speech") as find_speech:
+            assert engine.transcribe(np.ones(30 * 16000, dtype=np.float32)) == "hello world"
+        find_speech.assert_not_called()
@@ -0,0 +1,124 @@
+"""A local stand-in for the OpenAI transcription endpoint."""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+
+class FakeTranscriptionAPI(ThreadingHTTPServer):
+    """Serves /v1/audio/transcriptions, answering from the uploaded audio's peak level.
+
+    A clip peaking at 0.3 is transcribed as "part 3", so tests can tell chunks apart.
+    Records bytes received, latency and concurrency per request.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _TranscriptionHandler)
+        self.status = 200
+        # Statuses for the next requests, before falling back to ``status``
+        self.statuses: list[int] = []
+        self.delay = 0.0
+        # Per-part delays, e.g. to make later chunks finish first
+        self.delays: dict[int, float] = {}
+        self.drop_idle_connections = False
+        self.connections = 0
+        self.requests: list[dict] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _TranscriptionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeTranscriptionAPI
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        start = time.perf_counter()
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            body = self._read_body()
+            fields = _parse_multipart(body, self.headers["Content-Type"])
+            pcm = _decode_flac(fields["file"])
+            part = round(float(np.abs(pcm).max()) / 32767 * 10)
+            time.sleep(self.server.delays.get(part, self.server.delay))
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+        self.server.requests.append(
+            {
+                "path": self.path,
+                "headers": self.headers,
+                "fields": fields,
+                "pcm": pcm,
+                "bytes": len(body),
+                "seconds": time.perf_counter() - start,
+            }
+        )
+        status = self.server.statuses.pop(0) if self.server.statuses else self.server.status
+        if status != 200:
+            payload = b'{"error": {"message": "request failed"}}'
+            self.send_response(status)
+            # Keeps the client's retry backoff short
+            self.send_header("retry-after-ms", "1")
+        else:
+            payload = json.dumps({"text": f" part {part} "}).encode()
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        # Like a server whose idle timeout fired: hang up without saying so
+        self.close_connection = self.server.drop_idle_connections
+
+    def _read_body(self) -> bytes:
+        if self.headers["Content-Length"] is not None:
+            return self.rfile.read(int(self.headers["Content-Length"]))
+        pieces = []
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return b"".join(pieces)
+            pieces.append(self.rfile.read(size))
+            self.rfile.readline()
+
+
+def _parse_multipart(body: bytes, content_type: str) -> dict[str, bytes]:
+    boundary = content_type.split("boundary=")[1].encode()
+    fields = {}
+    for part in body.split(b"--" + boundary)[1:-1]:
+        head, _, data = part.partition(b"\r\n\r\n")
+        name = re.search(rb'name="([^"]+)"', head).group(1).decode()
+        fields[name] = data[:-2]  # drop the CRLF before the next boundary
+    return fields
+
+
+def _decode_flac(data: bytes) -> np.ndarray:
+    import av
+
+    with av.open(io.BytesIO(data)) as container:
+        return np.concatenate(
+            [frame.to_ndarray().reshape(-1) for frame in container.decode(audio=0)]
+        )